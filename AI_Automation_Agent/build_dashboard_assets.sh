@@ -0,0 +1,47 @@
+#!/bin/bash
+# =============================================================================
+# BUILD DASHBOARD ASSETS - AI AUTOMATION AGENT
+# Compiles a purged, minified Tailwind stylesheet and vendors Alpine.js and
+# Font Awesome into static/ so the dashboard loads everything from one origin
+# =============================================================================
+
+set -e
+
+# Colors for output
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+BLUE='\033[0;34m'
+NC='\033[0m' # No Color
+
+ALPINE_VERSION="3.13.5"
+FONTAWESOME_VERSION="6.0.0"
+FONTAWESOME_CDN="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/${FONTAWESOME_VERSION}"
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+cd "$SCRIPT_DIR"
+
+if ! command -v npx &> /dev/null; then
+    echo -e "${RED}[ERROR]${NC} npx not found - install Node.js first"
+    exit 1
+fi
+
+mkdir -p static/css static/vendor
+
+echo -e "${BLUE}[INFO]${NC} Building static/css/dashboard.css..."
+npx tailwindcss@3 -c tailwind.config.js -i tailwind.input.css -o static/css/dashboard.css --minify
+
+echo -e "${BLUE}[INFO]${NC} Vendoring Alpine.js ${ALPINE_VERSION}..."
+curl -fsSL "https://unpkg.com/alpinejs@${ALPINE_VERSION}/dist/cdn.min.js" \
+    -o "static/vendor/alpinejs-${ALPINE_VERSION}.min.js"
+
+echo -e "${BLUE}[INFO]${NC} Vendoring Font Awesome ${FONTAWESOME_VERSION}..."
+FA_DIR="static/vendor/fontawesome-${FONTAWESOME_VERSION}"
+mkdir -p "$FA_DIR/css" "$FA_DIR/webfonts"
+curl -fsSL "${FONTAWESOME_CDN}/css/all.min.css" -o "$FA_DIR/css/all.min.css"
+for font in fa-brands-400 fa-regular-400 fa-solid-900 fa-v4compatibility; do
+    for ext in woff2 ttf; do
+        curl -fsSL "${FONTAWESOME_CDN}/webfonts/${font}.${ext}" -o "$FA_DIR/webfonts/${font}.${ext}"
+    done
+done
+
+echo -e "${GREEN}[SUCCESS]${NC} Dashboard assets built. Restart the app to serve them instead of the CDNs."
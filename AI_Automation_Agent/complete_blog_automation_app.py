@@ -3,22 +3,34 @@ AI Automation Agent - Complete Blog Publishing Application
 With blog visibility, editing functionality, and VPS monitoring
 """
 import os
+import re
+import gzip
 import json
 import time
+import hashlib
 import psutil
 import asyncio
+import contextlib
 import sqlite3
 import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 import uvicorn
 from loguru import logger
 
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
 # =============================================================================
 # CONFIGURATION AND SETUP
 # =============================================================================
@@ -51,17 +63,59 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large responses (blog lists carry full markdown bodies)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # =============================================================================
 # DATABASE AND STORAGE SETUP
 # =============================================================================
 
 PROJECT_ROOT = Path(__file__).parent
+STATIC_DIR = PROJECT_ROOT / "static"
 BLOGS_FILE = PROJECT_ROOT / "blogs.json"
 DATABASE_FILE = PROJECT_ROOT / "ai_automation.db"
+# System logs live in their own file so log writes don't contend with blog writes
+LOG_DATABASE_FILE = PROJECT_ROOT / "logs.db"
+
+# Static assets (prebuilt dashboard stylesheet and vendored libraries)
+STATIC_DIR.mkdir(exist_ok=True)
+app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
+
+@app.middleware("http")
+async def cache_vendored_assets(request: Request, call_next):
+    """Vendored files carry their version in the path, so they never change"""
+    response = await call_next(request)
+    if request.url.path.startswith("/static/vendor/"):
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    return response
+
+# SQL statements shared by the storage helpers. Reusing the exact same string
+# objects keeps hits in sqlite3's per-connection statement cache.
+SQL_SELECT_BLOGS = 'SELECT * FROM blogs ORDER BY created_at DESC'
+SQL_DELETE_ALL_BLOGS = 'DELETE FROM blogs'
+SQL_UPSERT_BLOG = '''
+    INSERT OR REPLACE INTO blogs (
+        id, title, content, created_at, status, platforms, 
+        ai_generated, nextjs_posted, nextjs_id, nextjs_url
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+SQL_INSERT_BLOG = '''
+    INSERT INTO blogs (
+        title, content, created_at, status, platforms, 
+        ai_generated, nextjs_posted, nextjs_id, nextjs_url
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+SQL_INSERT_LOG = 'INSERT INTO system_logs (event_type, message, details) VALUES (?, ?, ?)'
+SQL_SELECT_RECENT_LOGS = 'SELECT * FROM system_logs ORDER BY timestamp DESC LIMIT ?'
+
+def _connect(db_file: Path) -> sqlite3.Connection:
+    """Open a SQLite connection with a larger prepared-statement cache"""
+    return sqlite3.connect(db_file, cached_statements=256)
 
 def init_database():
-    """Initialize SQLite database"""
-    conn = sqlite3.connect(DATABASE_FILE)
+    """Initialize SQLite databases (blogs and system logs)"""
+    conn = _connect(DATABASE_FILE)
+    conn.execute('PRAGMA journal_mode=WAL')
     cursor = conn.cursor()
     
     # Create blogs table
@@ -80,6 +134,13 @@ def init_database():
         )
     ''')
     
+    conn.commit()
+    conn.close()
+    
+    conn = _connect(LOG_DATABASE_FILE)
+    conn.execute('PRAGMA journal_mode=WAL')
+    cursor = conn.cursor()
+    
     # Create system_logs table
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS system_logs (
@@ -91,7 +152,31 @@ def init_database():
         )
     ''')
     
+    # Index for the dashboard's "latest N logs" query
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_system_logs_ts ON system_logs(timestamp DESC)
+    ''')
+    
     conn.commit()
+    
+    # One-time move of the logs written before they had their own file
+    cursor.execute('SELECT 1 FROM system_logs LIMIT 1')
+    if cursor.fetchone() is None:
+        cursor.execute('ATTACH DATABASE ? AS old_db', (str(DATABASE_FILE),))
+        cursor.execute(
+            "SELECT 1 FROM old_db.sqlite_master WHERE type = 'table' AND name = 'system_logs'"
+        )
+        if cursor.fetchone() is not None:
+            with conn:
+                cursor.execute('''
+                    INSERT INTO main.system_logs (id, timestamp, event_type, message, details)
+                    SELECT id, timestamp, event_type, message, details FROM old_db.system_logs
+                ''')
+                moved = cursor.rowcount
+                cursor.execute('DROP TABLE old_db.system_logs')
+            logger.info(f"Moved {moved} system log rows from {DATABASE_FILE.name} to {LOG_DATABASE_FILE.name}")
+        cursor.execute('DETACH DATABASE old_db')
+    
     conn.close()
 
 def load_blogs():
@@ -105,9 +190,9 @@ def load_blogs():
     
     # Fallback to SQLite
     try:
-        conn = sqlite3.connect(DATABASE_FILE)
+        conn = _connect(DATABASE_FILE)
         cursor = conn.cursor()
-        cursor.execute('SELECT * FROM blogs ORDER BY created_at DESC')
+        cursor.execute(SQL_SELECT_BLOGS)
         rows = cursor.fetchall()
         conn.close()
         
@@ -141,20 +226,16 @@ def save_blogs(blogs):
     
     # Save to SQLite
     try:
-        conn = sqlite3.connect(DATABASE_FILE)
+        conn = _connect(DATABASE_FILE)
         cursor = conn.cursor()
         
         # Clear existing blogs
-        cursor.execute('DELETE FROM blogs')
+        cursor.execute(SQL_DELETE_ALL_BLOGS)
         
-        # Insert blogs
+        # Insert blogs, keeping their ids stable across rewrites
         for blog in blogs:
-            cursor.execute('''
-                INSERT INTO blogs (
-                    title, content, created_at, status, platforms, 
-                    ai_generated, nextjs_posted, nextjs_id, nextjs_url
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
+            cursor.execute(SQL_UPSERT_BLOG, (
+                blog.get('id'),
                 blog.get('title', ''),
                 blog.get('content', ''),
                 blog.get('created_at', datetime.now().isoformat()),
@@ -171,20 +252,112 @@ def save_blogs(blogs):
     except Exception as e:
         logger.error(f"Error saving SQLite blogs: {e}")
 
-def log_event(event_type: str, message: str, details: str = ""):
-    """Log system events to database"""
+def insert_blog(blog: Dict) -> int:
+    """Insert a single blog into SQLite and return its AUTOINCREMENT id"""
+    conn = _connect(DATABASE_FILE)
     try:
-        conn = sqlite3.connect(DATABASE_FILE)
         cursor = conn.cursor()
-        cursor.execute(
-            'INSERT INTO system_logs (event_type, message, details) VALUES (?, ?, ?)',
-            (event_type, message, details)
-        )
+        cursor.execute(SQL_INSERT_BLOG, (
+            blog.get('title', ''),
+            blog.get('content', ''),
+            blog.get('created_at', datetime.now().isoformat()),
+            blog.get('status', 'draft'),
+            json.dumps(blog.get('platforms', [])),
+            blog.get('ai_generated', True),
+            blog.get('nextjs_posted', False),
+            blog.get('nextjs_id'),
+            blog.get('nextjs_url')
+        ))
         conn.commit()
+        return cursor.lastrowid
+    finally:
+        conn.close()
+
+def add_view_fields(blog: Dict) -> Dict:
+    """Precompute the excerpt and display date shown on dashboard blog cards"""
+    content = blog.get('content', '')
+    blog['excerpt'] = content[:150] + '...' if len(content) > 150 else content
+    try:
+        created = datetime.fromisoformat(blog.get('created_at') or '')
+        blog['created_at_display'] = f"{created.month}/{created.day}/{created.year}"
+    except ValueError:
+        blog['created_at_display'] = ''
+    return blog
+
+# Background log writer: events are queued and flushed in batches
+LOG_BATCH_SIZE = 100
+LOG_FLUSH_INTERVAL = 0.2  # seconds
+_log_queue: Optional[asyncio.Queue] = None
+_log_worker_task: Optional[asyncio.Task] = None
+
+def _write_log_rows(rows: List[tuple]):
+    """Persist a batch of log rows in a single transaction"""
+    try:
+        conn = _connect(LOG_DATABASE_FILE)
+        with conn:
+            conn.executemany(SQL_INSERT_LOG, rows)
         conn.close()
     except Exception as e:
         logger.error(f"Error logging event: {e}")
 
+def log_event(event_type: str, message: str, details: str = ""):
+    """Log system events to database (queued when the log worker is running)"""
+    if _log_queue is None:
+        _write_log_rows([(event_type, message, details)])
+        return
+    _log_queue.put_nowait((event_type, message, details))
+
+async def _log_worker():
+    """Drain the log queue, flushing up to LOG_BATCH_SIZE rows per LOG_FLUSH_INTERVAL"""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await _log_queue.get()]
+        deadline = loop.time() + LOG_FLUSH_INTERVAL
+        try:
+            while len(batch) < LOG_BATCH_SIZE:
+                if not _log_queue.empty():
+                    batch.append(_log_queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                # asyncio.wait rather than wait_for, which can swallow a cancel that
+                # races with the get completing and leave shutdown waiting forever
+                getter = asyncio.ensure_future(_log_queue.get())
+                try:
+                    await asyncio.wait((getter,), timeout=timeout)
+                finally:
+                    if getter.done():
+                        batch.append(getter.result())
+                    else:
+                        getter.cancel()
+        finally:
+            # SQLite writes block, so they run off the event loop
+            await asyncio.to_thread(_write_log_rows, batch)
+
+@app.on_event("startup")
+async def start_log_worker():
+    global _log_queue, _log_worker_task
+    _log_queue = asyncio.Queue()
+    _log_worker_task = asyncio.create_task(_log_worker())
+
+@app.on_event("shutdown")
+async def stop_log_worker():
+    global _log_queue, _log_worker_task
+    if _log_worker_task is not None:
+        _log_worker_task.cancel()
+        # Let the worker finish writing the batch it already took off the queue
+        with contextlib.suppress(asyncio.CancelledError):
+            await _log_worker_task
+    # Flush anything still queued so no events are lost
+    pending = []
+    while _log_queue is not None and not _log_queue.empty():
+        pending.append(_log_queue.get_nowait())
+    _log_queue = None
+    _log_worker_task = None
+    if pending:
+        await asyncio.to_thread(_write_log_rows, pending)
+
 # Initialize database
 init_database()
 
@@ -214,8 +387,8 @@ class NextJSPublisher:
         slug = re.sub(r'[-\s]+', '-', slug)
         return slug.strip('-')
     
-    def _extract_tags(self, content: str, category: str) -> list:
-        """Extract relevant tags from content and category"""
+    def _extract_tags(self, content_lower: str, category: str) -> list:
+        """Extract relevant tags from already-lowercased content and category"""
         tags = [category.lower()]
         
         # Common tech keywords
@@ -229,7 +402,6 @@ class NextJSPublisher:
             'technology': ['tech', 'innovation', 'digital', 'software']
         }
         
-        content_lower = content.lower()
         for tag, related_words in keywords.items():
             if any(word in content_lower for word in related_words):
                 tags.append(tag)
@@ -242,14 +414,13 @@ class NextJSPublisher:
         try:
             import requests
             
-            # Extract excerpt from content (first 150 chars)
-            excerpt = content[:150].strip()
-            if len(content) > 150:
-                excerpt += "..."
-            
-            # Calculate read time (assuming 200 words per minute)
+            # Derive excerpt, word count and lowercased text in one place
+            content_lower = content.lower()
             word_count = len(content.split())
-            read_time_minutes = max(1, round(word_count / 200))
+            excerpt = content[:150].strip() + ("..." if len(content) > 150 else "")
+            
+            # Calculate read time (assuming 200 words per minute, rounded up)
+            read_time_minutes = max(1, -(-word_count // 200))
             
             # Format date for celorisdesigns.com
             formatted_date = datetime.now().strftime("%b %d, %Y, %I:%M %p")
@@ -287,7 +458,7 @@ class NextJSPublisher:
                 
                 # SEO and metadata
                 "slug": self._create_slug(title),
-                "tags": self._extract_tags(content, category),
+                "tags": self._extract_tags(content_lower, category),
                 "metadata": {
                     "source": "ai_automation_agent",
                     "version": "2.0",
@@ -430,16 +601,42 @@ class BlogUpdate(BaseModel):
 class ConnectionManager:
     def __init__(self):
         self.active_connections: List[WebSocket] = []
+        # Clients currently wanting system resource frames (hidden tabs opt out)
+        self.resource_subscribers: set = set()
+        # Last resource frame send time per client, for server-side throttling
+        self.resource_last_sent: Dict[WebSocket, float] = {}
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
         self.active_connections.append(websocket)
+        self.resource_subscribers.add(websocket)
 
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        if websocket in self.active_connections:
+            self.active_connections.remove(websocket)
+        self.resource_subscribers.discard(websocket)
+        self.resource_last_sent.pop(websocket, None)
+
+    def set_resource_subscription(self, websocket: WebSocket, on: bool):
+        if on:
+            self.resource_subscribers.add(websocket)
+        else:
+            self.resource_subscribers.discard(websocket)
+
+    async def send_resources(self, websocket: WebSocket, frame: dict, min_interval: float):
+        """Send a resource frame unless this client got one less than min_interval ago"""
+        now = time.monotonic()
+        if now - self.resource_last_sent.get(websocket, 0.0) < min_interval:
+            return
+        self.resource_last_sent[websocket] = now
+        try:
+            await websocket.send_json(frame)
+        except:
+            self.disconnect(websocket)
 
-    async def broadcast(self, message: dict):
-        for connection in self.active_connections:
+    async def broadcast(self, message: dict, connections=None):
+        targets = self.active_connections if connections is None else connections
+        for connection in list(targets):
             try:
                 await connection.send_json(message)
             except:
@@ -448,30 +645,115 @@ class ConnectionManager:
 manager = ConnectionManager()
 
 # =============================================================================
-# AI BLOG GENERATION
+# SYSTEM RESOURCE MONITORING
 # =============================================================================
 
-async def generate_blog_with_ai(topic: str, length: str = "medium") -> Dict:
-    """Generate blog using AI simulation"""
+RESOURCE_PUSH_INTERVAL = 10  # seconds
+RESOURCE_MIN_SEND_INTERVAL = 1  # seconds, per client
+latest_system_resources: Optional[Dict] = None
+# Latest {type, id, ts, data} frame; ids increase so clients can drop stale frames.
+# Seeded from the clock (at most one frame per push interval) so ids keep
+# increasing across server restarts.
+latest_resource_frame: Optional[Dict] = None
+_resource_seq = int(time.time())
+_resource_broadcast_task: Optional[asyncio.Task] = None
+
+def collect_system_resources(cpu_interval: Optional[float] = None) -> Dict:
+    """Sample VPS system resources with psutil"""
+    # CPU usage
+    cpu_percent = psutil.cpu_percent(interval=cpu_interval)
+    cpu_count = psutil.cpu_count()
+    cpu_freq = psutil.cpu_freq()
     
-    try:
-        # Simulate AI generation delay
-        await asyncio.sleep(2)
-        
-        # AI-generated content simulation
-        blog_title = f"AI-Generated: {topic.title()} - Complete Guide 2025"
-        
-        blog_content = f"""# {blog_title}
+    # Memory usage
+    memory = psutil.virtual_memory()
+    
+    # Disk usage
+    disk = psutil.disk_usage('/')
+    
+    # System uptime
+    boot_time = psutil.boot_time()
+    uptime = time.time() - boot_time
+    
+    # Process information
+    process_count = len(psutil.pids())
+    
+    return {
+        "cpu": {
+            "percent": cpu_percent,
+            "count": cpu_count,
+            "frequency": cpu_freq._asdict() if cpu_freq else {}
+        },
+        "memory": {
+            "total": memory.total,
+            "available": memory.available,
+            "percent": memory.percent,
+            "used": memory.used,
+            "free": memory.free
+        },
+        "disk": {
+            "total": disk.total,
+            "used": disk.used,
+            "free": disk.free,
+            "percent": disk.percent
+        },
+        "uptime": {
+            "seconds": uptime,
+            "boot_time": int(boot_time)
+        },
+        "processes": process_count,
+        "timestamp": datetime.now().isoformat()
+    }
+
+async def _broadcast_system_resources():
+    """Sample resources once per interval and push the shared snapshot to all clients"""
+    global latest_system_resources, latest_resource_frame, _resource_seq
+    # Prime psutil so the first non-blocking cpu_percent reading is meaningful
+    psutil.cpu_percent(interval=None)
+    while True:
+        await asyncio.sleep(RESOURCE_PUSH_INTERVAL)
+        if not manager.resource_subscribers:
+            continue
+        try:
+            latest_system_resources = collect_system_resources()
+            _resource_seq += 1
+            latest_resource_frame = {
+                'type': 'system_resources',
+                'id': _resource_seq,
+                'ts': time.time(),
+                'data': latest_system_resources
+            }
+            for connection in list(manager.resource_subscribers):
+                await manager.send_resources(connection, latest_resource_frame, RESOURCE_MIN_SEND_INTERVAL)
+        except Exception as e:
+            logger.error(f"Error broadcasting system resources: {e}")
+
+@app.on_event("startup")
+async def start_resource_broadcaster():
+    global _resource_broadcast_task
+    _resource_broadcast_task = asyncio.create_task(_broadcast_system_resources())
+
+@app.on_event("shutdown")
+async def stop_resource_broadcaster():
+    if _resource_broadcast_task is not None:
+        _resource_broadcast_task.cancel()
+
+# =============================================================================
+# AI BLOG GENERATION
+# =============================================================================
+
+# Blog body template, formatted once per generation
+BLOG_CONTENT_TEMPLATE = """# {title}
 
 ## Introduction
 
-The world of {topic.lower()} is evolving rapidly in 2025. As technology continues to advance, understanding these trends becomes crucial for businesses and individuals alike.
+The world of {topic} is evolving rapidly in 2025. As technology continues to advance, understanding these trends becomes crucial for businesses and individuals alike.
 
 ## Key Trends and Insights
 
 ### 1. Revolutionary Developments
 
-Recent developments in {topic.lower()} have shown remarkable progress. Industry experts are witnessing unprecedented growth and innovation in this field.
+Recent developments in {topic} have shown remarkable progress. Industry experts are witnessing unprecedented growth and innovation in this field.
 
 ### 2. Future Implications
 
@@ -479,7 +761,7 @@ The implications of these changes extend far beyond the current landscape. Organ
 
 ### 3. Best Practices
 
-Here are some essential best practices for working with {topic.lower()}:
+Here are some essential best practices for working with {topic}:
 
 - Stay updated with the latest developments
 - Implement proper security measures
@@ -497,49 +779,66 @@ Successful implementation requires careful planning and execution. Consider thes
 
 ## Conclusion
 
-The future of {topic.lower()} looks promising. By staying informed and adapting to changes, businesses can leverage these developments for competitive advantage.
+The future of {topic} looks promising. By staying informed and adapting to changes, businesses can leverage these developments for competitive advantage.
 
-*This content was generated by AI on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} using the AI Automation Agent.*
+*This content was generated by AI on {generated_at} using the AI Automation Agent.*
 
 ---
 
-**Keywords**: {topic.lower()}, technology, automation, AI, innovation, 2025
+**Keywords**: {topic}, technology, automation, AI, innovation, 2025
 **Category**: Technology & Innovation
 **Reading Time**: 5 minutes"""
+
+# Topic keyword -> celorisdesigns.com category
+CATEGORY_MAPPING = {
+    'ai': 'AI',
+    'artificial intelligence': 'AI',
+    'machine learning': 'AI',
+    'react': 'Web Development',
+    'javascript': 'Web Development',
+    'nextjs': 'Web Development',
+    'next.js': 'Web Development',
+    'web development': 'Web Development',
+    'frontend': 'Web Development',
+    'design': 'Design',
+    'ui': 'Design',
+    'ux': 'Design',
+    'interface': 'Design',
+    'productivity': 'Productivity',
+    'automation': 'Productivity',
+    'efficiency': 'Productivity',
+    'technology': 'Technology',
+    'tech': 'Technology',
+    'development': 'Development',
+    'platform': 'Platform',
+    'innovation': 'Innovation'
+}
+
+# Single-pass matcher over all category keywords
+CATEGORY_KEYWORD_PATTERN = re.compile(
+    r'\b(' + '|'.join(re.escape(k) for k in CATEGORY_MAPPING) + r')\b'
+)
+
+async def generate_blog_with_ai(topic: str, length: str = "medium") -> Dict:
+    """Generate blog using AI simulation"""
+    
+    try:
+        # Simulate AI generation delay
+        await asyncio.sleep(2)
         
-        # Determine category based on topic
-        category_mapping = {
-            'ai': 'AI',
-            'artificial intelligence': 'AI', 
-            'machine learning': 'AI',
-            'react': 'Web Development',
-            'javascript': 'Web Development',
-            'nextjs': 'Web Development',
-            'next.js': 'Web Development',
-            'web development': 'Web Development',
-            'frontend': 'Web Development',
-            'design': 'Design',
-            'ui': 'Design',
-            'ux': 'Design',
-            'interface': 'Design',
-            'productivity': 'Productivity',
-            'automation': 'Productivity',
-            'efficiency': 'Productivity',
-            'technology': 'Technology',
-            'tech': 'Technology',
-            'development': 'Development',
-            'platform': 'Platform',
-            'innovation': 'Innovation'
-        }
-        
-        # Determine best matching category
+        # AI-generated content simulation
         topic_lower = topic.lower()
-        category = "Technology"  # Default
+        blog_title = f"AI-Generated: {topic.title()} - Complete Guide 2025"
         
-        for keyword, cat in category_mapping.items():
-            if keyword in topic_lower:
-                category = cat
-                break
+        blog_content = BLOG_CONTENT_TEMPLATE.format(
+            title=blog_title,
+            topic=topic_lower,
+            generated_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        )
+        
+        # Determine best matching category
+        match = CATEGORY_KEYWORD_PATTERN.search(topic_lower)
+        category = CATEGORY_MAPPING[match.group(1)] if match else "Technology"
         
         # Auto-publish to celorisdesigns.com
         publisher = NextJSPublisher()
@@ -553,7 +852,6 @@ The future of {topic.lower()} looks promising. By staying informed and adapting
         
         # Create blog object
         blog = {
-            'id': len(load_blogs()) + 1,
             'title': blog_title,
             'content': blog_content,
             'created_at': datetime.now().isoformat(),
@@ -565,13 +863,20 @@ The future of {topic.lower()} looks promising. By staying informed and adapting
             'nextjs_url': publish_result.get('url')
         }
         
-        # Save blog
-        blogs = load_blogs()
+        # Save blog; SQLite assigns the canonical id
+        add_view_fields(blog)
+        blog['id'] = insert_blog(blog)
+        # Without blogs.json yet, load_blogs reads SQLite, which already has the new row
+        blogs = [existing for existing in load_blogs() if existing.get('id') != blog['id']]
         blogs.append(blog)
         save_blogs(blogs)
         
         # Log the generation
-        log_event('blog_generated', f'AI generated blog: {blog_title}', json.dumps(blog))
+        log_event('blog_generated', f'AI generated blog: {blog_title}', json.dumps({
+            'id': blog['id'],
+            'category': category,
+            'nextjs_posted': blog['nextjs_posted']
+        }))
         
         # Broadcast to connected clients
         await manager.broadcast({
@@ -600,17 +905,77 @@ The future of {topic.lower()} looks promising. By staying informed and adapting
 # =============================================================================
 
 @app.get("/", response_class=HTMLResponse)
-async def dashboard():
+async def dashboard(request: Request):
     """Main dashboard with blog management and VPS monitoring"""
-    return HTMLResponse(content=get_dashboard_html())
+    if request.headers.get("if-none-match") == DASHBOARD_ETAG:
+        return Response(status_code=304, headers=DASHBOARD_CACHE_HEADERS)
+    
+    # Serve the pre-compressed variant the client accepts
+    accept_encoding = request.headers.get("accept-encoding", "")
+    if DASHBOARD_HTML_BR is not None and "br" in accept_encoding:
+        return Response(
+            content=DASHBOARD_HTML_BR,
+            media_type="text/html",
+            headers={**DASHBOARD_CACHE_HEADERS, "Content-Encoding": "br"}
+        )
+    if "gzip" in accept_encoding:
+        return Response(
+            content=DASHBOARD_HTML_GZIP,
+            media_type="text/html",
+            headers={**DASHBOARD_CACHE_HEADERS, "Content-Encoding": "gzip"}
+        )
+    return Response(content=DASHBOARD_HTML_BYTES, media_type="text/html", headers=DASHBOARD_CACHE_HEADERS)
+
+async def _dispatch_rpc(method: str, params: Dict) -> Dict:
+    """Route a WebSocket RPC call to the same handler as its REST endpoint"""
+    if method == "blog.list":
+        return list_blogs()
+    if method == "blog.generate":
+        return await generate_blog_with_ai(
+            params.get("topic", "technology"),
+            params.get("length", "medium")
+        )
+    if method == "blog.update":
+        return await update_blog(int(params["id"]), BlogUpdate(**params.get("update", {})))
+    if method == "blog.delete":
+        return await delete_blog(int(params["id"]))
+    raise HTTPException(status_code=404, detail=f"Unknown method: {method}")
+
+async def _handle_rpc(websocket: WebSocket, data: Dict):
+    """Answer a {id, method, params} frame with {id, result}"""
+    try:
+        result = await _dispatch_rpc(data["method"], data.get("params") or {})
+    except HTTPException as e:
+        result = {"success": False, "error": e.detail}
+    except Exception as e:
+        logger.error(f"Error handling WebSocket RPC {data.get('method')}: {e}")
+        result = {"success": False, "error": str(e)}
+    try:
+        await websocket.send_json({"id": data.get("id"), "result": result})
+    except Exception:
+        manager.disconnect(websocket)
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     await manager.connect(websocket)
+    # In-flight RPC calls; held here so they are not garbage collected mid-call
+    rpc_tasks = set()
     try:
         while True:
             data = await websocket.receive_json()
-            if data.get("type") == "generate_blog":
+            if "method" in data:
+                # Request/response frame; run concurrently so a slow generate doesn't block other calls
+                task = asyncio.create_task(_handle_rpc(websocket, data))
+                rpc_tasks.add(task)
+                task.add_done_callback(rpc_tasks.discard)
+            elif data.get("type") == "hello":
+                # Reconnecting clients get only the newest snapshot, never a backlog
+                last_id = data.get("last_id") or 0
+                if latest_resource_frame is not None and latest_resource_frame['id'] > last_id:
+                    await manager.send_resources(websocket, latest_resource_frame, RESOURCE_MIN_SEND_INTERVAL)
+            elif data.get("type") == "subscribe" and data.get("topic") == "resources":
+                manager.set_resource_subscription(websocket, bool(data.get("on", True)))
+            elif data.get("type") == "generate_blog":
                 result = await generate_blog_with_ai(
                     topic=data.get("topic", "technology"),
                     length=data.get("length", "medium")
@@ -618,12 +983,24 @@ async def websocket_endpoint(websocket: WebSocket):
                 await websocket.send_json(result)
     except WebSocketDisconnect:
         manager.disconnect(websocket)
+    finally:
+        # Nobody is left to receive the replies
+        for task in rpc_tasks:
+            task.cancel()
+
+def list_blogs() -> Dict:
+    """All blog posts with their dashboard view fields"""
+    blogs = load_blogs()
+    for blog in blogs:
+        # Blogs saved before view fields existed get them filled in lazily
+        if 'excerpt' not in blog:
+            add_view_fields(blog)
+    return {"blogs": blogs, "count": len(blogs)}
 
 @app.get("/api/blog/posts")
 async def get_blogs():
     """Get all blog posts"""
-    blogs = load_blogs()
-    return {"blogs": blogs, "count": len(blogs)}
+    return ORJSONResponse(content=list_blogs())
 
 @app.post("/api/blog/generate")
 async def generate_blog(request: dict):
@@ -641,7 +1018,7 @@ async def get_blog(blog_id: int):
     blog = next((b for b in blogs if b.get('id') == blog_id), None)
     if not blog:
         raise HTTPException(status_code=404, detail="Blog not found")
-    return blog
+    return ORJSONResponse(content=blog)
 
 @app.put("/api/blog/{blog_id}")
 async def update_blog(blog_id: int, update: BlogUpdate):
@@ -664,11 +1041,15 @@ async def update_blog(blog_id: int, update: BlogUpdate):
         blog['platforms'] = update.platforms
     
     blog['updated_at'] = datetime.now().isoformat()
+    add_view_fields(blog)
     blogs[blog_index] = blog
     save_blogs(blogs)
     
     # Log the update
-    log_event('blog_updated', f'Blog updated: {blog["title"]}', json.dumps(blog))
+    log_event('blog_updated', f'Blog updated: {blog["title"]}', json.dumps({
+        'id': blog['id'],
+        'changed': list(update.model_dump(exclude_unset=True).keys())
+    }))
     
     return {"success": True, "blog": blog}
 
@@ -693,49 +1074,15 @@ async def delete_blog(blog_id: int):
 async def system_resources():
     """Get VPS system resources"""
     try:
-        # CPU usage
-        cpu_percent = psutil.cpu_percent(interval=1)
-        cpu_count = psutil.cpu_count()
-        
-        # Memory usage
-        memory = psutil.virtual_memory()
-        
-        # Disk usage
-        disk = psutil.disk_usage('/')
-        
-        # System uptime
-        boot_time = psutil.boot_time()
-        uptime = time.time() - boot_time
-        
-        # Process information
-        process_count = len(psutil.pids())
-        
-        return {
-            "cpu": {
-                "percent": cpu_percent,
-                "count": cpu_count,
-                "frequency": psutil.cpu_freq()._asdict() if psutil.cpu_freq() else {}
-            },
-            "memory": {
-                "total": memory.total,
-                "available": memory.available,
-                "percent": memory.percent,
-                "used": memory.used,
-                "free": memory.free
-            },
-            "disk": {
-                "total": disk.total,
-                "used": disk.used,
-                "free": disk.free,
-                "percent": disk.percent
-            },
-            "uptime": {
-                "seconds": uptime,
-                "formatted": str(datetime.fromtimestamp(boot_time))
-            },
-            "processes": process_count,
-            "timestamp": datetime.now().isoformat()
-        }
+        # Reuse the broadcaster's snapshot while it is current; it stops refreshing
+        # when no client is subscribed, so older ones are sampled afresh
+        frame = latest_resource_frame
+        if frame is not None and time.time() - frame['ts'] < RESOURCE_PUSH_INTERVAL:
+            snapshot = frame['data']
+        else:
+            # The blocking one-second CPU sample runs off the event loop
+            snapshot = await asyncio.to_thread(collect_system_resources, cpu_interval=1)
+        return ORJSONResponse(content=snapshot)
     except Exception as e:
         logger.error(f"Error getting system resources: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -744,12 +1091,9 @@ async def system_resources():
 async def get_system_logs(limit: int = 50):
     """Get recent system logs"""
     try:
-        conn = sqlite3.connect(DATABASE_FILE)
+        conn = _connect(LOG_DATABASE_FILE)
         cursor = conn.cursor()
-        cursor.execute(
-            'SELECT * FROM system_logs ORDER BY timestamp DESC LIMIT ?',
-            (limit,)
-        )
+        cursor.execute(SQL_SELECT_RECENT_LOGS, (limit,))
         rows = cursor.fetchall()
         conn.close()
         
@@ -763,7 +1107,7 @@ async def get_system_logs(limit: int = 50):
                 'details': row[4]
             })
         
-        return {"logs": logs}
+        return ORJSONResponse(content={"logs": logs})
     except Exception as e:
         logger.error(f"Error getting system logs: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -772,9 +1116,7 @@ async def get_system_logs(limit: int = 50):
 # DASHBOARD HTML TEMPLATE
 # =============================================================================
 
-def get_dashboard_html():
-    """Generate the main dashboard HTML"""
-    return """
+DASHBOARD_HTML = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -782,7 +1124,9 @@ def get_dashboard_html():
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>AI Automation Agent Dashboard</title>
     <script src="https://cdn.tailwindcss.com"></script>
-    <script src="https://unpkg.com/alpinejs@3.x.x/dist/cdn.min.js" defer></script>
+    <link rel="preconnect" href="https://unpkg.com" crossorigin>
+    <script defer src="https://unpkg.com/alpinejs@3.13.5/dist/cdn.min.js" crossorigin="anonymous"></script>
+    <link rel="preconnect" href="https://cdnjs.cloudflare.com" crossorigin>
     <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
     <style>
         .loading { animation: spin 1s linear infinite; }
@@ -882,7 +1226,7 @@ def get_dashboard_html():
                             <i class="fas fa-clock text-purple-500 text-2xl"></i>
                         </div>
                         <div class="mt-4">
-                            <p class="text-xs text-gray-500">Since: <span x-text="new Date(systemResources.uptime?.formatted || Date.now()).toLocaleDateString()"></span></p>
+                            <p class="text-xs text-gray-500">Since: <span x-text="new Date(systemResources.uptime?.boot_time ? systemResources.uptime.boot_time * 1000 : Date.now()).toLocaleDateString()"></span></p>
                         </div>
                     </div>
                 </div>
@@ -933,7 +1277,7 @@ def get_dashboard_html():
                 <div class="flex justify-between items-center mb-6">
                     <h2 class="text-2xl font-bold text-gray-900">
                         <i class="fas fa-blog text-purple-600 mr-2"></i>Blog Posts
-                        <span class="text-sm font-normal text-gray-500 ml-2" x-text="`(${blogs.length} posts)`"></span>
+                        <span class="text-sm font-normal text-gray-500 ml-2" x-text="`(${blogIds.length} posts)`"></span>
                     </h2>
                     <button @click="loadBlogs()" 
                             class="bg-purple-600 text-white px-4 py-2 rounded-md hover:bg-purple-700">
@@ -942,7 +1286,7 @@ def get_dashboard_html():
                 </div>
 
                 <div class="grid grid-cols-1 lg:grid-cols-2 xl:grid-cols-3 gap-6">
-                    <template x-for="blog in blogs" :key="blog.id">
+                    <template x-for="blog in visibleBlogs" :key="blog.id">
                         <div class="bg-white rounded-lg shadow-md border hover:shadow-lg transition-shadow">
                             <div class="p-6">
                                 <div class="flex justify-between items-start mb-4">
@@ -952,10 +1296,10 @@ def get_dashboard_html():
                                           x-text="blog.status"></span>
                                 </div>
                                 
-                                <p class="text-gray-600 text-sm mb-4 line-clamp-3" x-text="blog.content.substring(0, 150) + '...'"></p>
+                                <p class="text-gray-600 text-sm mb-4 line-clamp-3" x-text="blog.excerpt"></p>
                                 
                                 <div class="flex items-center justify-between text-sm text-gray-500 mb-4">
-                                    <span x-text="new Date(blog.created_at).toLocaleDateString()"></span>
+                                    <span x-text="blog.created_at_display"></span>
                                     <div class="flex items-center space-x-2">
                                         <span class="flex items-center" 
                                               :class="blog.nextjs_posted ? 'text-green-600' : 'text-red-600'">
@@ -981,8 +1325,16 @@ def get_dashboard_html():
                     </template>
                 </div>
 
+                <!-- Load More -->
+                <div class="text-center mt-6" x-show="blogIds.length > renderWindow">
+                    <button @click="renderWindow += 30" 
+                            class="bg-white border border-gray-300 text-gray-700 px-4 py-2 rounded-md hover:bg-gray-50">
+                        <i class="fas fa-chevron-down mr-2"></i>Load more
+                    </button>
+                </div>
+
                 <!-- Empty State -->
-                <div class="text-center py-12" x-show="blogs.length === 0">
+                <div class="text-center py-12" x-show="blogIds.length === 0">
                     <i class="fas fa-blog text-gray-300 text-6xl mb-4"></i>
                     <h3 class="text-lg font-medium text-gray-900 mb-2">No blog posts yet</h3>
                     <p class="text-gray-500">Generate your first AI-powered blog post to get started.</p>
@@ -1056,13 +1408,79 @@ def get_dashboard_html():
                 </div>
             </div>
         </div>
+
+        <!-- Confirm Dialog -->
+        <div class="fixed inset-0 bg-gray-600 bg-opacity-50 flex items-center justify-center p-4" 
+             x-show="confirmState.open">
+            <div class="bg-white rounded-lg max-w-md w-full p-6">
+                <p class="text-gray-900 mb-6" x-text="confirmState.message"></p>
+                <div class="flex justify-end space-x-3">
+                    <button @click="resolveConfirm(false)" 
+                            class="px-4 py-2 border border-gray-300 rounded-md text-gray-700 hover:bg-gray-50">
+                        Cancel
+                    </button>
+                    <button @click="resolveConfirm(true)" 
+                            class="px-4 py-2 bg-red-600 text-white rounded-md hover:bg-red-700">
+                        Confirm
+                    </button>
+                </div>
+            </div>
+        </div>
+
+        <!-- Toasts -->
+        <div class="fixed bottom-4 right-4 space-y-2 z-50">
+            <template x-for="toast in toasts" :key="toast.id">
+                <div class="px-4 py-3 rounded-md shadow-lg text-white text-sm flex items-center"
+                     :class="toast.type === 'error' ? 'bg-red-600' : 'bg-green-600'">
+                    <i class="fas mr-2" :class="toast.type === 'error' ? 'fa-exclamation-circle' : 'fa-check-circle'"></i>
+                    <span x-text="toast.message"></span>
+                </div>
+            </template>
+        </div>
     </div>
 
     <script>
+        // Map-backed cache for pure single-argument formatters used in x-text bindings
+        function memoize1(fn, keyFn = x => x, maxSize = 64) {
+            const cache = new Map();
+            return (arg) => {
+                const key = keyFn(arg);
+                if (cache.has(key)) return cache.get(key);
+                const value = fn(arg);
+                if (cache.size >= maxSize) cache.delete(cache.keys().next().value);
+                cache.set(key, value);
+                return value;
+            };
+        }
+
+        const formatBytesCached = memoize1((bytes) => {
+            if (bytes === 0) return '0 Bytes';
+            const k = 1024;
+            const sizes = ['Bytes', 'KB', 'MB', 'GB', 'TB'];
+            const i = Math.floor(Math.log(bytes) / Math.log(k));
+            return parseFloat((bytes / Math.pow(k, i)).toFixed(2)) + ' ' + sizes[i];
+        });
+
+        // Minutes are the finest unit shown, so sub-minute changes reuse the cached string
+        const formatUptimeCached = memoize1((seconds) => {
+            const days = Math.floor(seconds / 86400);
+            const hours = Math.floor((seconds % 86400) / 3600);
+            const minutes = Math.floor((seconds % 3600) / 60);
+            
+            if (days > 0) {
+                return `${days}d ${hours}h ${minutes}m`;
+            } else if (hours > 0) {
+                return `${hours}h ${minutes}m`;
+            } else {
+                return `${minutes}m`;
+            }
+        }, seconds => Math.floor(seconds / 60));
+
         function dashboard() {
             return {
                 connectionStatus: 'connecting',
-                blogs: [],
+                blogsById: {},
+                blogIds: [],
                 generating: false,
                 saving: false,
                 showEditModal: false,
@@ -1072,18 +1490,50 @@ def get_dashboard_html():
                     cpu: { percent: 0, count: 0 },
                     memory: { percent: 0, total: 0, used: 0 },
                     disk: { percent: 0, total: 0, used: 0 },
-                    uptime: { seconds: 0, formatted: '' }
+                    uptime: { seconds: 0, boot_time: 0 }
                 },
                 newBlog: {
                     topic: '',
                     length: 'medium'
                 },
+                _pendingResources: null,
+                lastResourceId: 0,
+                _pendingRpc: {},
+                _rpcSeq: 0,
+                toasts: [],
+                _toastSeq: 0,
+                confirmState: { open: false, message: '', resolve: null },
+                renderWindow: 30,
+
+                // Only the first renderWindow blogs are mounted; "Load more" widens the window
+                get visibleBlogs() {
+                    return this.blogIds.slice(0, this.renderWindow).map(id => this.blogsById[id]);
+                },
+
+                // Blogs are stored by id with a separate ordering, so updates touch one entry
+                setBlogs(blogs) {
+                    const byId = {};
+                    for (const blog of blogs) byId[blog.id] = blog;
+                    this.blogsById = byId;
+                    this.blogIds = blogs.map(b => b.id);
+                },
+
+                addBlog(blog) {
+                    if (!(blog.id in this.blogsById)) this.blogIds.unshift(blog.id);
+                    this.blogsById[blog.id] = blog;
+                },
 
                 init() {
                     this.connectWebSocket();
                     this.loadBlogs();
-                    this.loadSystemResources();
-                    setInterval(() => this.loadSystemResources(), 10000); // Update every 10 seconds
+                    this.loadSystemResources(); // Initial snapshot; updates are pushed over the WebSocket
+                    
+                    // Hidden tabs stop receiving resource frames and catch up when shown again
+                    document.addEventListener('visibilitychange', () => {
+                        const visible = document.visibilityState === 'visible';
+                        this.subscribeResources(visible);
+                        if (visible) this.loadSystemResources();
+                    });
                 },
 
                 connectWebSocket() {
@@ -1094,11 +1544,17 @@ def get_dashboard_html():
                     
                     ws.onopen = () => {
                         this.connectionStatus = 'connected';
+                        ws.send(JSON.stringify({ type: 'hello', last_id: this.lastResourceId }));
+                        if (document.hidden) this.subscribeResources(false);
                         console.log('WebSocket connected');
                     };
                     
                     ws.onclose = () => {
                         this.connectionStatus = 'disconnected';
+                        for (const id in this._pendingRpc) {
+                            this._pendingRpc[id].reject(new Error('WebSocket closed'));
+                        }
+                        this._pendingRpc = {};
                         setTimeout(() => this.connectWebSocket(), 5000); // Reconnect after 5 seconds
                     };
                     
@@ -1106,8 +1562,16 @@ def get_dashboard_html():
                         const data = JSON.parse(event.data);
                         console.log('WebSocket message:', data);
                         
-                        if (data.type === 'blog_generated') {
-                            this.blogs.unshift(data.blog);
+                        if (data.id !== undefined && data.id in this._pendingRpc) {
+                            this._pendingRpc[data.id].resolve(data.result);
+                            delete this._pendingRpc[data.id];
+                        } else if (data.type === 'system_resources') {
+                            if (data.id > this.lastResourceId) {
+                                this.lastResourceId = data.id;
+                                this._scheduleResources(data.data);
+                            }
+                        } else if (data.type === 'blog_generated') {
+                            this.addBlog(data.blog);
                             this.lastGenerationResult = data.publish_result.success ? 
                                 'Blog generated and published to celorisdesigns.com!' : 
                                 `Blog generated but failed to publish to celorisdesigns.com: ${data.publish_result.error}`;
@@ -1118,28 +1582,80 @@ def get_dashboard_html():
                     this.ws = ws;
                 },
 
+                // Send a request frame over the open WebSocket; use the HTTP fallback when disconnected
+                rpc(method, params, httpFallback) {
+                    if (this.connectionStatus !== 'connected') {
+                        return httpFallback();
+                    }
+                    const id = ++this._rpcSeq;
+                    return new Promise((resolve, reject) => {
+                        this._pendingRpc[id] = { resolve, reject };
+                        this.ws.send(JSON.stringify({ id, method, params }));
+                    });
+                },
+
                 async loadBlogs() {
                     try {
-                        const response = await fetch('/api/blog/posts');
-                        const data = await response.json();
-                        this.blogs = data.blogs || [];
+                        const data = await this.rpc('blog.list', {}, async () => {
+                            const response = await fetch('/api/blog/posts');
+                            return response.json();
+                        });
+                        this.setBlogs(data.blogs || []);
                     } catch (error) {
                         console.error('Error loading blogs:', error);
                     }
                 },
 
+                subscribeResources(on) {
+                    if (this.connectionStatus === 'connected') {
+                        this.ws.send(JSON.stringify({ type: 'subscribe', topic: 'resources', on }));
+                    }
+                },
+
                 async loadSystemResources() {
                     try {
                         const response = await fetch('/api/system/resources');
-                        this.systemResources = await response.json();
+                        this._scheduleResources(await response.json());
                     } catch (error) {
                         console.error('Error loading system resources:', error);
                     }
                 },
 
+                // Coalesce resource updates into one reactive assignment per animation frame
+                _scheduleResources(data) {
+                    const framePending = this._pendingResources !== null;
+                    this._pendingResources = data;
+                    if (framePending) return;
+                    requestAnimationFrame(() => {
+                        this.systemResources = this._pendingResources;
+                        this._pendingResources = null;
+                    });
+                },
+
+                // Non-blocking replacements for alert()/confirm()
+                toast(message, type = 'error') {
+                    const id = ++this._toastSeq;
+                    this.toasts.push({ id, message, type });
+                    setTimeout(() => {
+                        this.toasts = this.toasts.filter(t => t.id !== id);
+                    }, 4000);
+                },
+
+                confirmAction(message) {
+                    return new Promise(resolve => {
+                        this.confirmState = { open: true, message, resolve };
+                    });
+                },
+
+                resolveConfirm(answer) {
+                    const resolve = this.confirmState.resolve;
+                    this.confirmState = { open: false, message: '', resolve: null };
+                    if (resolve) resolve(answer);
+                },
+
                 async generateBlog() {
                     if (!this.newBlog.topic.trim()) {
-                        alert('Please enter a blog topic');
+                        this.toast('Please enter a blog topic');
                         return;
                     }
                     
@@ -1147,24 +1663,26 @@ def get_dashboard_html():
                     this.lastGenerationResult = '';
                     
                     try {
-                        const response = await fetch('/api/blog/generate', {
-                            method: 'POST',
-                            headers: { 'Content-Type': 'application/json' },
-                            body: JSON.stringify(this.newBlog)
+                        const params = { topic: this.newBlog.topic, length: this.newBlog.length };
+                        const result = await this.rpc('blog.generate', params, async () => {
+                            const response = await fetch('/api/blog/generate', {
+                                method: 'POST',
+                                headers: { 'Content-Type': 'application/json' },
+                                body: JSON.stringify(params)
+                            });
+                            return response.json();
                         });
                         
-                        const result = await response.json();
-                        
                         if (result.success) {
-                            this.blogs.unshift(result.blog);
+                            this.addBlog(result.blog);
                             this.newBlog.topic = '';
                             this.lastGenerationResult = result.message;
                         } else {
-                            alert('Error generating blog: ' + result.error);
+                            this.toast('Error generating blog: ' + result.error);
                         }
                     } catch (error) {
                         console.error('Error generating blog:', error);
-                        alert('Error generating blog. Please try again.');
+                        this.toast('Error generating blog. Please try again.');
                     } finally {
                         this.generating = false;
                     }
@@ -1180,80 +1698,66 @@ def get_dashboard_html():
                     this.saving = true;
                     
                     try {
-                        const response = await fetch(`/api/blog/${this.editingBlog.id}`, {
-                            method: 'PUT',
-                            headers: { 'Content-Type': 'application/json' },
-                            body: JSON.stringify({
-                                title: this.editingBlog.title,
-                                content: this.editingBlog.content,
-                                status: this.editingBlog.status,
-                                platforms: this.editingBlog.platforms.split(',').map(p => p.trim()).filter(p => p)
-                            })
+                        const blogId = this.editingBlog.id;
+                        const update = {
+                            title: this.editingBlog.title,
+                            content: this.editingBlog.content,
+                            status: this.editingBlog.status,
+                            platforms: this.editingBlog.platforms.split(',').map(p => p.trim()).filter(p => p)
+                        };
+                        const result = await this.rpc('blog.update', { id: blogId, update }, async () => {
+                            const response = await fetch(`/api/blog/${blogId}`, {
+                                method: 'PUT',
+                                headers: { 'Content-Type': 'application/json' },
+                                body: JSON.stringify(update)
+                            });
+                            return response.json();
                         });
                         
-                        const result = await response.json();
-                        
                         if (result.success) {
-                            const index = this.blogs.findIndex(b => b.id === this.editingBlog.id);
-                            if (index !== -1) {
-                                this.blogs[index] = result.blog;
+                            if (result.blog.id in this.blogsById) {
+                                this.blogsById[result.blog.id] = result.blog;
                             }
                             this.showEditModal = false;
                         } else {
-                            alert('Error saving blog: ' + result.error);
+                            this.toast('Error saving blog: ' + result.error);
                         }
                     } catch (error) {
                         console.error('Error saving blog:', error);
-                        alert('Error saving blog. Please try again.');
+                        this.toast('Error saving blog. Please try again.');
                     } finally {
                         this.saving = false;
                     }
                 },
 
                 async deleteBlog(blogId) {
-                    if (!confirm('Are you sure you want to delete this blog post?')) {
+                    if (!await this.confirmAction('Are you sure you want to delete this blog post?')) {
                         return;
                     }
                     
                     try {
-                        const response = await fetch(`/api/blog/${blogId}`, {
-                            method: 'DELETE'
+                        const result = await this.rpc('blog.delete', { id: blogId }, async () => {
+                            const response = await fetch(`/api/blog/${blogId}`, {
+                                method: 'DELETE'
+                            });
+                            return response.json();
                         });
                         
-                        const result = await response.json();
-                        
                         if (result.success) {
-                            this.blogs = this.blogs.filter(b => b.id !== blogId);
+                            delete this.blogsById[blogId];
+                            this.blogIds = this.blogIds.filter(id => id !== blogId);
                         } else {
-                            alert('Error deleting blog: ' + result.error);
+                            this.toast('Error deleting blog: ' + result.error);
                         }
                     } catch (error) {
                         console.error('Error deleting blog:', error);
-                        alert('Error deleting blog. Please try again.');
+                        this.toast('Error deleting blog. Please try again.');
                     }
                 },
 
-                formatBytes(bytes) {
-                    if (bytes === 0) return '0 Bytes';
-                    const k = 1024;
-                    const sizes = ['Bytes', 'KB', 'MB', 'GB', 'TB'];
-                    const i = Math.floor(Math.log(bytes) / Math.log(k));
-                    return parseFloat((bytes / Math.pow(k, i)).toFixed(2)) + ' ' + sizes[i];
-                },
+                formatBytes: formatBytesCached,
 
-                formatUptime(seconds) {
-                    const days = Math.floor(seconds / 86400);
-                    const hours = Math.floor((seconds % 86400) / 3600);
-                    const minutes = Math.floor((seconds % 3600) / 60);
-                    
-                    if (days > 0) {
-                        return `${days}d ${hours}h ${minutes}m`;
-                    } else if (hours > 0) {
-                        return `${hours}h ${minutes}m`;
-                    } else {
-                        return `${minutes}m`;
-                    }
-                }
+                formatUptime: formatUptimeCached
             }
         }
     </script>
@@ -1261,5 +1765,62 @@ def get_dashboard_html():
 </html>
 """
 
+# Same-origin replacements for the CDN assets, applied for each file that
+# build_dashboard_assets.sh has built or vendored into static/
+LOCAL_ASSET_TAGS = [
+    (
+        STATIC_DIR / "css" / "dashboard.css",
+        '<script src="https://cdn.tailwindcss.com"></script>',
+        '<link rel="stylesheet" href="/static/css/dashboard.css">'
+    ),
+    (
+        STATIC_DIR / "vendor" / "alpinejs-3.13.5.min.js",
+        '<link rel="preconnect" href="https://unpkg.com" crossorigin>\n'
+        '    <script defer src="https://unpkg.com/alpinejs@3.13.5/dist/cdn.min.js" crossorigin="anonymous"></script>',
+        '<script defer src="/static/vendor/alpinejs-3.13.5.min.js"></script>'
+    ),
+    (
+        STATIC_DIR / "vendor" / "fontawesome-6.0.0" / "css" / "all.min.css",
+        '<link rel="preconnect" href="https://cdnjs.cloudflare.com" crossorigin>\n'
+        '    <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">',
+        '<link href="/static/vendor/fontawesome-6.0.0/css/all.min.css" rel="stylesheet">'
+    )
+]
+for local_file, cdn_tag, local_tag in LOCAL_ASSET_TAGS:
+    if local_file.exists():
+        DASHBOARD_HTML = DASHBOARD_HTML.replace(cdn_tag, local_tag)
+
+HTML_COMMENT_PATTERN = re.compile(r'<!--.*?-->', re.S)
+INTER_TAG_SPACE_PATTERN = re.compile(r'>\s+<')
+SCRIPT_BLOCK_PATTERN = re.compile(r'(<script\b[^>]*>.*?</script>|<style\b[^>]*>.*?</style>)', re.S)
+LEADING_SPACE_PATTERN = re.compile(r'^[ \t]+', re.M)
+
+def minify_html(html: str) -> str:
+    """Strip comments and inter-tag whitespace; inline scripts/styles only lose indentation"""
+    parts = SCRIPT_BLOCK_PATTERN.split(html)
+    for i, part in enumerate(parts):
+        if i % 2:
+            parts[i] = LEADING_SPACE_PATTERN.sub('', part)
+        else:
+            parts[i] = INTER_TAG_SPACE_PATTERN.sub('><', HTML_COMMENT_PATTERN.sub('', part)).strip()
+    return ''.join(parts)
+
+DASHBOARD_HTML = minify_html(DASHBOARD_HTML)
+
+# Encoded and compressed once at import; the dashboard route serves these bytes directly
+DASHBOARD_HTML_BYTES = DASHBOARD_HTML.encode("utf-8")
+DASHBOARD_HTML_GZIP = gzip.compress(DASHBOARD_HTML_BYTES, compresslevel=9)
+DASHBOARD_HTML_BR = brotli.compress(DASHBOARD_HTML_BYTES, quality=11) if BROTLI_AVAILABLE else None
+DASHBOARD_ETAG = f'"{hashlib.md5(DASHBOARD_HTML_BYTES).hexdigest()}"'
+DASHBOARD_CACHE_HEADERS = {
+    "Cache-Control": "public, max-age=3600",
+    "ETag": DASHBOARD_ETAG,
+    "Vary": "Accept-Encoding"
+}
+
+def get_dashboard_html():
+    """Return the main dashboard HTML"""
+    return DASHBOARD_HTML
+
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -1,13 +1,8 @@
 """
 Database configuration and connection management
 """
-import pymongo
-import mysql.connector
-from sqlalchemy import create_engine, text
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 from loguru import logger
-from .settings import settings
+from .settings import settings, DB_KIND_MONGODB, DB_KIND_MYSQL
 
 class DatabaseManager:
     """Manages database connections for both MongoDB and MySQL"""
@@ -17,24 +12,29 @@ class DatabaseManager:
         self.mongo_db = None
         self.mysql_engine = None
         self.mysql_session = None
+        # Collection handles keyed by name; cleared on disconnect
+        self._collection_cache = {}
         
     def connect_mongodb(self):
         """Connect to MongoDB"""
         try:
-            self.mongo_client = pymongo.MongoClient(settings.MONGODB_URI)
+            # Driver is imported on first connect so MySQL-only processes never load it
+            import pymongo
+            
+            self.mongo_client = pymongo.MongoClient(
+                settings.MONGODB_URI,
+                maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+                minPoolSize=settings.MONGO_MIN_POOL_SIZE,
+                maxIdleTimeMS=settings.MONGO_MAX_IDLE_TIME_MS,
+                serverSelectionTimeoutMS=settings.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+                retryWrites=True
+            )
             # Test connection
             self.mongo_client.admin.command('ping')
             logger.info("MongoDB connected successfully")
             
-            # Get database name from URI or use default
-            db_name = "ai_automation"
-            if "/" in settings.MONGODB_URI:
-                # Extract database name from URI if present
-                db_name = settings.MONGODB_URI.split("/")[-1]
-                if not db_name:
-                    db_name = "ai_automation"
-            
-            self.mongo_db = self.mongo_client[db_name]
+            # Database name is parsed from the URI once by Settings
+            self.mongo_db = self.mongo_client[settings.MONGODB_DATABASE]
             
         except Exception as e:
             logger.error(f"MongoDB connection failed: {e}")
@@ -45,17 +45,48 @@ class DatabaseManager:
     def connect_mysql(self):
         """Connect to MySQL"""
         try:
-            # Create SQLAlchemy engine for MySQL
-            mysql_url = f"mysql+mysqlconnector://{settings.MYSQL_USER}:{settings.MYSQL_PASSWORD}@{settings.MYSQL_HOST}:{settings.MYSQL_PORT}/{settings.MYSQL_DATABASE}"
-            self.mysql_engine = create_engine(mysql_url)
+            # Driver and engine imports are deferred until a MySQL connection is requested
+            import mysql.connector
+            from sqlalchemy import create_engine, text
+            from sqlalchemy.engine import URL
+            from sqlalchemy.orm import scoped_session, sessionmaker
+            
+            # Serialize JSON columns with orjson when it is installed
+            try:
+                import orjson
+                json_options = {
+                    "json_serializer": lambda obj: orjson.dumps(obj).decode(),
+                    "json_deserializer": orjson.loads
+                }
+            except ImportError:
+                json_options = {}
+            
+            # Create SQLAlchemy engine for MySQL; URL.create escapes credentials containing @, :, / or %
+            mysql_url = URL.create(
+                "mysql+mysqlconnector",
+                username=settings.MYSQL_USER,
+                password=settings.MYSQL_PASSWORD,
+                host=settings.MYSQL_HOST,
+                port=settings.MYSQL_PORT,
+                database=settings.MYSQL_DATABASE
+            )
+            self.mysql_engine = create_engine(
+                mysql_url,
+                pool_size=settings.MYSQL_POOL_SIZE,
+                max_overflow=settings.MYSQL_MAX_OVERFLOW,
+                pool_timeout=settings.MYSQL_POOL_TIMEOUT,
+                pool_recycle=settings.MYSQL_POOL_RECYCLE,
+                pool_pre_ping=settings.MYSQL_POOL_PRE_PING,
+                **json_options
+            )
             
             # Test connection
             with self.mysql_engine.connect() as conn:
                 conn.execute(text("SELECT 1"))
             
-            # Create session factory
+            # Thread-local session registry; each thread reuses its Session until remove()
             SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.mysql_engine)
-            self.mysql_session = SessionLocal
+            self.mysql_session = scoped_session(SessionLocal)
             
             logger.info("MySQL connected successfully")
             
@@ -67,9 +98,9 @@ class DatabaseManager:
     
     def connect(self):
         """Connect to the configured database"""
-        if settings.DATABASE_TYPE.lower() == "mongodb":
+        if settings._db_kind == DB_KIND_MONGODB:
             return self.connect_mongodb()
-        elif settings.DATABASE_TYPE.lower() == "mysql":
+        elif settings._db_kind == DB_KIND_MYSQL:
             return self.connect_mysql()
         else:
             logger.error(f"Unsupported database type: {settings.DATABASE_TYPE}")
@@ -77,73 +108,144 @@ class DatabaseManager:
     
     def disconnect(self):
         """Disconnect from database"""
+        self._collection_cache.clear()
+        
         if self.mongo_client:
             self.mongo_client.close()
             logger.info("MongoDB disconnected")
         
+        if self.mysql_session is not None:
+            self.mysql_session.remove()
+        
         if self.mysql_engine:
             self.mysql_engine.dispose()
             logger.info("MySQL disconnected")
     
+    def warm_mysql_pool(self):
+        """Open pool_size connections up front so the first requests skip connect/auth"""
+        if not self.mysql_engine:
+            return
+        # Hold them all at once; connect/close in sequence would reuse a single connection
+        connections = []
+        try:
+            for _ in range(settings.MYSQL_POOL_SIZE):
+                connections.append(self.mysql_engine.connect())
+        except Exception as e:
+            logger.warning(f"MySQL pool warm-up stopped early: {e}")
+        finally:
+            for conn in connections:
+                conn.close()
+        logger.debug(f"MySQL pool warmed with {len(connections)} connections")
+    
     def get_mongodb_collection(self, collection_name):
         """Get MongoDB collection"""
-        if not self.mongo_db:
+        collection = self._collection_cache.get(collection_name)
+        if collection is not None:
+            return collection
+        # pymongo Database objects do not support truth testing
+        if self.mongo_db is None:
             raise Exception("MongoDB not connected")
-        return self.mongo_db[collection_name]
+        return self._collection_cache.setdefault(collection_name, self.mongo_db[collection_name])
     
     def get_mysql_session(self):
-        """Get MySQL session"""
-        if not self.mysql_session:
+        """Get the MySQL session for the current thread"""
+        if self.mysql_session is None:
             raise Exception("MySQL not connected")
-        return self.mysql_session
+        return self.mysql_session()
+    
+    def remove_mysql_session(self):
+        """Close and discard the current thread's MySQL session, if any"""
+        if self.mysql_session is not None:
+            self.mysql_session.remove()
 
-# Global database manager instance
-db_manager = DatabaseManager()
+# Global database manager instance, created on first use
+_db_manager = None
 
-# SQLAlchemy base for MySQL models
-Base = declarative_base()
+def get_db_manager():
+    """Return the shared DatabaseManager, creating it on first call"""
+    global _db_manager
+    if _db_manager is None:
+        _db_manager = DatabaseManager()
+    return _db_manager
 
-# MySQL Models for Blog Module
-class BlogPost:
-    """SQLAlchemy model for blog posts"""
-    from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean
-    from sqlalchemy.ext.declarative import declarative_base
+def __getattr__(name):
+    """Keep `from config.database import db_manager` working without eager construction"""
+    if name == "db_manager":
+        return get_db_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# SQLAlchemy base and models exist only for MySQL deployments, so MongoDB-only
+# processes never import SQLAlchemy
+if settings._db_kind == DB_KIND_MYSQL:
     import datetime
+    from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Index, JSON
+    from sqlalchemy.ext.declarative import declarative_base
     
-    __tablename__ = "blog_posts"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    title = Column(String(255), nullable=False)
-    content = Column(Text, nullable=False)
-    topic = Column(String(100))
-    status = Column(String(50), default="draft")  # draft, published, scheduled
-    created_at = Column(DateTime, default=datetime.datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
-    published_at = Column(DateTime)
-    word_count = Column(Integer)
-    tags = Column(Text)  # JSON string of tags
-    is_auto_generated = Column(Boolean, default=True)
-    source_url = Column(String(500))  # For reference
-    
-    def __repr__(self):
-        return f"<BlogPost(id={self.id}, title='{self.title}')>"
+    # SQLAlchemy base for MySQL models
+    Base = declarative_base()
+
+    # MySQL Models for Blog Module
+    class BlogPost(Base):
+        """SQLAlchemy model for blog posts"""
+        __tablename__ = "blog_posts"
+        __table_args__ = (
+            # Covers "list recent posts by status" queries
+            Index("ix_blog_status_created", "status", "created_at"),
+        )
+        
+        id = Column(Integer, primary_key=True, index=True)
+        title = Column(String(255), nullable=False)
+        content = Column(Text, nullable=False)
+        topic = Column(String(100))
+        status = Column(String(50), default="draft")  # draft, published, scheduled
+        created_at = Column(DateTime, default=datetime.datetime.utcnow)
+        updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
+        published_at = Column(DateTime)
+        word_count = Column(Integer)
+        tags = Column(JSON)  # List of tag strings, stored as native JSON
+        is_auto_generated = Column(Boolean, default=True)
+        source_url = Column(String(500))  # For reference
+        
+        def __repr__(self):
+            return f"<BlogPost(id={self.id}, title='{self.title}')>"
+
+def _resolve_collection(collection_name):
+    """Get collection by checking the configured database type on each call"""
+    if settings._db_kind == DB_KIND_MONGODB:
+        return get_db_manager().get_mongodb_collection(collection_name)
+    else:
+        return get_db_manager().get_mysql_session()
+
+# Collection accessor; specialized to the configured backend by init_database()
+_get_collection_impl = _resolve_collection
 
 # Initialize database connection
 def init_database():
     """Initialize database connection"""
+    global _get_collection_impl
+    db_manager = get_db_manager()
     success = db_manager.connect()
     
-    if success and settings.DATABASE_TYPE.lower() == "mysql":
+    if success and settings._db_kind == DB_KIND_MYSQL:
         # Create tables for MySQL
         Base.metadata.create_all(bind=db_manager.mysql_engine)
         logger.info("MySQL tables created/verified")
+        db_manager.warm_mysql_pool()
+    
+    if success:
+        # The backend is fixed for the process, so bind the accessor once
+        if settings._db_kind == DB_KIND_MONGODB:
+            _get_collection_impl = db_manager.get_mongodb_collection
+        else:
+            _get_collection_impl = lambda _name: db_manager.get_mysql_session()
     
     return success
 
+def get_mysql_session():
+    """Get the thread-local MySQL session from the shared manager"""
+    return get_db_manager().get_mysql_session()
+
 # Get database collection for MongoDB or MySQL
 def get_collection(collection_name):
     """Get database collection (MongoDB) or table reference (MySQL)"""
-    if settings.DATABASE_TYPE.lower() == "mongodb":
-        return db_manager.get_mongodb_collection(collection_name)
-    else:
-        return db_manager.get_mysql_session()
+    return _get_collection_impl(collection_name)
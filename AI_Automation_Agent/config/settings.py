@@ -2,86 +2,172 @@
 Configuration settings for AI Automation Agent
 """
 import os
+from functools import cached_property, lru_cache
+from pathlib import Path
+from urllib.parse import urlsplit
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Load environment variables from the project .env only; a single stat, no upward search.
+# Set SKIP_DOTENV=1 to rely on the process environment alone.
+_ENV_FILE = Path(__file__).resolve().parent.parent / ".env"
+if os.getenv("SKIP_DOTENV") != "1" and _ENV_FILE.is_file():
+    load_dotenv(_ENV_FILE, override=False)
 
-class Settings:
-    """Application settings"""
-    
+# Snapshot the environment once; settings resolve from this dict
+_ENV = dict(os.environ)
+
+def _get(key, default=None, cast=str):
+    """Read a setting from the environment snapshot, casting values that are present"""
+    value = _ENV.get(key)
+    return cast(value) if value is not None else default
+
+def _csv_set(value, lower=False):
+    """Split a comma-separated setting into a frozenset of stripped, non-empty items"""
+    items = (item.strip() for item in value.split(","))
+    return frozenset(item.lower() if lower else item for item in items if item)
+
+# Integer tags for the configured database backend
+DB_KIND_MONGODB = 0
+DB_KIND_MYSQL = 1
+DB_KIND_UNSUPPORTED = -1
+
+def _as_bool(value):
+    return value.lower() == "true"
+
+# Plain settings as name -> (cast, default); parsed on first access by Settings.__getattr__
+_SCHEMA = {
     # Database Configuration
-    DATABASE_TYPE = os.getenv("DATABASE_TYPE", "mongodb")  # "mongodb" or "mysql"
-    MONGODB_URI = os.getenv("MONGODB_URI", "mongodb://localhost:27017")
-    MYSQL_HOST = os.getenv("MYSQL_HOST", "localhost")
-    MYSQL_PORT = int(os.getenv("MYSQL_PORT", "3306"))
-    MYSQL_USER = os.getenv("MYSQL_USER", "root")
-    MYSQL_PASSWORD = os.getenv("MYSQL_PASSWORD", "")
-    MYSQL_DATABASE = os.getenv("MYSQL_DATABASE", "ai_automation")
+    "DATABASE_TYPE": (str, "mongodb"),  # "mongodb" or "mysql"
+    "MONGODB_URI": (str, "mongodb://localhost:27017"),
+    "MONGO_MAX_POOL_SIZE": (int, 200),
+    "MONGO_MIN_POOL_SIZE": (int, 10),
+    "MONGO_MAX_IDLE_TIME_MS": (int, 300000),
+    "MONGO_SERVER_SELECTION_TIMEOUT_MS": (int, 5000),
+    "MYSQL_HOST": (str, "localhost"),
+    "MYSQL_PORT": (int, 3306),
+    "MYSQL_USER": (str, "root"),
+    "MYSQL_PASSWORD": (str, ""),
+    "MYSQL_DATABASE": (str, "ai_automation"),
+    "MYSQL_POOL_SIZE": (int, 10),
+    "MYSQL_MAX_OVERFLOW": (int, 20),
+    "MYSQL_POOL_TIMEOUT": (int, 30),
+    "MYSQL_POOL_RECYCLE": (int, 1800),  # below MySQL wait_timeout
+    "MYSQL_POOL_PRE_PING": (_as_bool, True),
     
     # AI Configuration
-    OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-    AI_MODEL = os.getenv("AI_MODEL", "gpt-3.5-turbo")
-    MAX_TOKENS = int(os.getenv("MAX_TOKENS", "2000"))
-    TEMPERATURE = float(os.getenv("TEMPERATURE", "0.7"))
+    "OPENAI_API_KEY": (str, None),
+    "AI_MODEL": (str, "gpt-3.5-turbo"),
+    "MAX_TOKENS": (int, 2000),
+    "TEMPERATURE": (float, 0.7),
+    "OPENAI_MAX_RPM": (int, 500),  # request budget for concurrent async generation
+    "OPENAI_MAX_TPM": (int, 90000),  # token budget, prompt estimate plus max_tokens per call
+    "OPENAI_MAX_ATTEMPTS": (int, 5),  # tries per call when rate limited
     
     # Next.js Integration (Primary Publishing Method)
-    NEXTJS_BLOG_API = os.getenv("NEXTJS_BLOG_API")
+    "NEXTJS_BLOG_API": (str, None),
     # Session-based Authentication (RECOMMENDED)
-    NEXTJS_ADMIN_SESSION = os.getenv("NEXTJS_ADMIN_SESSION")
-    NEXTJS_AUTH_HEADER = os.getenv("NEXTJS_AUTH_HEADER", "x-admin-session")
-    NEXTJS_API_TIMEOUT = int(os.getenv("NEXTJS_API_TIMEOUT", "30"))
-    NEXTJS_RATE_LIMIT_AWARE = os.getenv("NEXTJS_RATE_LIMIT_AWARE", "true").lower() == "true"
+    "NEXTJS_ADMIN_SESSION": (str, None),
+    "NEXTJS_AUTH_HEADER": (str, "x-admin-session"),
+    "NEXTJS_API_TIMEOUT": (int, 30),
+    "NEXTJS_RATE_LIMIT_AWARE": (_as_bool, True),
     # Legacy API Key Authentication (DEPRECATED)
-    NEXTJS_API_KEY = os.getenv("NEXTJS_API_KEY")
+    "NEXTJS_API_KEY": (str, None),
     
     # Legacy Platform Support (Optional)
-    WORDPRESS_URL = os.getenv("WORDPRESS_URL")
-    WORDPRESS_USERNAME = os.getenv("WORDPRESS_USERNAME")
-    WORDPRESS_PASSWORD = os.getenv("WORDPRESS_PASSWORD")
-    MEDIUM_ACCESS_TOKEN = os.getenv("MEDIUM_ACCESS_TOKEN")
+    "WORDPRESS_URL": (str, None),
+    "WORDPRESS_USERNAME": (str, None),
+    "WORDPRESS_PASSWORD": (str, None),
+    "MEDIUM_ACCESS_TOKEN": (str, None),
     
     # Scheduling
-    ENABLE_SCHEDULER = os.getenv("ENABLE_SCHEDULER", "true").lower() == "true"
-    SCHEDULER_TIMEZONE = os.getenv("SCHEDULER_TIMEZONE", "UTC")
-    BLOG_GENERATION_TIME = os.getenv("BLOG_GENERATION_TIME", "09:00")
-    BLOG_GENERATION_DAYS = os.getenv("BLOG_GENERATION_DAYS", "mon,tue,wed,thu,fri").split(",")
+    "ENABLE_SCHEDULER": (_as_bool, True),
+    "SCHEDULER_TIMEZONE": (str, "UTC"),
+    "BLOG_GENERATION_TIME": (str, "09:00"),
     
     # Logging
-    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-    LOG_FILE = os.getenv("LOG_FILE", "logs/agent.log")
-    LOG_MAX_SIZE = int(os.getenv("LOG_MAX_SIZE", "10485760"))  # 10MB
-    LOG_BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", "5"))
-    DETAILED_API_LOGGING = os.getenv("DETAILED_API_LOGGING", "true").lower() == "true"
+    "LOG_LEVEL": (str, "INFO"),
+    "LOG_FILE": (str, "logs/agent.log"),
+    "LOG_MAX_SIZE": (int, 10485760),  # 10MB
+    "LOG_BACKUP_COUNT": (int, 5),
+    "DETAILED_API_LOGGING": (_as_bool, True),
     
     # Blog Settings
-    BLOG_FREQUENCY = os.getenv("BLOG_FREQUENCY", "daily")  # daily, weekly
-    BLOG_TOPICS = os.getenv("BLOG_TOPICS", "technology,ai,programming").split(",")
-    BLOG_MAX_LENGTH = int(os.getenv("BLOG_MAX_LENGTH", "1000"))
-    BLOG_DEFAULT_STATUS = os.getenv("BLOG_DEFAULT_STATUS", "draft")  # draft, published
-    SEO_OPTIMIZATION = os.getenv("SEO_OPTIMIZATION", "true").lower() == "true"
+    "BLOG_FREQUENCY": (str, "daily"),  # daily, weekly
+    "BLOG_MAX_LENGTH": (int, 1000),
+    "BLOG_MAX_CONTENT_TOKENS": (int, 0),  # trim content to this many model tokens (needs tiktoken); 0 disables
+    "BLOG_DEFAULT_STATUS": (str, "draft"),  # draft, published
+    "SEO_OPTIMIZATION": (_as_bool, True),
+    "BLOG_BATCH_WORD_THRESHOLD": (int, 0),  # scheduled series of at least this many words use the Batch API; 0 disables
+    "BLOG_BATCH_POLL_INTERVAL": (int, 30),  # seconds
+    "BLOG_BATCH_TIMEOUT": (int, 86400),  # seconds, matches the 24h completion window
+    "BLOG_CONTENT_CACHE_SIZE": (int, 32),  # generated posts reused for identical requests; 0 disables
+    "BLOG_CONTENT_CACHE_TTL": (int, 3600),  # seconds
+    "BLOG_SERIES_POSTS_PER_REQUEST": (int, 1),  # series posts requested per completion; 3-5 trades quality for fewer calls
+    "BLOG_PUBLISH_MAX_RPS": (float, 0.5),  # publish starts per second when a series is published concurrently; 0 disables pacing
     
     # Security & Performance
-    API_RETRY_ATTEMPTS = int(os.getenv("API_RETRY_ATTEMPTS", "3"))
-    API_RETRY_DELAY = int(os.getenv("API_RETRY_DELAY", "5"))
-    MAX_CONCURRENT_REQUESTS = int(os.getenv("MAX_CONCURRENT_REQUESTS", "5"))
+    "API_RETRY_ATTEMPTS": (int, 3),
+    "API_RETRY_DELAY": (int, 5),
+    "MAX_CONCURRENT_REQUESTS": (int, 5),
     
     # Course Settings
-    COURSE_MAX_MODULES = int(os.getenv("COURSE_MAX_MODULES", "10"))
-    COURSE_MAX_LESSONS = int(os.getenv("COURSE_MAX_LESSONS", "5"))
+    "COURSE_MAX_MODULES": (int, 10),
+    "COURSE_MAX_LESSONS": (int, 5),
     
     # Job Aggregation (Future Module)
-    JOB_SOURCES = os.getenv("JOB_SOURCES", "linkedin,indeed,glassdoor").split(",")
-    JOB_UPDATE_FREQUENCY = os.getenv("JOB_UPDATE_FREQUENCY", "6h")
-    
-    # Course Settings (Future Module)
-    COURSE_MAX_MODULES = int(os.getenv("COURSE_MAX_MODULES", "10"))
-    COURSE_MAX_LESSONS = int(os.getenv("COURSE_MAX_LESSONS", "5"))
+    "JOB_UPDATE_FREQUENCY": (str, "6h"),
     
     # Chatbot & Web Interface
-    CHATBOT_ENABLED = os.getenv("CHATBOT_ENABLED", "true").lower() == "true"
-    CHATBOT_PORT = int(os.getenv("CHATBOT_PORT", "8000"))
-    SESSION_SECRET = os.getenv("SESSION_SECRET", "default-secret-change-in-production")
+    "CHATBOT_ENABLED": (_as_bool, True),
+    "CHATBOT_PORT": (int, 8000),
+    "SESSION_SECRET": (str, "default-secret-change-in-production"),
+}
+
+class Settings:
+    """Application settings, each parsed from the environment on first access"""
+    
+    def __getattr__(self, name):
+        # Only reached before a setting is first read; the parsed value is then
+        # stored on the instance so later reads are plain attribute lookups
+        try:
+            cast, default = _SCHEMA[name]
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}") from None
+        value = _get(name, default, cast)
+        setattr(self, name, value)
+        return value
+    
+    # Derived settings
+    @cached_property
+    def DATABASE_TYPE_LOWER(self):
+        return self.DATABASE_TYPE.lower()
+
+    @cached_property
+    def _db_kind(self):
+        # Resolved once so backend dispatch is an integer compare
+        return {"mongodb": DB_KIND_MONGODB, "mysql": DB_KIND_MYSQL}.get(self.DATABASE_TYPE_LOWER, DB_KIND_UNSUPPORTED)
+
+    @cached_property
+    def MONGODB_DATABASE(self):
+        # Path component of the URI, ignoring credentials, hosts and ?options
+        return urlsplit(self.MONGODB_URI).path.lstrip("/") or "ai_automation"
+
+    @cached_property
+    def BLOG_GENERATION_DAYS(self):
+        return _csv_set(_get("BLOG_GENERATION_DAYS", "mon,tue,wed,thu,fri"), lower=True)
+
+    @cached_property
+    def BLOG_TOPICS(self):
+        return _csv_set(_get("BLOG_TOPICS", "technology,ai,programming"))
+
+    @cached_property
+    def JOB_SOURCES(self):
+        return _csv_set(_get("JOB_SOURCES", "linkedin,indeed,glassdoor"))
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance"""
+    return Settings()
 
-# Create settings instance
-settings = Settings()
+# Module-level shim for existing `from config.settings import settings` imports
+settings = get_settings()
@@ -7,7 +7,9 @@ Tests the fixes for loading icon and background service issues
 import sys
 import os
 import requests
+from requests.adapters import HTTPAdapter
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Add project root to path
@@ -70,6 +72,14 @@ def test_imports():
     
     return True
 
+def _process_alive(pid):
+    """Signal-0 liveness probe, same check ServiceManager.is_running uses"""
+    try:
+        os.kill(pid, 0)
+        return True
+    except OSError:
+        return False
+
 def test_service_manager():
     """Test service manager functionality"""
     print_info("Testing service manager...")
@@ -81,9 +91,9 @@ def test_service_manager():
         print_status("Service manager imported successfully")
         print_info(f"  PID file location: {manager.pid_file}")
         
-        # Test if service is running
-        if manager.is_running():
-            pid = manager.get_pid()
+        # Test if service is running; read the PID file once and probe that PID directly
+        pid = manager.get_pid()
+        if pid is not None and _process_alive(pid):
             print_status(f"Service is running (PID: {pid})")
         else:
             print_info("Service is not currently running")
@@ -108,10 +118,22 @@ def test_web_interface_imports():
         print_warning(f"Web interface import failed: {e}")
         return False
 
-def test_api_endpoints():
+def create_http_session():
+    """Create a pooled HTTP session shared by the health probe and endpoint checks"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def test_api_endpoints(session=None):
     """Test if API endpoints are accessible"""
     print_info("Testing API endpoints...")
     
+    owns_session = session is None
+    if owns_session:
+        session = create_http_session()
+    
     base_url = "http://localhost:8000"
     endpoints = [
         "/api/health",
@@ -120,17 +142,28 @@ def test_api_endpoints():
         "/api/analytics/summary"
     ]
     
-    for endpoint in endpoints:
-        try:
-            response = requests.get(f"{base_url}{endpoint}", timeout=5)
-            if response.status_code == 200:
-                print_status(f"Endpoint {endpoint} is accessible")
-            else:
-                print_warning(f"Endpoint {endpoint} returned status {response.status_code}")
-        except requests.exceptions.ConnectionError:
-            print_warning(f"Endpoint {endpoint} not accessible (service not running)")
-        except Exception as e:
-            print_error(f"Endpoint {endpoint} error: {e}")
+    try:
+        # Probes are independent, so run them concurrently; worst case is one timeout, not the sum
+        with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+            futures = {
+                executor.submit(session.get, f"{base_url}{endpoint}", timeout=5): endpoint
+                for endpoint in endpoints
+            }
+            for future in as_completed(futures):
+                endpoint = futures[future]
+                try:
+                    response = future.result()
+                    if response.status_code == 200:
+                        print_status(f"Endpoint {endpoint} is accessible")
+                    else:
+                        print_warning(f"Endpoint {endpoint} returned status {response.status_code}")
+                except requests.exceptions.ConnectionError:
+                    print_warning(f"Endpoint {endpoint} not accessible (service not running)")
+                except Exception as e:
+                    print_error(f"Endpoint {endpoint} error: {e}")
+    finally:
+        if owns_session:
+            session.close()
 
 def main():
     print("=" * 60)
@@ -156,18 +189,21 @@ def main():
     
     # API endpoint test (only if service is running)
     print_info("Checking if web service is running...")
+    session = create_http_session()
     try:
-        response = requests.get("http://localhost:8000/api/health", timeout=2)
+        response = session.get("http://localhost:8000/api/health", timeout=2)
         if response.status_code == 200:
             print_status("Web service is running and responding")
             tests_passed += 1
             
-            # Test specific endpoints
-            test_api_endpoints()
+            # Test specific endpoints over the same pooled connection
+            test_api_endpoints(session)
         else:
             print_warning("Web service is running but not responding properly")
     except:
         print_warning("Web service is not running (this is OK if you haven't started it yet)")
+    finally:
+        session.close()
     
     print()
     print("=" * 60)
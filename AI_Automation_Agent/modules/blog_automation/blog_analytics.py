@@ -3,24 +3,206 @@ Blog Analytics Module
 Tracks and analyzes blog performance, engagement, and SEO metrics
 """
 import requests
+from requests.adapters import HTTPAdapter
+import copy
 import json
+import re
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from loguru import logger
 import sqlite3
+import threading
+import time
+import heapq
+from operator import itemgetter
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from urllib.parse import urlparse
 
 from config.settings import settings
 
+# BeautifulSoup is only needed for SEO page analysis
+try:
+    from bs4 import BeautifulSoup, CData, NavigableString, Tag
+    BS4_AVAILABLE = True
+except ImportError:
+    BS4_AVAILABLE = False
+
+# lxml is a C parser and much faster than the pure-Python html.parser fallback
+try:
+    import lxml
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+HTML_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+
+# orjson encodes straight to bytes in native code; the stdlib encoder is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_blob(value) -> bytes:
+    """Encode a value as UTF-8 JSON bytes for storage in a BLOB column"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(',', ':')).encode()
+
+# Shared keep-alive session for SEO page fetches, sized for concurrent fetching
+SEO_FETCH_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+}
+SEO_FETCH_WORKERS = 16
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_maxsize=SEO_FETCH_WORKERS))
+_SESSION.mount("https://", HTTPAdapter(pool_maxsize=SEO_FETCH_WORKERS))
+
+# Performance report layout, filled per section by generate_performance_report
+REPORT_HEADER_TEMPLATE = """
+# Blog Performance Report
+**Period:** {period[start_date]} to {period[end_date]}
+
+## Overall Performance
+- **Total Posts:** {overall[total_posts]}
+- **Total Views:** {overall[total_views]:,}
+- **Total Engagement:**
+  - Likes: {overall[total_likes]:,}
+  - Shares: {overall[total_shares]:,}
+  - Comments: {overall[total_comments]:,}
+- **Average Engagement Rate:** {overall[average_engagement_rate]}%
+- **Average SEO Score:** {overall[average_seo_score]}/100
+
+## Platform Performance
+"""
+
+REPORT_PLATFORM_TEMPLATE = """
+### {platform}
+- Posts: {posts}
+- Views: {total_views:,}
+- Average SEO Score: {average_seo_score}/100
+"""
+
+REPORT_POST_TEMPLATE = """
+### {rank}. {title}
+- Platform: {platform}
+- Views: {views:,}
+- Likes: {likes:,}
+- Shares: {shares:,}
+- Engagement Rate: {engagement_rate}%
+- SEO Score: {seo_score}/100
+"""
+
+REPORT_SEO_TEMPLATE = """
+- Average SEO Score: {average_seo_score}/100
+- Average Readability Score: {average_readability_score}/100
+- Average Performance Score: {average_performance_score}/100
+- Average Accessibility Score: {average_accessibility_score}/100
+"""
+
+REPORT_TOPIC_TEMPLATE = "- **{topic}**: {total_views:,} views across {post_count} posts\n"
+
+# Common title words that say nothing about the topic
+TOPIC_STOPWORDS = frozenset({
+    'about', 'after', 'also', 'been', 'before', 'best', 'does', 'from', 'guide',
+    'have', 'here', 'into', 'just', 'like', 'more', 'most', 'over', 'some',
+    'than', 'that', 'their', 'them', 'then', 'there', 'these', 'they', 'this',
+    'those', 'what', 'when', 'where', 'which', 'while', 'will', 'with', 'your',
+})
+
+# Sentence terminators used for the readability estimate
+SENTENCE_END_PATTERN = re.compile(r'[.!?]')
+
+# Punctuation stripped from words before counting terms, and how many terms get a density
+TERM_STRIP_CHARS = '.,;:!?"\'()[]{}<>*#'
+KEYWORD_DENSITY_TERMS = 10
+
+
+def _scan_text(text: str) -> Tuple[int, int, Counter]:
+    """Word count, sentence count and term frequencies from a single split of the text"""
+    words = text.split()
+    sentences = len(SENTENCE_END_PATTERN.findall(text))
+    terms = Counter()
+    for word in words:
+        term = word.strip(TERM_STRIP_CHARS).lower()
+        if len(term) > 3 and term not in TOPIC_STOPWORDS:
+            terms[term] += 1
+    return len(words), sentences, terms
+
+# Engagement metrics bound per row, with the defaults used for missing keys; the
+# getters pull every field from the merged dict in one call, in column order
+ANALYTICS_METRIC_DEFAULTS = {
+    'views': 0, 'likes': 0, 'shares': 0, 'comments': 0, 'engagement_rate': 0.0,
+}
+TRACKING_METRIC_DEFAULTS = {
+    'views': 0, 'unique_visitors': 0, 'time_spent': 0.0, 'bounce_rate': 0.0,
+    'social_shares': 0, 'comments': 0, 'click_through_rate': 0.0,
+}
+# Tracking metrics a call does not report are bound as NULL instead; the daily upsert
+# applies the defaults above to new rows and keeps stored values on existing ones
+TRACKING_METRIC_UNREPORTED = dict.fromkeys(TRACKING_METRIC_DEFAULTS)
+_analytics_metric_values = itemgetter(*ANALYTICS_METRIC_DEFAULTS)
+_tracking_metric_values = itemgetter(*TRACKING_METRIC_DEFAULTS)
+
+
+@lru_cache(maxsize=1)
+def _local_date_for_minute(minute: int) -> str:
+    return datetime.fromtimestamp(minute * 60).date().isoformat()
+
+
+def _today() -> str:
+    """Local ISO date, recomputed at most once a minute"""
+    return _local_date_for_minute(int(time.time() // 60))
+
+
+# Per-connection SQLite tuning; journal_mode=WAL is persistent and set once per database
+SQLITE_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA busy_timeout=5000",
+)
+
+# Seconds between PRAGMA optimize runs
+SQLITE_OPTIMIZE_INTERVAL = 15 * 60
+
+# Summary/trending results are reused for this many seconds unless new data is written
+REPORT_CACHE_TTL = 60
+REPORT_CACHE_SIZE = 8
+
 
 class BlogAnalytics:
     """
     Tracks and analyzes blog performance across different platforms
     """
     
+    # Databases already switched to WAL in this process
+    _wal_enabled = set()
+    _wal_lock = threading.Lock()
+    
     def __init__(self):
         """Initialize the blog analytics tracker"""
         self.analytics_db = "blog_analytics.db"
+        self._last_optimize = time.monotonic()
+        
+        # One long-lived connection per thread, tracked so close() can release them all
+        self._tls = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        
+        # Report cache; bumping _data_version on writes makes older entries unreachable
+        self._data_version = 0
+        self._report_cache = OrderedDict()
+        self._report_cache_lock = threading.Lock()
+        
         self._init_database()
         
         # Platform-specific analytics clients
@@ -30,71 +212,245 @@ class BlogAnalytics:
         # Initialize analytics tracking
         self._setup_analytics_tracking()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a tuned connection to the analytics database"""
+        # Autocommit at the driver; writes are grouped explicitly via _transaction()
+        conn = sqlite3.connect(self.analytics_db, isolation_level=None, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        
+        with self._wal_lock:
+            if self.analytics_db not in self._wal_enabled:
+                conn.execute("PRAGMA journal_mode=WAL")
+                self._wal_enabled.add(self.analytics_db)
+        
+        for pragma in SQLITE_CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        
+        return conn
+    
+    def _conn(self) -> sqlite3.Connection:
+        """Return this thread's pooled analytics connection, opening it on first use"""
+        conn = getattr(self._tls, 'conn', None)
+        if conn is None:
+            conn = self._connect()
+            self._tls.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        
+        # Refresh query planner statistics periodically
+        now = time.monotonic()
+        if now - self._last_optimize >= SQLITE_OPTIMIZE_INTERVAL:
+            self._last_optimize = now
+            conn.execute("PRAGMA optimize")
+        
+        return conn
+    
+    def close(self):
+        """Close every pooled connection; call on shutdown"""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to close analytics connection: {e}")
+        self._tls = threading.local()
+    
+    @contextmanager
+    def _transaction(self, mode: str = "IMMEDIATE"):
+        """Run the enclosed statements as a single BEGIN <mode> ... COMMIT unit
+
+        IMMEDIATE takes the write lock up front; DEFERRED gives a group of reads one snapshot.
+        """
+        cursor = self._conn().cursor()
+        cursor.execute(f"BEGIN {mode}")
+        try:
+            yield cursor
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+        cursor.execute("COMMIT")
+    
+    def _cached_report(self, key: tuple, compute):
+        """
+        Return a report value for key, recomputing after writes or REPORT_CACHE_TTL
+        
+        Callers get their own copy, so changing a returned report never alters the
+        cached one. Exceptions from compute propagate and leave nothing cached.
+        """
+        key = key + (self._data_version,)
+        now = time.monotonic()
+        with self._report_cache_lock:
+            entry = self._report_cache.get(key)
+            if entry is not None and entry[0] > now:
+                self._report_cache.move_to_end(key)
+                return copy.deepcopy(entry[1])
+        
+        value = compute()
+        with self._report_cache_lock:
+            self._report_cache[key] = (now + REPORT_CACHE_TTL, value)
+            self._report_cache.move_to_end(key)
+            while len(self._report_cache) > REPORT_CACHE_SIZE:
+                self._report_cache.popitem(last=False)
+        return copy.deepcopy(value)
+    
+    def _invalidate_reports(self):
+        """Mark cached summaries stale after a write"""
+        self._data_version += 1
+    
     def _init_database(self):
         """Initialize analytics database"""
         try:
-            conn = sqlite3.connect(self.analytics_db)
-            cursor = conn.cursor()
-            
-            # Create analytics table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS blog_analytics (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    post_id TEXT,
-                    title TEXT,
-                    platform TEXT,
-                    url TEXT,
-                    views INTEGER DEFAULT 0,
-                    likes INTEGER DEFAULT 0,
-                    shares INTEGER DEFAULT 0,
-                    comments INTEGER DEFAULT 0,
-                    reading_time INTEGER,
-                    engagement_rate REAL,
-                    seo_score INTEGER,
-                    keywords_ranking TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # Create SEO metrics table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS seo_metrics (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    url TEXT,
-                    meta_title TEXT,
-                    meta_description TEXT,
-                    h1_tags TEXT,
-                    image_alt_tags TEXT,
-                    word_count INTEGER,
-                    keyword_density TEXT,
-                    readability_score REAL,
-                    performance_score REAL,
-                    accessibility_score REAL,
-                    checked_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # Create engagement tracking table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS engagement_tracking (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    post_id TEXT,
-                    platform TEXT,
-                    date DATE,
-                    views INTEGER DEFAULT 0,
-                    unique_visitors INTEGER DEFAULT 0,
-                    time_spent REAL,
-                    bounce_rate REAL,
-                    social_shares INTEGER DEFAULT 0,
-                    comments INTEGER DEFAULT 0,
-                    email_signups INTEGER DEFAULT 0,
-                    click_through_rate REAL
-                )
-            ''')
-            
-            conn.commit()
-            conn.close()
+            with self._transaction() as cursor:
+                # Create analytics table
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS blog_analytics (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        post_id TEXT,
+                        title TEXT,
+                        platform TEXT,
+                        url TEXT,
+                        views INTEGER DEFAULT 0,
+                        likes INTEGER DEFAULT 0,
+                        shares INTEGER DEFAULT 0,
+                        comments INTEGER DEFAULT 0,
+                        reading_time INTEGER,
+                        engagement_rate REAL,
+                        seo_score INTEGER,
+                        keywords_ranking TEXT,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                ''')
+                
+                # Create SEO metrics table
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS seo_metrics (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        url TEXT,
+                        meta_title TEXT,
+                        meta_description TEXT,
+                        h1_tags BLOB,
+                        image_alt_tags BLOB,
+                        word_count INTEGER,
+                        keyword_density BLOB,
+                        readability_score REAL,
+                        performance_score REAL,
+                        accessibility_score REAL,
+                        seo_score INTEGER,
+                        checked_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                ''')
+                
+                # Create engagement tracking table
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS engagement_tracking (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        post_id TEXT,
+                        platform TEXT,
+                        date DATE,
+                        views INTEGER DEFAULT 0,
+                        unique_visitors INTEGER DEFAULT 0,
+                        time_spent REAL,
+                        bounce_rate REAL,
+                        social_shares INTEGER DEFAULT 0,
+                        comments INTEGER DEFAULT 0,
+                        email_signups INTEGER DEFAULT 0,
+                        click_through_rate REAL
+                    )
+                ''')
+                
+                # Daily per-platform rollup kept current on every write; the
+                # *_posts columns count the non-NULL values behind each sum
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS blog_rollup_daily (
+                        platform TEXT,
+                        day TEXT,
+                        posts INTEGER DEFAULT 0,
+                        views INTEGER DEFAULT 0,
+                        likes INTEGER DEFAULT 0,
+                        shares INTEGER DEFAULT 0,
+                        comments INTEGER DEFAULT 0,
+                        er_posts INTEGER DEFAULT 0,
+                        sum_er REAL DEFAULT 0,
+                        seo_posts INTEGER DEFAULT 0,
+                        sum_seo REAL DEFAULT 0,
+                        PRIMARY KEY (platform, day)
+                    )
+                ''')
+                
+                # seo_metrics predates the seo_score column read by the summary
+                seo_columns = {row['name'] for row in cursor.execute("PRAGMA table_info(seo_metrics)")}
+                if 'seo_score' not in seo_columns:
+                    cursor.execute("ALTER TABLE seo_metrics ADD COLUMN seo_score INTEGER")
+                
+                # Upserts key on (post_id, platform) and (post_id, platform, date); collapse the
+                # duplicates older append-only writes left behind before adding those keys
+                has_unique_keys = cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'uq_ba_post_platform'"
+                ).fetchone() is not None
+                if not has_unique_keys:
+                    # Keep the newest row of each key; rows with a NULL key column are
+                    # never duplicates under a unique index, so they are left alone
+                    cursor.execute('''
+                        DELETE FROM blog_analytics
+                        WHERE post_id IS NOT NULL AND platform IS NOT NULL
+                          AND id NOT IN (
+                            SELECT MAX(id) FROM blog_analytics
+                            WHERE post_id IS NOT NULL AND platform IS NOT NULL
+                            GROUP BY post_id, platform
+                          )
+                    ''')
+                    removed_analytics = cursor.rowcount
+                    if removed_analytics:
+                        # Rebuilt from the remaining rows by the backfill below
+                        cursor.execute("DELETE FROM blog_rollup_daily")
+                    cursor.execute('''
+                        DELETE FROM engagement_tracking
+                        WHERE post_id IS NOT NULL AND platform IS NOT NULL AND date IS NOT NULL
+                          AND id NOT IN (
+                            SELECT MAX(id) FROM engagement_tracking
+                            WHERE post_id IS NOT NULL AND platform IS NOT NULL AND date IS NOT NULL
+                            GROUP BY post_id, platform, date
+                          )
+                    ''')
+                    removed_tracking = cursor.rowcount
+                    logger.warning(
+                        f"Analytics upsert migration removed {removed_analytics} duplicate blog_analytics rows "
+                        f"and {removed_tracking} duplicate engagement_tracking rows, keeping the newest of each"
+                    )
+                    cursor.execute("CREATE UNIQUE INDEX uq_ba_post_platform ON blog_analytics(post_id, platform)")
+                    cursor.execute("CREATE UNIQUE INDEX uq_et_post_platform_date ON engagement_tracking(post_id, platform, date)")
+                    cursor.execute("DROP INDEX IF EXISTS idx_ba_postid_platform")
+                    cursor.execute("DROP INDEX IF EXISTS idx_et_post_date")
+                
+                # A None metric used to turn its rollup cell NULL for good; rebuild those
+                if cursor.execute('''
+                    SELECT 1 FROM blog_rollup_daily
+                    WHERE views IS NULL OR likes IS NULL OR shares IS NULL OR comments IS NULL
+                       OR er_posts IS NULL OR sum_er IS NULL
+                    LIMIT 1
+                ''').fetchone() is not None:
+                    cursor.execute("DELETE FROM blog_rollup_daily")
+                
+                # Backfill the rollup for databases created before it existed
+                if cursor.execute("SELECT 1 FROM blog_rollup_daily LIMIT 1").fetchone() is None:
+                    cursor.execute('''
+                        INSERT INTO blog_rollup_daily
+                        (platform, day, posts, views, likes, shares, comments,
+                         er_posts, sum_er, seo_posts, sum_seo)
+                        SELECT platform, date(created_at), COUNT(*),
+                               TOTAL(views), TOTAL(likes), TOTAL(shares), TOTAL(comments),
+                               COUNT(engagement_rate), TOTAL(engagement_rate),
+                               COUNT(seo_score), TOTAL(seo_score)
+                        FROM blog_analytics
+                        GROUP BY platform, date(created_at)
+                    ''')
+                
+                # Indexes for the date-filtered summaries
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_ba_created ON blog_analytics(created_at)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_ba_platform_created ON blog_analytics(platform, created_at)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_seo_checked ON seo_metrics(checked_at)")
             
             logger.info("Analytics database initialized successfully")
             
@@ -126,31 +482,71 @@ class BlogAnalytics:
         Returns:
             Success status
         """
-        try:
-            conn = sqlite3.connect(self.analytics_db)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT INTO blog_analytics 
-                (post_id, title, platform, url, reading_time, seo_score)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (
-                post_id,
-                title,
-                platform,
-                url,
-                metadata.get('reading_time') if metadata else None,
-                metadata.get('seo_score') if metadata else None
-            ))
-            
-            conn.commit()
-            conn.close()
+        row = (
+            post_id,
+            title,
+            platform,
+            url,
+            metadata.get('reading_time') if metadata else None,
+            metadata.get('seo_score') if metadata else None
+        )
+        
+        if not self.track_blog_posts_bulk([row]):
+            return False
+        
+        logger.info(f"Tracked blog post: {title} on {platform}")
+        return True
+    
+    def track_blog_posts_bulk(self, rows: List[tuple]) -> bool:
+        """
+        Track many published blog posts in one transaction
+        
+        Args:
+            rows: (post_id, title, platform, url, reading_time, seo_score) tuples
             
-            logger.info(f"Tracked blog post: {title} on {platform}")
+        Returns:
+            Success status
+        """
+        try:
+            # Last row wins when a batch repeats a post, as it would with separate calls
+            rows = list({(row[0], row[2]): row for row in rows}.values())
+            
+            with self._transaction() as cursor:
+                # Count new posts into today's rollup cell and move the SEO score of
+                # re-tracked ones; this must run before the upsert below changes them
+                cursor.executemany('''
+                    INSERT INTO blog_rollup_daily (platform, day, posts, seo_posts, sum_seo)
+                    SELECT ?3, COALESCE(date(ba.created_at), date('now')), ba.id IS NULL,
+                           (?6 IS NOT NULL) - (ba.seo_score IS NOT NULL),
+                           COALESCE(?6, 0) - COALESCE(ba.seo_score, 0)
+                    FROM (SELECT 1)
+                    LEFT JOIN blog_analytics ba ON ba.post_id = ?1 AND ba.platform = ?3
+                    WHERE true
+                    ON CONFLICT(platform, day) DO UPDATE SET
+                        posts = posts + excluded.posts,
+                        seo_posts = seo_posts + excluded.seo_posts,
+                        sum_seo = sum_seo + excluded.sum_seo
+                ''', rows)
+                
+                # Re-tracking a post refreshes its details and keeps its engagement counters
+                cursor.executemany('''
+                    INSERT INTO blog_analytics 
+                    (post_id, title, platform, url, reading_time, seo_score)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(post_id, platform) DO UPDATE SET
+                        title = excluded.title,
+                        url = excluded.url,
+                        reading_time = excluded.reading_time,
+                        seo_score = excluded.seo_score,
+                        updated_at = CURRENT_TIMESTAMP
+                ''', rows)
+            
+            self._invalidate_reports()
+            logger.debug(f"Tracked {len(rows)} blog posts")
             return True
             
         except Exception as e:
-            logger.error(f"Failed to track blog post: {e}")
+            logger.error(f"Failed to track blog posts: {e}")
             return False
     
     def update_engagement_metrics(self, post_id: str, platform: str, 
@@ -166,49 +562,99 @@ class BlogAnalytics:
         Returns:
             Success status
         """
-        try:
-            conn = sqlite3.connect(self.analytics_db)
-            cursor = conn.cursor()
+        if not self.update_engagement_metrics_bulk([(post_id, platform, metrics)]):
+            return False
+        
+        logger.debug(f"Updated engagement metrics for {post_id} on {platform}")
+        return True
+    
+    def update_engagement_metrics_bulk(self, updates: List[Tuple[str, str, Dict]]) -> bool:
+        """
+        Update engagement metrics for many blog posts in one transaction
+        
+        Args:
+            updates: (post_id, platform, metrics) tuples
             
-            # Update main analytics table
-            cursor.execute('''
-                UPDATE blog_analytics 
-                SET views = ?, likes = ?, shares = ?, comments = ?,
-                    engagement_rate = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE post_id = ? AND platform = ?
-            ''', (
-                metrics.get('views', 0),
-                metrics.get('likes', 0),
-                metrics.get('shares', 0),
-                metrics.get('comments', 0),
-                metrics.get('engagement_rate', 0.0),
-                post_id,
-                platform
-            ))
+        Returns:
+            Success status
+        """
+        try:
+            today = _today()
             
-            # Update daily engagement tracking
-            today = datetime.now().date().isoformat()
-            cursor.execute('''
-                INSERT OR REPLACE INTO engagement_tracking
-                (post_id, platform, date, views, unique_visitors, 
-                 time_spent, bounce_rate, social_shares, comments, 
-                 click_through_rate)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                post_id, platform, today,
-                metrics.get('views', 0),
-                metrics.get('unique_visitors', 0),
-                metrics.get('time_spent', 0.0),
-                metrics.get('bounce_rate', 0.0),
-                metrics.get('social_shares', 0),
-                metrics.get('comments', 0),
-                metrics.get('click_through_rate', 0.0)
-            ))
+            # Last update wins when a batch repeats a post, as it would with separate calls
+            latest = {(post_id, platform): metrics for post_id, platform, metrics in updates}
             
-            conn.commit()
-            conn.close()
+            analytics_rows = []
+            tracking_rows = []
+            for (post_id, platform), metrics in latest.items():
+                analytics_rows.append(
+                    _analytics_metric_values({**ANALYTICS_METRIC_DEFAULTS, **metrics}) + (post_id, platform)
+                )
+                tracking_rows.append(
+                    (post_id, platform, today) + _tracking_metric_values({**TRACKING_METRIC_UNREPORTED, **metrics})
+                )
             
-            logger.debug(f"Updated engagement metrics for {post_id} on {platform}")
+            with self._transaction() as cursor:
+                # Apply the change against the stored values to each post's rollup cell,
+                # counting posts seen here first; this must run before the upsert below.
+                # Metrics passed as None are stored as NULL and, like in the backfill's
+                # TOTAL() and COUNT(), add nothing to the sums
+                cursor.executemany('''
+                    INSERT INTO blog_rollup_daily
+                    (platform, day, posts, views, likes, shares, comments, er_posts, sum_er)
+                    SELECT ?7, COALESCE(date(ba.created_at), date('now')), ba.id IS NULL,
+                           COALESCE(?1, 0) - COALESCE(ba.views, 0), COALESCE(?2, 0) - COALESCE(ba.likes, 0),
+                           COALESCE(?3, 0) - COALESCE(ba.shares, 0), COALESCE(?4, 0) - COALESCE(ba.comments, 0),
+                           (?5 IS NOT NULL) - (ba.engagement_rate IS NOT NULL),
+                           COALESCE(?5, 0) - COALESCE(ba.engagement_rate, 0)
+                    FROM (SELECT 1)
+                    LEFT JOIN blog_analytics ba ON ba.post_id = ?6 AND ba.platform = ?7
+                    WHERE true
+                    ON CONFLICT(platform, day) DO UPDATE SET
+                        posts = posts + excluded.posts,
+                        views = views + excluded.views,
+                        likes = likes + excluded.likes,
+                        shares = shares + excluded.shares,
+                        comments = comments + excluded.comments,
+                        er_posts = er_posts + excluded.er_posts,
+                        sum_er = sum_er + excluded.sum_er
+                ''', analytics_rows)
+                
+                # Update main analytics table
+                cursor.executemany('''
+                    INSERT INTO blog_analytics
+                    (post_id, platform, views, likes, shares, comments, engagement_rate)
+                    VALUES (?6, ?7, ?1, ?2, ?3, ?4, ?5)
+                    ON CONFLICT(post_id, platform) DO UPDATE SET
+                        views = excluded.views,
+                        likes = excluded.likes,
+                        shares = excluded.shares,
+                        comments = excluded.comments,
+                        engagement_rate = excluded.engagement_rate,
+                        updated_at = CURRENT_TIMESTAMP
+                ''', analytics_rows)
+                
+                # Update daily engagement tracking; a new row defaults unreported
+                # metrics to 0, an existing row keeps its stored values for them
+                cursor.executemany('''
+                    INSERT INTO engagement_tracking
+                    (post_id, platform, date, views, unique_visitors, 
+                     time_spent, bounce_rate, social_shares, comments, 
+                     click_through_rate)
+                    VALUES (?1, ?2, ?3, COALESCE(?4, 0), COALESCE(?5, 0),
+                            COALESCE(?6, 0.0), COALESCE(?7, 0.0), COALESCE(?8, 0), COALESCE(?9, 0),
+                            COALESCE(?10, 0.0))
+                    ON CONFLICT(post_id, platform, date) DO UPDATE SET
+                        views = COALESCE(?4, views),
+                        unique_visitors = COALESCE(?5, unique_visitors),
+                        time_spent = COALESCE(?6, time_spent),
+                        bounce_rate = COALESCE(?7, bounce_rate),
+                        social_shares = COALESCE(?8, social_shares),
+                        comments = COALESCE(?9, comments),
+                        click_through_rate = COALESCE(?10, click_through_rate)
+                ''', tracking_rows)
+            
+            self._invalidate_reports()
             return True
             
         except Exception as e:
@@ -226,21 +672,7 @@ class BlogAnalytics:
             Dictionary with SEO analysis results
         """
         try:
-            # Fetch the webpage content
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
-            }
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            
-            html_content = response.text
-            
-            # Perform SEO analysis
-            seo_analysis = self._perform_seo_analysis(html_content, url)
+            seo_analysis = self._fetch_seo_analysis(url)
             
             # Save results to database
             self._save_seo_analysis(url, seo_analysis)
@@ -251,11 +683,50 @@ class BlogAnalytics:
             logger.error(f"Failed to analyze SEO performance for {url}: {e}")
             return {'error': str(e)}
     
+    def analyze_seo_performance_many(self, urls: List[str]) -> Dict[str, Dict]:
+        """
+        Analyze SEO performance of several URLs, fetching them concurrently
+        
+        Args:
+            urls: URLs to analyze
+            
+        Returns:
+            Dictionary mapping each URL to its SEO analysis results
+        """
+        def fetch(url):
+            try:
+                return self._fetch_seo_analysis(url), True
+            except Exception as e:
+                logger.error(f"Failed to analyze SEO performance for {url}: {e}")
+                return {'error': str(e)}, False
+        
+        with ThreadPoolExecutor(max_workers=min(SEO_FETCH_WORKERS, len(urls) or 1)) as executor:
+            outcomes = dict(zip(urls, executor.map(fetch, urls)))
+        
+        # Save from this thread so the pool threads never open analytics connections
+        for url, (seo_analysis, fetched) in outcomes.items():
+            if fetched:
+                self._save_seo_analysis(url, seo_analysis)
+        
+        return {url: seo_analysis for url, (seo_analysis, _) in outcomes.items()}
+    
+    def _fetch_seo_analysis(self, url: str) -> Dict:
+        """Fetch a page over the shared session and run the SEO checks on it"""
+        if not BS4_AVAILABLE:
+            raise ImportError("beautifulsoup4 is required for SEO analysis")
+        
+        # Fetch the webpage content; response.text decodes with the Content-Type charset
+        response = _SESSION.get(url, headers=SEO_FETCH_HEADERS)
+        response.raise_for_status()
+        
+        html_content = response.text
+        
+        # Perform SEO analysis
+        return self._perform_seo_analysis(html_content, url)
+    
     def _perform_seo_analysis(self, html_content: str, url: str) -> Dict:
         """Perform detailed SEO analysis on HTML content"""
-        from bs4 import BeautifulSoup
-        
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, HTML_PARSER)
         
         analysis = {
             'url': url,
@@ -273,19 +744,39 @@ class BlogAnalytics:
         }
         
         try:
+            # Collect everything the checks below need in one walk of the tree
+            title_tag = None
+            description_tag = None
+            h1_elements = []
+            images = []
+            text_parts = []
+            for element in soup.descendants:
+                element_type = type(element)
+                if element_type is Tag:
+                    name = element.name
+                    if name == 'h1':
+                        h1_elements.append(element)
+                    elif name == 'img':
+                        images.append(element)
+                    elif name == 'title':
+                        if title_tag is None:
+                            title_tag = element
+                    elif name == 'meta' and description_tag is None and element.get('name') == 'description':
+                        description_tag = element
+                elif element_type is NavigableString or element_type is CData:
+                    # Same strings get_text() returns: no comments, scripts or styles
+                    text_parts.append(element)
+            
             # Extract meta title and description
-            title_tag = soup.find('title')
             if title_tag:
                 analysis['meta_title'] = title_tag.get_text().strip()
                 analysis['seo_issues'].append('Missing meta title') if not analysis['meta_title'] else None
             
-            description_tag = soup.find('meta', attrs={'name': 'description'})
             if description_tag:
                 analysis['meta_description'] = description_tag.get('content', '')
             
             # Extract H1 tags
-            h1_tags = soup.find_all('h1')
-            analysis['h1_tags'] = [h1.get_text().strip() for h1 in h1_tags]
+            analysis['h1_tags'] = [h1.get_text().strip() for h1 in h1_elements]
             
             # Check for multiple H1s
             if len(analysis['h1_tags']) == 0:
@@ -296,7 +787,6 @@ class BlogAnalytics:
                 analysis['recommendations'].append('Use only one H1 tag per page')
             
             # Extract image alt tags
-            images = soup.find_all('img')
             images_without_alt = []
             for img in images:
                 alt_text = img.get('alt', '')
@@ -309,10 +799,14 @@ class BlogAnalytics:
                 analysis['seo_issues'].append(f'{len(images_without_alt)} images missing alt text')
                 analysis['recommendations'].append('Add alt text to all images for better accessibility and SEO')
             
-            # Count words
-            text_content = soup.get_text()
-            words = text_content.split()
-            analysis['word_count'] = len(words)
+            # Count words, sentences and terms together
+            word_count, sentences, terms = _scan_text(''.join(text_parts))
+            analysis['word_count'] = word_count
+            if word_count:
+                analysis['keyword_density'] = {
+                    term: round(count / word_count * 100, 2)
+                    for term, count in terms.most_common(KEYWORD_DENSITY_TERMS)
+                }
             
             # Check word count recommendations
             if analysis['word_count'] < 300:
@@ -322,7 +816,6 @@ class BlogAnalytics:
                 analysis['recommendations'].append('Consider breaking long content into multiple pages')
             
             # Calculate readability score (simple estimation)
-            sentences = text_content.count('.') + text_content.count('!') + text_content.count('?')
             avg_words_per_sentence = analysis['word_count'] / max(sentences, 1)
             analysis['readability_score'] = max(0, 100 - (avg_words_per_sentence - 15) * 2)
             
@@ -376,30 +869,28 @@ class BlogAnalytics:
     def _save_seo_analysis(self, url: str, analysis: Dict):
         """Save SEO analysis results to database"""
         try:
-            conn = sqlite3.connect(self.analytics_db)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT INTO seo_metrics
-                (url, meta_title, meta_description, h1_tags, image_alt_tags,
-                 word_count, keyword_density, readability_score, 
-                 performance_score, accessibility_score)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                url,
-                analysis.get('meta_title', ''),
-                analysis.get('meta_description', ''),
-                json.dumps(analysis.get('h1_tags', [])),
-                json.dumps(analysis.get('image_alt_tags', [])),
-                analysis.get('word_count', 0),
-                json.dumps(analysis.get('keyword_density', {})),
-                analysis.get('readability_score', 0.0),
-                analysis.get('performance_score', 0),
-                analysis.get('accessibility_score', 0)
-            ))
-            
-            conn.commit()
-            conn.close()
+            with self._transaction() as cursor:
+                cursor.execute('''
+                    INSERT INTO seo_metrics
+                    (url, meta_title, meta_description, h1_tags, image_alt_tags,
+                     word_count, keyword_density, readability_score, 
+                     performance_score, accessibility_score, seo_score)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (
+                    url,
+                    analysis.get('meta_title', ''),
+                    analysis.get('meta_description', ''),
+                    _json_blob(analysis.get('h1_tags', [])),
+                    _json_blob(analysis.get('image_alt_tags', [])),
+                    analysis.get('word_count', 0),
+                    _json_blob(analysis.get('keyword_density', {})),
+                    analysis.get('readability_score', 0.0),
+                    analysis.get('performance_score', 0),
+                    analysis.get('accessibility_score', 0),
+                    analysis.get('seo_score', 0)
+                ))
+            
+            self._invalidate_reports()
             
         except Exception as e:
             logger.error(f"Failed to save SEO analysis: {e}")
@@ -415,38 +906,49 @@ class BlogAnalytics:
             Dictionary with performance summary
         """
         try:
-            conn = sqlite3.connect(self.analytics_db)
-            cursor = conn.cursor()
-            
-            # Calculate date range
-            end_date = datetime.now().date()
-            start_date = end_date - timedelta(days=days)
-            
-            # Get overall statistics
-            cursor.execute('''
-                SELECT 
-                    COUNT(*) as total_posts,
-                    SUM(views) as total_views,
-                    SUM(likes) as total_likes,
-                    SUM(shares) as total_shares,
-                    SUM(comments) as total_comments,
-                    AVG(engagement_rate) as avg_engagement_rate,
-                    AVG(seo_score) as avg_seo_score
-                FROM blog_analytics
-                WHERE created_at >= ?
-            ''', (start_date.isoformat(),))
-            
-            overall_stats = cursor.fetchone()
-            
-            # Get platform breakdown
+            return self._cached_report(('summary', days), lambda: self._query_performance_summary(days))
+        except Exception as e:
+            logger.error(f"Failed to get performance summary: {e}")
+            return {'error': str(e)}
+    
+    def _query_performance_summary(self, days: int) -> Dict:
+        """Run the summary queries behind get_blog_performance_summary"""
+        # Calculate date range
+        end_date = datetime.now().date()
+        start_date = end_date - timedelta(days=days)
+        
+        # One read snapshot for all queries, so the sections agree with each other
+        with self._transaction("DEFERRED") as cursor:
+            # Per-platform totals from the daily rollup, filtered once, followed by
+            # the overall row (platform NULL) aggregated from the same rows
             cursor.execute('''
-                SELECT platform, COUNT(*) as posts, SUM(views) as views, AVG(seo_score) as avg_seo
-                FROM blog_analytics
-                WHERE created_at >= ?
-                GROUP BY platform
+                WITH filtered AS (
+                    SELECT platform,
+                           SUM(posts) as posts,
+                           SUM(views) as views,
+                           SUM(likes) as likes,
+                           SUM(shares) as shares,
+                           SUM(comments) as comments,
+                           SUM(er_posts) as er_posts,
+                           SUM(sum_er) as sum_er,
+                           SUM(seo_posts) as seo_posts,
+                           SUM(sum_seo) as sum_seo
+                    FROM blog_rollup_daily
+                    WHERE day >= ?
+                    GROUP BY platform
+                )
+                SELECT platform, posts, views, likes, shares, comments,
+                       sum_er / NULLIF(er_posts, 0) as avg_engagement_rate,
+                       sum_seo / NULLIF(seo_posts, 0) as avg_seo_score
+                FROM filtered
+                UNION ALL
+                SELECT NULL, SUM(posts), SUM(views), SUM(likes), SUM(shares), SUM(comments),
+                       SUM(sum_er) / NULLIF(SUM(er_posts), 0),
+                       SUM(sum_seo) / NULLIF(SUM(seo_posts), 0)
+                FROM filtered
             ''', (start_date.isoformat(),))
             
-            platform_stats = cursor.fetchall()
+            *platform_stats, overall_stats = cursor.fetchall()
             
             # Get top performing posts
             cursor.execute('''
@@ -471,56 +973,50 @@ class BlogAnalytics:
             ''', (start_date.isoformat(),))
             
             seo_summary = cursor.fetchone()
-            
-            conn.close()
-            
-            return {
-                'period': {
-                    'start_date': start_date.isoformat(),
-                    'end_date': end_date.isoformat(),
-                    'days': days
-                },
-                'overall_performance': {
-                    'total_posts': overall_stats[0] or 0,
-                    'total_views': overall_stats[1] or 0,
-                    'total_likes': overall_stats[2] or 0,
-                    'total_shares': overall_stats[3] or 0,
-                    'total_comments': overall_stats[4] or 0,
-                    'average_engagement_rate': round(overall_stats[5] or 0, 2),
-                    'average_seo_score': round(overall_stats[6] or 0, 1)
-                },
-                'platform_breakdown': [
-                    {
-                        'platform': row[0],
-                        'posts': row[1],
-                        'total_views': row[2] or 0,
-                        'average_seo_score': round(row[3] or 0, 1)
-                    }
-                    for row in platform_stats
-                ],
-                'top_performing_posts': [
-                    {
-                        'title': row[0],
-                        'platform': row[1],
-                        'views': row[2] or 0,
-                        'likes': row[3] or 0,
-                        'shares': row[4] or 0,
-                        'engagement_rate': round(row[5] or 0, 2),
-                        'seo_score': round(row[6] or 0, 1)
-                    }
-                    for row in top_posts
-                ],
-                'seo_performance': {
-                    'average_seo_score': round(seo_summary[0] or 0, 1),
-                    'average_readability_score': round(seo_summary[1] or 0, 1),
-                    'average_performance_score': round(seo_summary[2] or 0, 1),
-                    'average_accessibility_score': round(seo_summary[3] or 0, 1)
+        
+        return {
+            'period': {
+                'start_date': start_date.isoformat(),
+                'end_date': end_date.isoformat(),
+                'days': days
+            },
+            'overall_performance': {
+                'total_posts': overall_stats['posts'] or 0,
+                'total_views': overall_stats['views'] or 0,
+                'total_likes': overall_stats['likes'] or 0,
+                'total_shares': overall_stats['shares'] or 0,
+                'total_comments': overall_stats['comments'] or 0,
+                'average_engagement_rate': round(overall_stats['avg_engagement_rate'] or 0, 2),
+                'average_seo_score': round(overall_stats['avg_seo_score'] or 0, 1)
+            },
+            'platform_breakdown': [
+                {
+                    'platform': row['platform'],
+                    'posts': row['posts'],
+                    'total_views': row['views'] or 0,
+                    'average_seo_score': round(row['avg_seo_score'] or 0, 1)
+                }
+                for row in platform_stats
+            ],
+            'top_performing_posts': [
+                {
+                    'title': row['title'],
+                    'platform': row['platform'],
+                    'views': row['views'] or 0,
+                    'likes': row['likes'] or 0,
+                    'shares': row['shares'] or 0,
+                    'engagement_rate': round(row['engagement_rate'] or 0, 2),
+                    'seo_score': round(row['seo_score'] or 0, 1)
                 }
+                for row in top_posts
+            ],
+            'seo_performance': {
+                'average_seo_score': round(seo_summary['avg_seo_score'] or 0, 1),
+                'average_readability_score': round(seo_summary['avg_readability'] or 0, 1),
+                'average_performance_score': round(seo_summary['avg_performance'] or 0, 1),
+                'average_accessibility_score': round(seo_summary['avg_accessibility'] or 0, 1)
             }
-            
-        except Exception as e:
-            logger.error(f"Failed to get performance summary: {e}")
-            return {'error': str(e)}
+        }
     
     def get_trending_topics(self, days: int = 30) -> List[Dict]:
         """
@@ -533,64 +1029,53 @@ class BlogAnalytics:
             List of trending topics with engagement data
         """
         try:
-            conn = sqlite3.connect(self.analytics_db)
-            cursor = conn.cursor()
-            
-            # This is a simplified implementation
-            # In a real system, you might extract topics from post titles
-            # and correlate with engagement metrics
-            
-            cursor.execute('''
-                SELECT title, SUM(views) as total_views, COUNT(*) as post_count
-                FROM blog_analytics
-                WHERE created_at >= ?
-                GROUP BY title
-                ORDER BY total_views DESC
-                LIMIT 20
-            ''', (days,))
-            
-            trending_data = cursor.fetchall()
-            
-            # Extract topic keywords (simple implementation)
-            trending_topics = []
-            for title, views, count in trending_data:
-                # Simple keyword extraction
-                words = title.lower().split()
-                topics = [word for word in words if len(word) > 3]
-                
-                for topic in topics:
-                    trending_topics.append({
-                        'topic': topic,
-                        'total_views': views,
-                        'post_count': count
-                    })
-            
-            # Group by topic
-            topic_aggregation = {}
-            for item in trending_topics:
-                topic = item['topic']
-                if topic not in topic_aggregation:
-                    topic_aggregation[topic] = {
-                        'topic': topic,
-                        'total_views': 0,
-                        'post_count': 0
-                    }
-                
-                topic_aggregation[topic]['total_views'] += item['total_views']
-                topic_aggregation[topic]['post_count'] += item['post_count']
-            
-            # Sort by total views
-            result = sorted(topic_aggregation.values(), 
-                          key=lambda x: x['total_views'], 
-                          reverse=True)[:10]
-            
-            conn.close()
-            return result
-            
+            return self._cached_report(('trending', days), lambda: self._query_trending_topics(days))
         except Exception as e:
             logger.error(f"Failed to get trending topics: {e}")
             return []
     
+    def _query_trending_topics(self, days: int) -> List[Dict]:
+        """Run the trending-topic query behind get_trending_topics"""
+        conn = self._conn()
+        cursor = conn.cursor()
+        
+        # This is a simplified implementation
+        # In a real system, you might extract topics from post titles
+        # and correlate with engagement metrics
+        
+        cursor.execute('''
+            SELECT title, SUM(views) as total_views, COUNT(*) as post_count
+            FROM blog_analytics
+            WHERE created_at >= ?
+            GROUP BY title
+            ORDER BY total_views DESC, title
+            LIMIT 20
+        ''', ((datetime.now().date() - timedelta(days=days)).isoformat(),))
+        
+        trending_data = cursor.fetchall()
+        
+        # Extract topic keywords (simple implementation) and aggregate in one pass
+        topic_views = Counter()
+        topic_posts = Counter()
+        for title, views, count in trending_data:
+            if not title:
+                continue
+            # Ordered de-duplication keeps tie order stable across runs
+            topics = dict.fromkeys(word for word in title.lower().split()
+                                   if len(word) > 3 and word not in TOPIC_STOPWORDS)
+            topic_views.update(dict.fromkeys(topics, views or 0))
+            topic_posts.update(dict.fromkeys(topics, count))
+        
+        # Top 10 by total views; ties keep first-seen order like a stable sort
+        return [
+            {
+                'topic': topic,
+                'total_views': views,
+                'post_count': topic_posts[topic]
+            }
+            for topic, views in heapq.nlargest(10, topic_views.items(), key=itemgetter(1))
+        ]
+    
     def generate_performance_report(self, days: int = 30) -> str:
         """
         Generate a comprehensive performance report
@@ -608,59 +1093,31 @@ class BlogAnalytics:
             if 'error' in summary:
                 return f"Error generating report: {summary['error']}"
             
-            report = f"""
-# Blog Performance Report
-**Period:** {summary['period']['start_date']} to {summary['period']['end_date']}
-
-## Overall Performance
-- **Total Posts:** {summary['overall_performance']['total_posts']}
-- **Total Views:** {summary['overall_performance']['total_views']:,}
-- **Total Engagement:**
-  - Likes: {summary['overall_performance']['total_likes']:,}
-  - Shares: {summary['overall_performance']['total_shares']:,}
-  - Comments: {summary['overall_performance']['total_comments']:,}
-- **Average Engagement Rate:** {summary['overall_performance']['average_engagement_rate']}%
-- **Average SEO Score:** {summary['overall_performance']['average_seo_score']}/100
-
-## Platform Performance
-"""
+            parts = []
+            append = parts.append
+            
+            append(REPORT_HEADER_TEMPLATE.format(
+                period=summary['period'],
+                overall=summary['overall_performance']
+            ))
             
             for platform in summary['platform_breakdown']:
-                report += f"""
-### {platform['platform']}
-- Posts: {platform['posts']}
-- Views: {platform['total_views']:,}
-- Average SEO Score: {platform['average_seo_score']}/100
-"""
+                append(REPORT_PLATFORM_TEMPLATE.format(**platform))
             
-            report += "\n## Top Performing Posts\n"
+            append("\n## Top Performing Posts\n")
             for i, post in enumerate(summary['top_performing_posts'][:5], 1):
-                report += f"""
-### {i}. {post['title']}
-- Platform: {post['platform']}
-- Views: {post['views']:,}
-- Likes: {post['likes']:,}
-- Shares: {post['shares']:,}
-- Engagement Rate: {post['engagement_rate']}%
-- SEO Score: {post['seo_score']}/100
-"""
+                append(REPORT_POST_TEMPLATE.format(rank=i, **post))
             
-            report += "\n## SEO Performance Summary\n"
-            seo = summary['seo_performance']
-            report += f"""
-- Average SEO Score: {seo['average_seo_score']}/100
-- Average Readability Score: {seo['average_readability_score']}/100
-- Average Performance Score: {seo['average_performance_score']}/100
-- Average Accessibility Score: {seo['average_accessibility_score']}/100
-"""
+            append("\n## SEO Performance Summary\n")
+            append(REPORT_SEO_TEMPLATE.format(**summary['seo_performance']))
             
-            report += "\n## Trending Topics\n"
+            append("\n## Trending Topics\n")
             for topic in trending_topics:
-                report += f"- **{topic['topic']}**: {topic['total_views']:,} views across {topic['post_count']} posts\n"
+                append(REPORT_TOPIC_TEMPLATE.format(**topic))
             
-            report += f"\n---\n*Report generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*"
+            append(f"\n---\n*Report generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*")
             
-            return report
+            return "".join(parts)
             
         except Exception as e:
             logger.error(f"Failed to generate performance report: {e}")
@@ -737,3 +1194,5 @@ if __name__ == "__main__":
     report = analytics.generate_performance_report(days=30)
     print("\nPerformance Report:")
     print(report)
+    
+    analytics.close()
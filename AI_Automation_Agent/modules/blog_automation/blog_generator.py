@@ -3,48 +3,420 @@ Blog Generator Module
 Handles AI-powered blog content generation using OpenAI
 """
 import openai
+import httpx
+import asyncio
 import json
+import copy
 import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Optional
 from loguru import logger
 from datetime import datetime
+from types import SimpleNamespace
 import random
 
 from config.settings import settings
 
+# orjson parses model replies in native code; its JSONDecodeError subclasses
+# json.JSONDecodeError, so existing handlers catch failures from either parser
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Connection pool for the OpenAI clients shared by every BlogGenerator
+OPENAI_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+# Aho-Corasick counts every keyword in one pass over the content
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Below this many distinct keywords, a few str.count scans beat building an automaton
+AHOCORASICK_MIN_KEYWORDS = 4
+
+# tiktoken enables trimming content to a token budget (BLOG_MAX_CONTENT_TOKENS)
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+# Slug cleanup and hashtag extraction, compiled once at import
+SLUG_STRIP_PATTERN = re.compile(r'[^a-zA-Z0-9\s-]')
+SLUG_DASH_PATTERN = re.compile(r'[-\s]+')
+# Deletes the ASCII characters SLUG_STRIP_PATTERN removes, as one C-level table lookup
+SLUG_STRIP_TABLE = {
+    code: None for code in range(128)
+    if not (chr(code).isalnum() or chr(code).isspace() or chr(code) == '-')
+}
+HASHTAG_PATTERN = re.compile(r'#(\w+)')
+
+# First non-blank line that is not a heading or bullet
+FIRST_PARAGRAPH_PATTERN = re.compile(r'^(?![#-])[^\n]*?\S[^\n]*$', re.MULTILINE)
+
+# OpenAI batch states after which a batch will not change any more
+BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+# Most completion tokens a model accepts in max_tokens, matched by model-name prefix
+# (longest first); unknown models get the conservative default
+MODEL_COMPLETION_TOKEN_LIMITS = {
+    "gpt-4o-mini": 16384,
+    "gpt-4o": 16384,
+    "gpt-4-turbo": 4096,
+    "gpt-4": 8192,
+    "gpt-3.5-turbo": 4096,
+}
+DEFAULT_COMPLETION_TOKEN_LIMIT = 4096
+
+# Prompt scaffolding, built once; requests only .format() the variable slots. The
+# indentation is part of the prompt text the model has always been sent, so it stays
+_WRITER_SYSTEM_PROMPT = "You are an expert content writer who creates engaging, well-structured blog posts."
+_STRATEGIST_SYSTEM_PROMPT = "You are an expert content strategist who creates logical, engaging blog series."
+
+_BLOG_PROMPT = """
+        Create a high-quality blog post about "{topic}" for {audience}.
+        
+        Requirements:
+        - Maximum {max_words} words
+        - Writing style: {tone}
+        - Structure: {structure}
+        - Include an engaging title
+        - Add relevant subheadings (H2, H3)
+        - Include 3-5 relevant tags
+        - Make it SEO-friendly with natural keyword usage
+        - Focus on 2025 trends and developments
+        - Provide actionable insights or practical value
+        
+        Format your response as a JSON object with this structure:
+        {{
+            "title": "Compelling blog post title",
+            "content": "Full blog post content with markdown formatting",
+            "tags": ["tag1", "tag2", "tag3", "tag4", "tag5"],
+            "meta_description": "Brief description for SEO (150-160 characters)",
+            "word_count": actual_word_count
+        }}
+        """
+
+_BLOG_GROUP_PROMPT = """
+        Create {count} high-quality blog posts for {audience}, one for each topic below.
+        
+{topic_list}
+        
+        Requirements for each post:
+        - Maximum {max_words} words
+        - Writing style: {tone}
+        - Structure: {structure}
+        - Include an engaging title
+        - Add relevant subheadings (H2, H3)
+        - Include 3-5 relevant tags
+        - Make it SEO-friendly with natural keyword usage
+        - Focus on 2025 trends and developments
+        - Provide actionable insights or practical value
+        
+        Format your response as a JSON array with one object per topic, in the same order:
+        [
+            {{
+                "title": "Compelling blog post title",
+                "content": "Full blog post content with markdown formatting",
+                "tags": ["tag1", "tag2", "tag3", "tag4", "tag5"],
+                "meta_description": "Brief description for SEO (150-160 characters)",
+                "word_count": actual_word_count
+            }}
+        ]
+        """
+
+_SERIES_PROMPT = """
+        Create a detailed plan for a blog series about "{topic}".
+        
+        Requirements:
+        - Generate {num_posts} related subtopics
+        - Each subtopic should be unique and build on the previous one
+        - Topics should progress from basic concepts to advanced applications
+        - Make topics specific enough to write detailed blog posts about
+        - Focus on 2025 developments and trends
+        
+        Format your response as a JSON array of strings:
+        ["Subtopic 1", "Subtopic 2", "Subtopic 3", ...]
+        """
+
+
+def _completion_token_limit(model: str) -> int:
+    """Largest max_tokens value the given model accepts"""
+    for prefix in sorted(MODEL_COMPLETION_TOKEN_LIMITS, key=len, reverse=True):
+        if model.startswith(prefix):
+            return MODEL_COMPLETION_TOKEN_LIMITS[prefix]
+    return DEFAULT_COMPLETION_TOKEN_LIMIT
+
+
+@lru_cache(maxsize=None)
+def _token_encoding(model: str):
+    """Return the tiktoken encoding for a model, loaded once per model"""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Models tiktoken does not know yet use the current chat encoding
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def _end_at_sentence(text: str) -> str:
+    """End trimmed text at its last sentence boundary, or mark it as cut with an ellipsis
+    
+    Only the last 20% is searched, so nothing is cut too much and the rest of the
+    text is never scanned.
+    """
+    search_start = int(len(text) * 0.8) + 1
+    end_pos = max(text.rfind(terminator, search_start) for terminator in '.!?')
+    if end_pos != -1:
+        return text[:end_pos + 1]
+    
+    return text + "..."
+
+
+class _ApiScheduler:
+    """
+    Paces async OpenAI calls against per-minute request and token budgets and
+    retries rate-limited calls with exponential backoff
+    
+    Capacity refills continuously, as in the OpenAI cookbook's parallel request
+    processor. State is plain numbers under a thread lock, so one scheduler can
+    serve calls from several event loops.
+    """
+    
+    def __init__(self, max_rpm: int, max_tpm: int, max_attempts: int):
+        self.max_rpm = max(1, max_rpm)
+        self.max_tpm = max(1, max_tpm)
+        self.max_attempts = max(1, max_attempts)
+        self.available_requests = float(self.max_rpm)
+        self.available_tokens = float(self.max_tpm)
+        self.last_refill = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _estimate_tokens(request: Dict) -> int:
+        # Roughly four characters per prompt token, plus the full completion budget
+        prompt_chars = sum(len(message["content"]) for message in request["messages"])
+        return prompt_chars // 4 + request.get("max_tokens", 0)
+    
+    def _try_reserve(self, tokens: int) -> float:
+        """Reserve capacity for one call; return 0 on success or the seconds to wait"""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self.last_refill
+            self.last_refill = now
+            self.available_requests = min(self.max_rpm, self.available_requests + self.max_rpm * elapsed / 60)
+            self.available_tokens = min(self.max_tpm, self.available_tokens + self.max_tpm * elapsed / 60)
+            
+            if now < self.paused_until:
+                return self.paused_until - now
+            if self.available_requests >= 1 and self.available_tokens >= tokens:
+                self.available_requests -= 1
+                self.available_tokens -= tokens
+                return 0.0
+            
+            # Time until both budgets have refilled enough for this call
+            missing_requests = max(0.0, 1 - self.available_requests) * 60 / self.max_rpm
+            missing_tokens = max(0.0, tokens - self.available_tokens) * 60 / self.max_tpm
+            return max(missing_requests, missing_tokens)
+    
+    async def call(self, create, request: Dict):
+        """Await create(**request) once capacity allows, retrying on rate-limit errors"""
+        tokens = min(self._estimate_tokens(request), self.max_tpm)
+        backoff = 1.0
+        
+        for attempt in range(1, self.max_attempts + 1):
+            wait = self._try_reserve(tokens)
+            while wait > 0:
+                await asyncio.sleep(wait)
+                wait = self._try_reserve(tokens)
+            
+            try:
+                return await create(**request)
+            except openai.RateLimitError:
+                if attempt == self.max_attempts:
+                    raise
+                logger.warning(f"OpenAI rate limit hit, retrying in {backoff:.0f}s (attempt {attempt}/{self.max_attempts})")
+                # Hold back every caller, not just this one, while the limit resets
+                with self._lock:
+                    self.paused_until = max(self.paused_until, time.monotonic() + backoff)
+                backoff *= 2
+
+
+class _JsonObjectScanner:
+    """Finds where a streamed top-level JSON object closes, ignoring braces inside strings"""
+    
+    def __init__(self):
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        # Decided by the first non-blank character; replies not starting with '{' are read to the end
+        self.active = None
+    
+    def feed(self, piece: str) -> int:
+        """Consume the next piece of text; return the index in it where the object closed, or -1"""
+        for index, char in enumerate(piece):
+            if self.active is None:
+                if char.isspace():
+                    continue
+                self.active = char == '{'
+            if not self.active:
+                return -1
+            
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == '\\':
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char == '{':
+                self.depth += 1
+            elif char == '}':
+                self.depth -= 1
+                if self.depth == 0:
+                    return index
+        
+        return -1
+
+
+def _seo_score_kernel(word_count: int, heading_count: int, avg_density: float) -> int:
+    """SEO score (0-100) from precomputed content statistics"""
+    score = 50  # Base score
+    
+    # Word count bonus
+    if 300 <= word_count <= 1500:
+        score += 20
+    elif word_count < 300:
+        score -= 10
+    
+    # Heading structure bonus
+    if heading_count >= 3:
+        score += 15
+    elif heading_count >= 2:
+        score += 10
+    
+    # Keyword optimization
+    if 1 <= avg_density <= 2.5:
+        score += 15
+    elif avg_density > 3:
+        score -= 10
+    
+    return min(100, max(0, score))
+
+
+def _count_keywords(text: str, keywords: List[str]) -> Dict[str, int]:
+    """Non-overlapping occurrence count of each keyword in text, as str.count reports it"""
+    patterns = set(keywords)
+    if not AHOCORASICK_AVAILABLE or len(patterns) < AHOCORASICK_MIN_KEYWORDS or '' in patterns:
+        return {pattern: text.count(pattern) for pattern in patterns}
+    
+    automaton = ahocorasick.Automaton()
+    for pattern in patterns:
+        automaton.add_word(pattern, pattern)
+    automaton.make_automaton()
+    
+    # The automaton reports overlapping matches in end order; skip any that start
+    # inside the previous counted match of the same keyword, as str.count does
+    counts = dict.fromkeys(patterns, 0)
+    last_end = dict.fromkeys(patterns, -1)
+    for end, pattern in automaton.iter(text):
+        if end - len(pattern) >= last_end[pattern]:
+            counts[pattern] += 1
+            last_end[pattern] = end
+    
+    return counts
+
+
+def _run_coroutine_sync(coro):
+    """Run a coroutine to completion from synchronous code, even inside a running event loop"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    
+    # asyncio.run cannot nest, so give the coroutine its own loop on a worker thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
 
 class BlogGenerator:
     """
     AI-powered blog post generator using OpenAI GPT
     """
     
+    # Clients and rate-limit scheduler shared by all instances, created on first use
+    _shared_client = None
+    _shared_aclient = None
+    _shared_api_scheduler = None
+    _shared_lock = threading.Lock()
+    
     def __init__(self):
         """Initialize the blog generator with OpenAI configuration"""
-        self.client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
+        self.client, self.aclient, self._api_scheduler = self._get_shared_clients()
         self.model = settings.AI_MODEL
         self.max_tokens = settings.MAX_TOKENS
         self.temperature = settings.TEMPERATURE
         
-        # Blog templates for different styles
+        # Recently generated posts by request, so retries and repeated topics within
+        # BLOG_CONTENT_CACHE_TTL skip the API call; entries are (expires_at, post)
+        self._content_cache = OrderedDict()
+        self._content_cache_lock = threading.Lock()
+        
+        # Blog templates for different styles, read as template.tone / template.structure
         self.blog_templates = {
-            "informative": {
-                "structure": "introduction,main_points,conclusion",
-                "tone": "professional and educational"
-            },
-            "casual": {
-                "structure": "hook,story,insights,call_to_action",
-                "tone": "conversational and friendly"
-            },
-            "technical": {
-                "structure": "overview,technical_details,implementation,conclusion",
-                "tone": "detailed and precise"
-            },
-            "how_to": {
-                "structure": "introduction,step_by_step_guide,troubleshooting,tips",
-                "tone": "instructional and clear"
-            }
+            "informative": SimpleNamespace(
+                structure="introduction,main_points,conclusion",
+                tone="professional and educational"
+            ),
+            "casual": SimpleNamespace(
+                structure="hook,story,insights,call_to_action",
+                tone="conversational and friendly"
+            ),
+            "technical": SimpleNamespace(
+                structure="overview,technical_details,implementation,conclusion",
+                tone="detailed and precise"
+            ),
+            "how_to": SimpleNamespace(
+                structure="introduction,step_by_step_guide,troubleshooting,tips",
+                tone="instructional and clear"
+            )
         }
     
+    @classmethod
+    def _get_shared_clients(cls):
+        """Return the process-wide OpenAI clients and scheduler, creating them once
+        
+        Generators created per request reuse the same keep-alive connection pool
+        instead of opening new connections, and all of them draw on one rate-limit
+        budget, which OpenAI enforces per API key.
+        """
+        with cls._shared_lock:
+            if cls._shared_client is None:
+                cls._shared_client = openai.OpenAI(
+                    api_key=settings.OPENAI_API_KEY,
+                    http_client=httpx.Client(limits=OPENAI_HTTP_LIMITS)
+                )
+                cls._shared_aclient = openai.AsyncOpenAI(
+                    api_key=settings.OPENAI_API_KEY,
+                    http_client=httpx.AsyncClient(limits=OPENAI_HTTP_LIMITS)
+                )
+                cls._shared_api_scheduler = _ApiScheduler(
+                    settings.OPENAI_MAX_RPM, settings.OPENAI_MAX_TPM, settings.OPENAI_MAX_ATTEMPTS
+                )
+            return cls._shared_client, cls._shared_aclient, cls._shared_api_scheduler
+    
     def generate_blog(self, topic: str, max_words: int = 800, 
                      target_audience: str = "general", 
                      style: str = "informative") -> Dict:
@@ -61,19 +433,19 @@ class BlogGenerator:
             Dictionary containing blog data
         """
         try:
-            # Validate inputs
-            if not topic.strip():
-                raise ValueError("Topic cannot be empty")
+            style = self._validate_blog_request(topic, style)
             
-            if style not in self.blog_templates:
-                logger.warning(f"Unknown style '{style}', using 'informative'")
-                style = "informative"
+            cache_key = (topic, max_words, target_audience, style, self.model)
+            cached = self._get_cached_blog(cache_key)
+            if cached is not None:
+                return cached
             
             # Generate blog content
             blog_data = self._generate_content(topic, max_words, target_audience, style)
             
             # Process and enhance the content
             processed_data = self._process_blog_content(blog_data, topic)
+            self._cache_blog(cache_key, processed_data)
             
             logger.info(f"Successfully generated blog post: '{processed_data['title']}'")
             return processed_data
@@ -82,61 +454,195 @@ class BlogGenerator:
             logger.error(f"Error generating blog post: {e}")
             raise
     
-    def _generate_content(self, topic: str, max_words: int, 
-                         target_audience: str, style: str) -> Dict:
-        """Generate raw content using OpenAI"""
+    async def agenerate_blog(self, topic: str, max_words: int = 800,
+                             target_audience: str = "general",
+                             style: str = "informative",
+                             aclient: Optional[openai.AsyncOpenAI] = None) -> Dict:
+        """
+        Async counterpart of generate_blog, for generating several posts concurrently
         
-        template = self.blog_templates[style]
+        Args:
+            topic: The main topic for the blog post
+            max_words: Maximum word count for the blog
+            target_audience: Who the blog is written for
+            style: Writing style (informative, casual, technical, how_to)
+            aclient: Async OpenAI client to use instead of self.aclient
+            
+        Returns:
+            Dictionary containing blog data
+        """
+        try:
+            style = self._validate_blog_request(topic, style)
+            
+            cache_key = (topic, max_words, target_audience, style, self.model)
+            cached = self._get_cached_blog(cache_key)
+            if cached is not None:
+                return cached
+            
+            # Generate blog content
+            blog_data = await self._agenerate_content(
+                topic, max_words, target_audience, style, aclient or self.aclient
+            )
+            
+            # Process and enhance the content
+            processed_data = self._process_blog_content(blog_data, topic)
+            self._cache_blog(cache_key, processed_data)
+            
+            logger.info(f"Successfully generated blog post: '{processed_data['title']}'")
+            return processed_data
+            
+        except Exception as e:
+            logger.error(f"Error generating blog post: {e}")
+            raise
+    
+    def _get_cached_blog(self, key: tuple) -> Optional[Dict]:
+        """Return a copy of a still-fresh cached post for this request, if any"""
+        with self._content_cache_lock:
+            entry = self._content_cache.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._content_cache[key]
+                return None
+            self._content_cache.move_to_end(key)
+            post = entry[1]
         
-        prompt = f"""
-        Create a high-quality blog post about "{topic}" for {target_audience}.
+        logger.info(f"Using cached blog post: '{post['title']}'")
+        return copy.deepcopy(post)
+    
+    def _cache_blog(self, key: tuple, post: Dict):
+        """Remember a generated post, evicting the least recently used beyond BLOG_CONTENT_CACHE_SIZE"""
+        if settings.BLOG_CONTENT_CACHE_SIZE <= 0 or settings.BLOG_CONTENT_CACHE_TTL <= 0:
+            return
         
-        Requirements:
-        - Maximum {max_words} words
-        - Writing style: {template['tone']}
-        - Structure: {template['structure']}
-        - Include an engaging title
-        - Add relevant subheadings (H2, H3)
-        - Include 3-5 relevant tags
-        - Make it SEO-friendly with natural keyword usage
-        - Focus on 2025 trends and developments
-        - Provide actionable insights or practical value
+        entry = (time.monotonic() + settings.BLOG_CONTENT_CACHE_TTL, copy.deepcopy(post))
+        with self._content_cache_lock:
+            self._content_cache[key] = entry
+            self._content_cache.move_to_end(key)
+            while len(self._content_cache) > settings.BLOG_CONTENT_CACHE_SIZE:
+                self._content_cache.popitem(last=False)
+    
+    def _validate_blog_request(self, topic: str, style: str) -> str:
+        """Validate generation inputs and return the style to use"""
+        if not topic.strip():
+            raise ValueError("Topic cannot be empty")
         
-        Format your response as a JSON object with this structure:
-        {{
-            "title": "Compelling blog post title",
-            "content": "Full blog post content with markdown formatting",
-            "tags": ["tag1", "tag2", "tag3", "tag4", "tag5"],
-            "meta_description": "Brief description for SEO (150-160 characters)",
-            "word_count": actual_word_count
-        }}
-        """
+        if style not in self.blog_templates:
+            logger.warning(f"Unknown style '{style}', using 'informative'")
+            style = "informative"
         
+        return style
+    
+    def _generate_content(self, topic: str, max_words: int, 
+                         target_audience: str, style: str) -> Dict:
+        """Generate raw content using OpenAI"""
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert content writer who creates engaging, well-structured blog posts."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=self.max_tokens,
-                temperature=self.temperature
+            stream = self.client.chat.completions.create(
+                **self._content_request(topic, max_words, target_audience, style),
+                stream=True
             )
             
-            # Parse the response
-            content = response.choices[0].message.content
-            blog_data = json.loads(content)
+            # Read deltas until the reply's JSON object closes, then drop the stream
+            scanner = _JsonObjectScanner()
+            parts = []
+            try:
+                for chunk in stream:
+                    piece = chunk.choices[0].delta.content if chunk.choices else None
+                    if not piece:
+                        continue
+                    end = scanner.feed(piece)
+                    if end != -1:
+                        parts.append(piece[:end + 1])
+                        break
+                    parts.append(piece)
+            finally:
+                stream.close()
+        except Exception as e:
+            logger.error(f"OpenAI API error: {e}")
+            raise
+        
+        return self._parse_content_response(''.join(parts), topic)
+    
+    async def _agenerate_content(self, topic: str, max_words: int,
+                                 target_audience: str, style: str,
+                                 aclient: openai.AsyncOpenAI) -> Dict:
+        """Generate raw content using the async OpenAI client"""
+        try:
+            stream = await self._api_scheduler.call(
+                aclient.chat.completions.create,
+                {**self._content_request(topic, max_words, target_audience, style), "stream": True}
+            )
             
-            return blog_data
+            # Other series posts run while this one waits for its next delta
+            scanner = _JsonObjectScanner()
+            parts = []
+            try:
+                async for chunk in stream:
+                    piece = chunk.choices[0].delta.content if chunk.choices else None
+                    if not piece:
+                        continue
+                    end = scanner.feed(piece)
+                    if end != -1:
+                        parts.append(piece[:end + 1])
+                        break
+                    parts.append(piece)
+            finally:
+                await stream.close()
+        except Exception as e:
+            logger.error(f"OpenAI API error: {e}")
+            raise
+        
+        return self._parse_content_response(''.join(parts), topic)
+    
+    def _content_request(self, topic: str, max_words: int,
+                         target_audience: str, style: str) -> Dict:
+        """Build the chat completion arguments for one blog post"""
+        template = self.blog_templates[style]
+        prompt = _BLOG_PROMPT.format(
+            topic=topic, audience=target_audience, max_words=max_words,
+            tone=template.tone, structure=template.structure
+        )
+        
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": _WRITER_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature
+        }
+    
+    def _content_group_request(self, topics: List[str], max_words: int,
+                               target_audience: str, style: str) -> Dict:
+        """Build the chat completion arguments for several blog posts in one reply"""
+        template = self.blog_templates[style]
+        topic_list = "\n".join(f'        {i}. "{topic}"' for i, topic in enumerate(topics, 1))
+        prompt = _BLOG_GROUP_PROMPT.format(
+            count=len(topics), audience=target_audience, topic_list=topic_list, max_words=max_words,
+            tone=template.tone, structure=template.structure
+        )
+        
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": _WRITER_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            # Each post gets the single-post token budget, up to what the model can return
+            "max_tokens": min(self.max_tokens * len(topics), _completion_token_limit(self.model)),
+            "temperature": self.temperature
+        }
+    
+    def _parse_content_response(self, content: str, topic: str) -> Dict:
+        """Parse the model's JSON reply, falling back to plain-text extraction"""
+        try:
+            return _json_loads(content)
             
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse AI response as JSON: {e}")
             # Fallback to extract content from non-JSON response
             return self._extract_content_from_text(content, topic)
-            
-        except Exception as e:
-            logger.error(f"OpenAI API error: {e}")
-            raise
     
     def _extract_content_from_text(self, content: str, topic: str) -> Dict:
         """Extract blog data from non-JSON response"""
@@ -145,8 +651,7 @@ class BlogGenerator:
         
         # Try to find tags in the content
         tags = []
-        tag_pattern = r'#(\w+)'
-        tag_matches = re.findall(tag_pattern, content)
+        tag_matches = HASHTAG_PATTERN.findall(content)
         if tag_matches:
             tags = tag_matches[:5]
         else:
@@ -162,8 +667,9 @@ class BlogGenerator:
             "word_count": len(content.split())
         }
     
-    def _process_blog_content(self, blog_data: Dict, topic: str) -> Dict:
-        """Process and enhance blog content"""
+    def _process_blog_content(self, blog_data: Dict, topic: str,
+                              created_at: Optional[str] = None) -> Dict:
+        """Process and enhance blog content; posts produced together can share one created_at"""
         
         # Clean and format content
         content = blog_data['content'].strip()
@@ -171,10 +677,15 @@ class BlogGenerator:
         # Ensure proper heading structure
         content = self._ensure_heading_structure(content)
         
+        # Apply the token budget first when one is configured
+        if settings.BLOG_MAX_CONTENT_TOKENS and TIKTOKEN_AVAILABLE:
+            content = self._trim_content_tokens(content, settings.BLOG_MAX_CONTENT_TOKENS)
+        
         # Add metadata
-        word_count = len(content.split())
+        words = content.split()
+        word_count = len(words)
         if word_count > settings.BLOG_MAX_LENGTH:
-            content = self._trim_content(content, settings.BLOG_MAX_LENGTH)
+            content = self._trim_content(content, settings.BLOG_MAX_LENGTH, words)
             word_count = settings.BLOG_MAX_LENGTH
         
         # Generate slug from title
@@ -186,7 +697,7 @@ class BlogGenerator:
             'content': content,
             'word_count': word_count,
             'slug': slug,
-            'created_at': datetime.now().isoformat(),
+            'created_at': created_at or datetime.now().isoformat(),
             'topic': topic,
             'is_auto_generated': True,
             'status': 'draft'
@@ -202,48 +713,61 @@ class BlogGenerator:
         for line in lines:
             line = line.strip()
             
-            # If line looks like a heading but doesn't have #, add it
-            if (line and 
-                len(line) > 10 and 
-                len(line) < 100 and 
-                not line.startswith('#') and
-                not line.startswith('-') and
-                not line.startswith('*') and
-                line.endswith(':')):
+            # If line looks like a heading but doesn't have #, add it; the length
+            # bound guarantees the first/last character checks have a character to test
+            if 10 < len(line) < 100 and line[-1] == ':' and line[0] not in '#-*':
                 processed_lines.append(f"## {line}")
             else:
                 processed_lines.append(line)
         
         return '\n'.join(processed_lines)
     
-    def _trim_content(self, content: str, max_words: int) -> str:
-        """Trim content to specified word count"""
-        words = content.split()
+    def _trim_content(self, content: str, max_words: int,
+                      words: Optional[List[str]] = None) -> str:
+        """Trim content to specified word count, reusing content.split() if the caller has it"""
+        if words is None:
+            words = content.split()
         if len(words) <= max_words:
             return content
         
         trimmed_words = words[:max_words]
         
         # Try to end at a sentence boundary
-        trimmed_text = ' '.join(trimmed_words)
-        last_period = trimmed_text.rfind('.')
-        last_exclamation = trimmed_text.rfind('!')
-        last_question = trimmed_text.rfind('?')
+        return _end_at_sentence(' '.join(trimmed_words))
+    
+    def _trim_content_tokens(self, content: str, max_tokens: int) -> str:
+        """
+        Trim content to a token budget for the configured model
         
-        end_pos = max(last_period, last_exclamation, last_question)
-        if end_pos > len(trimmed_text) * 0.8:  # Don't cut too much
-            return trimmed_text[:end_pos + 1]
+        Slices token ids rather than words, so the limit matches what the API
+        bills and the original line breaks are kept.
         
-        return trimmed_text + "..."
+        Args:
+            content: The blog post content
+            max_tokens: Maximum number of tokens to keep
+            
+        Returns:
+            Content ending at a sentence boundary within the budget
+        """
+        encoding = _token_encoding(self.model)
+        tokens = encoding.encode(content)
+        if len(tokens) <= max_tokens:
+            return content
+        
+        return _end_at_sentence(encoding.decode(tokens[:max_tokens]))
     
     def _generate_slug(self, title: str) -> str:
         """Generate URL-friendly slug from title"""
         # Convert to lowercase
         slug = title.lower()
         
-        # Replace spaces and special characters with hyphens
-        slug = re.sub(r'[^a-zA-Z0-9\s-]', '', slug)
-        slug = re.sub(r'[-\s]+', '-', slug)
+        # Replace spaces and special characters with hyphens; titles are almost
+        # always ASCII, where the translate table does the stripping
+        if slug.isascii():
+            slug = slug.translate(SLUG_STRIP_TABLE)
+        else:
+            slug = SLUG_STRIP_PATTERN.sub('', slug)
+        slug = SLUG_DASH_PATTERN.sub('-', slug)
         
         # Remove leading/trailing hyphens
         slug = slug.strip('-')
@@ -254,6 +778,9 @@ class BlogGenerator:
         """
         Generate a series of related blog posts
         
+        Offline jobs that can wait for the Batch API call generate_blog_series_batch
+        explicitly; this method always returns as soon as the posts are written.
+        
         Args:
             main_topic: Main topic for the series
             num_posts: Number of posts to generate
@@ -261,27 +788,79 @@ class BlogGenerator:
         Returns:
             List of blog post dictionaries
         """
+        return _run_coroutine_sync(self._generate_blog_series_with_own_client(main_topic, num_posts))
+    
+    async def _generate_blog_series_with_own_client(self, main_topic: str, num_posts: int) -> List[Dict]:
+        # Pooled connections are tied to the event loop that opened them, so a
+        # loop created just for this call gets a client that closes with it
+        async with openai.AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            http_client=httpx.AsyncClient(limits=OPENAI_HTTP_LIMITS)
+        ) as aclient:
+            return await self.agenerate_blog_series(main_topic, num_posts, aclient=aclient)
+    
+    async def agenerate_blog_series(self, main_topic: str, num_posts: int = 5,
+                                    aclient: Optional[openai.AsyncOpenAI] = None) -> List[Dict]:
+        """
+        Generate a series of related blog posts, requesting the posts concurrently
+        
+        Args:
+            main_topic: Main topic for the series
+            num_posts: Number of posts to generate
+            aclient: Async OpenAI client to use instead of self.aclient
+            
+        Returns:
+            List of blog post dictionaries in series order
+        """
         try:
             # Generate subtopics for the series
-            series_plan = self._generate_series_plan(main_topic, num_posts)
+            series_plan = await self._agenerate_series_plan(main_topic, num_posts, aclient or self.aclient)
             
-            blog_series = []
-            for i, subtopic in enumerate(series_plan, 1):
-                logger.info(f"Generating blog {i}/{num_posts}: {subtopic}")
-                
-                blog_post = self.generate_blog(
-                    topic=subtopic,
-                    max_words=int(settings.BLOG_MAX_LENGTH * 0.8),  # Slightly shorter for series
-                    target_audience="general",
-                    style="informative"
-                )
-                
-                # Add series metadata
-                blog_post['series_position'] = i
-                blog_post['series_topic'] = main_topic
-                blog_post['series_slug'] = f"{main_topic.lower().replace(' ', '-')}-part-{i}"
+            # Bound in-flight requests to stay under the API rate limit
+            semaphore = asyncio.Semaphore(max(1, settings.MAX_CONCURRENT_REQUESTS))
+            
+            # Posts requested together in one completion; one post per request by default
+            positions = list(enumerate(series_plan, 1))
+            group_size = max(1, settings.BLOG_SERIES_POSTS_PER_REQUEST)
+            groups = [positions[start:start + group_size] for start in range(0, len(positions), group_size)]
+            
+            async def generate_group(group: List) -> List[Dict]:
+                async with semaphore:
+                    for i, subtopic in group:
+                        logger.info(f"Generating blog {i}/{num_posts}: {subtopic}")
+                    
+                    blog_posts = await self._agenerate_blog_group(
+                        [subtopic for _, subtopic in group],
+                        max_words=int(settings.BLOG_MAX_LENGTH * 0.8),  # Slightly shorter for series
+                        target_audience="general",
+                        style="informative",
+                        aclient=aclient
+                    )
                 
-                blog_series.append(blog_post)
+                return [
+                    self._add_series_metadata(blog_post, main_topic, i)
+                    for (i, _), blog_post in zip(group, blog_posts)
+                ]
+            
+            results = await asyncio.gather(
+                *(generate_group(group) for group in groups),
+                return_exceptions=True
+            )
+            
+            # Keep the posts that succeeded; a series with no posts is an error
+            blog_series = []
+            failures = []
+            failed_posts = 0
+            for group, result in zip(groups, results):
+                if isinstance(result, BaseException):
+                    failures.append(result)
+                    failed_posts += len(group)
+                else:
+                    blog_series.extend(result)
+            if failures:
+                logger.warning(f"{failed_posts} of {len(positions)} series posts failed to generate")
+                if not blog_series:
+                    raise failures[0]
             
             logger.info(f"Successfully generated blog series: {len(blog_series)} posts")
             return blog_series
@@ -290,47 +869,212 @@ class BlogGenerator:
             logger.error(f"Error generating blog series: {e}")
             raise
     
-    def _generate_series_plan(self, main_topic: str, num_posts: int) -> List[str]:
-        """Generate subtopics for a blog series"""
+    async def _agenerate_blog_group(self, topics: List[str], max_words: int,
+                                    target_audience: str, style: str,
+                                    aclient: Optional[openai.AsyncOpenAI] = None) -> List[Dict]:
+        """Generate posts for several topics with one completion, in topic order"""
+        style = self._validate_blog_request(topics[0], style)
+        cache_keys = [(topic, max_words, target_audience, style, self.model) for topic in topics]
+        blog_posts = [self._get_cached_blog(key) for key in cache_keys]
+        missing = [index for index, blog_post in enumerate(blog_posts) if blog_post is None]
         
-        prompt = f"""
-        Create a detailed plan for a blog series about "{main_topic}".
-        
-        Requirements:
-        - Generate {num_posts} related subtopics
-        - Each subtopic should be unique and build on the previous one
-        - Topics should progress from basic concepts to advanced applications
-        - Make topics specific enough to write detailed blog posts about
-        - Focus on 2025 developments and trends
+        if len(missing) == 1:
+            index = missing[0]
+            blog_posts[index] = await self.agenerate_blog(
+                topics[index], max_words, target_audience, style, aclient=aclient
+            )
+        elif missing:
+            missing_topics = [topics[index] for index in missing]
+            items = None
+            try:
+                response = await self._api_scheduler.call(
+                    (aclient or self.aclient).chat.completions.create,
+                    self._content_group_request(missing_topics, max_words, target_audience, style)
+                )
+                items = _json_loads(response.choices[0].message.content)
+            except json.JSONDecodeError as e:
+                logger.error(f"Failed to parse grouped AI response as JSON: {e}")
+            except openai.RateLimitError:
+                raise
+            except Exception as e:
+                # e.g. a grouped request the model rejects; the per-post requests are smaller
+                logger.error(f"Grouped OpenAI request failed: {e}")
+            
+            usable = (
+                isinstance(items, list) and len(items) == len(missing) and
+                all(isinstance(item, dict) and 'title' in item and 'content' in item for item in items)
+            )
+            if not usable:
+                # Fall back to one request per post rather than guess at the mapping
+                logger.warning(f"Grouped reply for {len(missing)} posts unusable, generating them individually")
+                for index in missing:
+                    blog_posts[index] = await self.agenerate_blog(
+                        topics[index], max_words, target_audience, style, aclient=aclient
+                    )
+            else:
+                created_at = datetime.now().isoformat()
+                for index, blog_data in zip(missing, items):
+                    processed_data = self._process_blog_content(blog_data, topics[index], created_at)
+                    self._cache_blog(cache_keys[index], processed_data)
+                    blog_posts[index] = processed_data
+                    logger.info(f"Successfully generated blog post: '{processed_data['title']}'")
         
-        Format your response as a JSON array of strings:
-        ["Subtopic 1", "Subtopic 2", "Subtopic 3", ...]
+        return blog_posts
+    
+    def generate_blog_series_batch(self, main_topic: str, num_posts: int = 5) -> List[Dict]:
         """
+        Generate a series of related blog posts through the OpenAI Batch API
+        
+        Batch jobs are billed at a discount and sit outside the per-minute rate
+        limits, but complete asynchronously; this call blocks until the batch ends,
+        which can take up to BLOG_BATCH_TIMEOUT, so it is only for offline jobs.
         
+        Args:
+            main_topic: Main topic for the series
+            num_posts: Number of posts to generate
+            
+        Returns:
+            List of blog post dictionaries in series order
+        """
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert content strategist who creates logical, engaging blog series."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=500,
-                temperature=0.7
+            # Generate subtopics for the series
+            series_plan = self._generate_series_plan(main_topic, num_posts)
+            max_words = int(settings.BLOG_MAX_LENGTH * 0.8)  # Slightly shorter for series
+            
+            # One chat completion request per post, keyed by series position
+            batch_lines = [
+                json.dumps({
+                    "custom_id": f"post-{i}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": self._content_request(subtopic, max_words, "general", "informative")
+                })
+                for i, subtopic in enumerate(series_plan, 1)
+            ]
+            batch_file = self.client.files.create(
+                file=("blog_series.jsonl", "\n".join(batch_lines).encode("utf-8")),
+                purpose="batch"
+            )
+            batch = self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
             )
+            logger.info(f"Submitted blog series batch {batch.id}: {main_topic} ({len(batch_lines)} posts)")
             
-            content = response.choices[0].message.content
-            series_plan = json.loads(content)
+            batch = self._wait_for_batch(batch.id)
             
-            if not isinstance(series_plan, list) or len(series_plan) != num_posts:
-                # Fallback to simple subtopic generation
-                return self._generate_simple_series_plan(main_topic, num_posts)
+            # Collect the reply text of each successful request
+            replies = {}
+            for line in self.client.files.content(batch.output_file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                record = _json_loads(line)
+                response = record.get("response") or {}
+                if record.get("error") or response.get("status_code") != 200:
+                    logger.warning(f"Batch request {record.get('custom_id')} failed: {record.get('error') or response.get('status_code')}")
+                    continue
+                replies[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
             
-            return series_plan
+            blog_series = []
+            created_at = datetime.now().isoformat()
+            for i, subtopic in enumerate(series_plan, 1):
+                content = replies.get(f"post-{i}")
+                if content is None:
+                    logger.warning(f"No batch result for blog {i}/{num_posts}: {subtopic}")
+                    continue
+                
+                blog_data = self._parse_content_response(content, subtopic)
+                blog_post = self._process_blog_content(blog_data, subtopic, created_at)
+                blog_series.append(self._add_series_metadata(blog_post, main_topic, i))
+            
+            if not blog_series:
+                raise RuntimeError(f"Batch {batch.id} returned no usable blog posts")
+            
+            logger.info(f"Successfully generated blog series: {len(blog_series)} posts")
+            return blog_series
+            
+        except Exception as e:
+            logger.error(f"Error generating blog series batch: {e}")
+            raise
+    
+    def _wait_for_batch(self, batch_id: str):
+        """Poll a batch until it finishes, cancelling it after BLOG_BATCH_TIMEOUT seconds"""
+        deadline = time.monotonic() + settings.BLOG_BATCH_TIMEOUT
+        
+        while True:
+            batch = self.client.batches.retrieve(batch_id)
+            if batch.status in BATCH_TERMINAL_STATUSES:
+                break
+            
+            if time.monotonic() >= deadline:
+                self.client.batches.cancel(batch_id)
+                raise TimeoutError(f"Batch {batch_id} did not finish within {settings.BLOG_BATCH_TIMEOUT}s")
+            
+            time.sleep(settings.BLOG_BATCH_POLL_INTERVAL)
+        
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"Batch {batch_id} ended with status '{batch.status}'")
+        
+        return batch
+    
+    def _add_series_metadata(self, blog_post: Dict, main_topic: str, position: int) -> Dict:
+        """Attach series position and slug to a generated post"""
+        blog_post['series_position'] = position
+        blog_post['series_topic'] = main_topic
+        blog_post['series_slug'] = f"{main_topic.lower().replace(' ', '-')}-part-{position}"
+        return blog_post
+    
+    def _generate_series_plan(self, main_topic: str, num_posts: int) -> List[str]:
+        """Generate subtopics for a blog series"""
+        try:
+            response = self.client.chat.completions.create(
+                **self._series_plan_request(main_topic, num_posts)
+            )
+            return self._parse_series_plan(response.choices[0].message.content, main_topic, num_posts)
             
         except Exception as e:
             logger.warning(f"Failed to generate series plan: {e}")
             return self._generate_simple_series_plan(main_topic, num_posts)
     
+    async def _agenerate_series_plan(self, main_topic: str, num_posts: int,
+                                     aclient: openai.AsyncOpenAI) -> List[str]:
+        """Generate subtopics for a blog series using the async OpenAI client"""
+        try:
+            response = await self._api_scheduler.call(
+                aclient.chat.completions.create,
+                self._series_plan_request(main_topic, num_posts)
+            )
+            return self._parse_series_plan(response.choices[0].message.content, main_topic, num_posts)
+            
+        except Exception as e:
+            logger.warning(f"Failed to generate series plan: {e}")
+            return self._generate_simple_series_plan(main_topic, num_posts)
+    
+    def _series_plan_request(self, main_topic: str, num_posts: int) -> Dict:
+        """Build the chat completion arguments for a series plan"""
+        prompt = _SERIES_PROMPT.format(topic=main_topic, num_posts=num_posts)
+        
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": _STRATEGIST_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            "max_tokens": 500,
+            "temperature": 0.7
+        }
+    
+    def _parse_series_plan(self, content: str, main_topic: str, num_posts: int) -> List[str]:
+        """Parse the model's JSON subtopic list, falling back to the simple plan"""
+        series_plan = _json_loads(content)
+        
+        if not isinstance(series_plan, list) or len(series_plan) != num_posts:
+            # Fallback to simple subtopic generation
+            return self._generate_simple_series_plan(main_topic, num_posts)
+        
+        return series_plan
+    
     def _generate_simple_series_plan(self, main_topic: str, num_posts: int) -> List[str]:
         """Simple fallback series plan generator"""
         base_plan = [
@@ -360,13 +1104,17 @@ class BlogGenerator:
             Dictionary with SEO optimization data
         """
         try:
-            # Analyze keyword density
+            # Analyze keyword density; the content statistics are computed once and
+            # shared by the recommendations and the score
             content_lower = blog_content.lower()
+            word_count = len(blog_content.split())
+            heading_count = blog_content.count('#')
+            keyword_counts = _count_keywords(content_lower, [keyword.lower() for keyword in keywords])
             keyword_analysis = {}
             
             for keyword in keywords:
-                keyword_count = content_lower.count(keyword.lower())
-                keyword_density = (keyword_count / len(blog_content.split())) * 100
+                keyword_count = keyword_counts[keyword.lower()]
+                keyword_density = (keyword_count / word_count) * 100
                 
                 keyword_analysis[keyword] = {
                     'count': keyword_count,
@@ -383,14 +1131,15 @@ class BlogGenerator:
                 recommendations.append("Some keywords may be overused - consider reducing density")
             
             # Check for headings with keywords
-            heading_count = blog_content.count('#')
             if heading_count < 3:
                 recommendations.append("Add more subheadings to improve content structure")
             
             return {
                 'keyword_analysis': keyword_analysis,
                 'recommendations': recommendations,
-                'seo_score': self._calculate_seo_score(blog_content, keyword_analysis),
+                'seo_score': self._calculate_seo_score(
+                    blog_content, keyword_analysis, word_count=word_count, heading_count=heading_count
+                ),
                 'optimized_content': self._add_seo_enhancements(blog_content, keywords)
             }
             
@@ -398,53 +1147,31 @@ class BlogGenerator:
             logger.error(f"Error optimizing for SEO: {e}")
             return {'error': str(e)}
     
-    def _calculate_seo_score(self, content: str, keyword_analysis: Dict) -> int:
-        """Calculate SEO score (0-100)"""
-        score = 50  # Base score
-        
-        # Word count bonus
-        word_count = len(content.split())
-        if 300 <= word_count <= 1500:
-            score += 20
-        elif word_count < 300:
-            score -= 10
-        
-        # Heading structure bonus
-        heading_count = content.count('#')
-        if heading_count >= 3:
-            score += 15
-        elif heading_count >= 2:
-            score += 10
-        
-        # Keyword optimization
+    def _calculate_seo_score(self, content: str, keyword_analysis: Dict,
+                             word_count: Optional[int] = None,
+                             heading_count: Optional[int] = None) -> int:
+        """Calculate SEO score (0-100), reusing word and heading counts the caller already has"""
+        if word_count is None:
+            word_count = len(content.split())
+        if heading_count is None:
+            heading_count = content.count('#')
         avg_density = sum(data['density'] for data in keyword_analysis.values()) / len(keyword_analysis)
-        if 1 <= avg_density <= 2.5:
-            score += 15
-        elif avg_density > 3:
-            score -= 10
         
-        return min(100, max(0, score))
+        return _seo_score_kernel(word_count, heading_count, avg_density)
     
     def _add_seo_enhancements(self, content: str, keywords: List[str]) -> str:
         """Add SEO enhancements to content"""
         enhanced_content = content
         
         # Add keywords to first paragraph if not present
-        lines = enhanced_content.split('\n')
-        first_paragraph_idx = -1
-        
-        for i, line in enumerate(lines):
-            if line.strip() and not line.startswith('#') and not line.startswith('-'):
-                first_paragraph_idx = i
-                break
+        first_paragraph = FIRST_PARAGRAPH_PATTERN.search(content) if keywords else None
         
-        if first_paragraph_idx != -1 and keywords:
-            first_line = lines[first_paragraph_idx]
-            if not any(keyword.lower() in first_line.lower() for keyword in keywords[:2]):
-                # Add first keyword naturally to first paragraph
-                enhanced_lines = lines.copy()
-                enhanced_lines[first_paragraph_idx] = f"{first_line} Understanding {keywords[0]} is crucial."
-                enhanced_content = '\n'.join(enhanced_lines)
+        if first_paragraph:
+            first_line = first_paragraph.group().lower()
+            if not any(keyword.lower() in first_line for keyword in keywords[:2]):
+                # Add first keyword naturally to first paragraph, splicing at the end of that line
+                end = first_paragraph.end()
+                enhanced_content = f"{content[:end]} Understanding {keywords[0]} is crucial.{content[end:]}"
         
         return enhanced_content
 
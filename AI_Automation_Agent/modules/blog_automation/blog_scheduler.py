@@ -2,28 +2,121 @@
 Blog Scheduler Module
 Handles automated scheduling and publishing of blog posts
 """
-import schedule
+import asyncio
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from functools import cached_property
 from typing import Dict, List, Optional, Callable
 from loguru import logger
+import itertools
 import json
+import os
 import queue
+import random
 
-from config.settings import settings
+from config.settings import settings, DB_KIND_MONGODB, DB_KIND_MYSQL
 from .blog_generator import BlogGenerator
 from .content_publisher import PublisherManager
 from config.database import get_collection
 
 # Only import MySQL functions if using MySQL
-if settings.DATABASE_TYPE.lower() == "mysql":
+if settings._db_kind == DB_KIND_MYSQL:
     from config.database import get_mysql_session, BlogPost
 else:
     # For MongoDB, use None for MySQL-specific functions
     get_mysql_session = None
     BlogPost = None
 
+# orjson encodes straight to bytes in native code; the stdlib encoder is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def _json_bytes(value) -> bytes:
+    """Encode a value as compact UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(',', ':')).encode()
+
+# Seconds between background saves of changed statistics while the scheduler runs
+STATS_FLUSH_INTERVAL = 30
+
+# Without MongoDB, statistics live in a compact snapshot plus an append-only log of
+# changed fields; the log is folded into the snapshot on load and on stop
+STATS_FILE = "blog_stats.json"
+STATS_LOG_FILE = "blog_stats.log"
+
+WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+# Used when a job is scheduled without topics
+DEFAULT_TOPICS = ("artificial intelligence", "technology trends", "programming", "web development")
+
+# Example trending topics returned until curation reads real sources
+TRENDING_TOPICS = (
+    "AI in healthcare 2025",
+    "Sustainable technology solutions",
+    "Remote work technology",
+    "Cybersecurity trends",
+    "Cloud computing advances",
+    "Machine learning applications",
+    "Blockchain technology updates",
+    "Internet of Things innovations"
+)
+
+
+class _ScheduledJob:
+    """A recurring job and the local wall-clock time it runs next"""
+    
+    def __init__(self, job_func: Callable, unit: str, interval: int = 1,
+                 time_str: Optional[str] = None, day_of_week: Optional[str] = None):
+        self.job_func = job_func
+        self.unit = unit  # "days", "weeks" or "hours"
+        self.interval = interval
+        # Invalid times and day names raise ValueError here, when the job is added
+        self.at_time = datetime.strptime(time_str, "%H:%M").time() if time_str else None
+        self.weekday = WEEKDAYS.index(day_of_week.lower()) if day_of_week else None
+        self.next_run = self._next_after(datetime.now())
+    
+    def _next_after(self, now: datetime) -> datetime:
+        if self.unit == "hours":
+            return now + timedelta(hours=self.interval)
+        
+        next_run = datetime.combine(now.date(), self.at_time)
+        if self.unit == "weeks":
+            next_run += timedelta(days=(self.weekday - now.weekday()) % 7)
+        if next_run <= now:
+            next_run += timedelta(days=7 if self.unit == "weeks" else 1)
+        return next_run
+    
+    def advance(self):
+        """Move next_run past the run that is starting now"""
+        self.next_run = self._next_after(max(datetime.now(), self.next_run))
+
+
+class _RateLimiter:
+    """Spaces calls from any number of threads at least 1/rate seconds apart"""
+    
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+    
+    def wait(self):
+        """Block until this caller's slot; the first call goes straight through"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
 
 class BlogScheduler:
     """
@@ -37,6 +130,21 @@ class BlogScheduler:
         self.is_running = False
         self.scheduler_thread = None
         
+        # The backend is fixed for the process, so resolve it once
+        self._is_mongo = settings._db_kind == DB_KIND_MONGODB
+        
+        # Jobs run on a private event loop: each arms one timer for its next run,
+        # so the thread sleeps until something is due instead of polling
+        self._loop = None
+        self._jobs = []
+        self._jobs_lock = threading.Lock()
+        
+        # Private generator for topic selection, independent of the shared random state
+        self._rng = random.Random()
+        
+        # Paces publish requests when series posts are published concurrently
+        self._publish_limiter = _RateLimiter(settings.BLOG_PUBLISH_MAX_RPS)
+        
         # Queue for scheduled tasks
         self.task_queue = queue.Queue()
         
@@ -49,50 +157,115 @@ class BlogScheduler:
             'last_generation': None,
             'last_publication': None
         }
+        # Counter updates only mark the stats dirty; _flush_statistics persists
+        # them once per job, periodically while running, and on stop
+        self._stats_dirty = False
+        self._stats_lock = threading.Lock()
+        self._stats_fp = None
         
         # Load saved statistics if available
         self._load_statistics()
+        # Last persisted values, so each save appends only what changed
+        self._saved_stats = dict(self.stats)
         
         # Setup default publishers if configured
         self._setup_default_publishers()
     
+    # Collection handles are looked up once and reused. The stats handle is first
+    # needed by _load_statistics in __init__, the posts handle by the first save
+    @cached_property
+    def _posts_collection(self):
+        return get_collection("blog_posts")
+    
+    @cached_property
+    def _stats_collection(self):
+        return get_collection("blog_statistics")
+    
     def _load_statistics(self):
         """Load statistics from database"""
         try:
-            if settings.DATABASE_TYPE.lower() == "mongodb":
-                collection = get_collection("blog_statistics")
-                stats_doc = collection.find_one({"type": "scheduler_stats"})
+            if self._is_mongo:
+                stats_doc = self._stats_collection.find_one({"type": "scheduler_stats"})
                 if stats_doc:
                     self.stats.update(stats_doc.get('stats', {}))
             else:
-                # For MySQL, we'll store in a simple JSON file for now
-                import os
-                stats_file = "blog_stats.json"
-                if os.path.exists(stats_file):
-                    with open(stats_file, 'r') as f:
-                        saved_stats = json.load(f)
+                # For MySQL, replay the change log over the last snapshot
+                if os.path.exists(STATS_FILE):
+                    with open(STATS_FILE, 'rb') as f:
+                        saved_stats = _json_loads(f.read())
                         self.stats.update(saved_stats)
+                if os.path.exists(STATS_LOG_FILE):
+                    with open(STATS_LOG_FILE, 'rb') as f:
+                        for line in f:
+                            try:
+                                self.stats.update(_json_loads(line)['stats'])
+                            except (ValueError, KeyError):
+                                # A crash can leave the last record half-written
+                                continue
+                    self._compact_statistics()
         except Exception as e:
             logger.warning(f"Could not load statistics: {e}")
     
-    def _save_statistics(self):
-        """Save statistics to database"""
+    def _save_statistics(self) -> bool:
+        """
+        Save statistics to database
+        
+        Returns:
+            Whether the statistics were saved (or had nothing new to save)
+        """
         try:
-            if settings.DATABASE_TYPE.lower() == "mongodb":
-                collection = get_collection("blog_statistics")
-                collection.update_one(
+            if self._is_mongo:
+                self._stats_collection.update_one(
                     {"type": "scheduler_stats"},
                     {"$set": {"stats": self.stats, "updated_at": datetime.now()}},
                     upsert=True
                 )
             else:
-                # For MySQL, save to JSON file
-                import os
-                stats_file = "blog_stats.json"
-                with open(stats_file, 'w') as f:
-                    json.dump(self.stats, f, indent=2)
+                # For MySQL, append the fields that changed since the last save;
+                # stats hold absolute values, so replaying the log is idempotent
+                changes = {key: value for key, value in self.stats.items() if self._saved_stats.get(key) != value}
+                if not changes:
+                    return True
+                if self._stats_fp is None:
+                    self._stats_fp = open(STATS_LOG_FILE, 'ab', buffering=8192)
+                self._stats_fp.write(_json_bytes({"ts": datetime.now().isoformat(), "stats": changes}) + b"\n")
+                self._stats_fp.flush()
+                self._saved_stats.update(changes)
+            return True
         except Exception as e:
             logger.warning(f"Could not save statistics: {e}")
+            return False
+    
+    def _compact_statistics(self):
+        """Write the current statistics as the snapshot file and start an empty change log"""
+        if self._is_mongo:
+            return
+        
+        try:
+            with self._stats_lock:
+                if self._stats_fp is not None:
+                    self._stats_fp.close()
+                    self._stats_fp = None
+                
+                # Written aside and renamed so a crash mid-write never truncates the snapshot
+                with open(f"{STATS_FILE}.tmp", 'wb') as f:
+                    f.write(_json_bytes(self.stats))
+                os.replace(f"{STATS_FILE}.tmp", STATS_FILE)
+                
+                # Every logged value is now in the snapshot
+                if os.path.exists(STATS_LOG_FILE):
+                    os.remove(STATS_LOG_FILE)
+                self._saved_stats = dict(self.stats)
+                self._stats_dirty = False
+        except Exception as e:
+            logger.warning(f"Could not compact statistics: {e}")
+    
+    def _flush_statistics(self):
+        """Save statistics if they changed since the last save"""
+        with self._stats_lock:
+            # Left dirty on failure so the next flush retries the save
+            if self._stats_dirty and self._save_statistics():
+                self._stats_dirty = False
     
     def _setup_default_publishers(self):
         """Setup default publishers based on environment variables"""
@@ -137,15 +310,20 @@ class BlogScheduler:
             Success status
         """
         try:
+            # Each run takes the next topic in order
+            run_counter = itertools.count()
+            
             def daily_blog_job():
                 self._generate_and_publish_blog(
                     topics=topics,
                     max_words=max_words,
                     publish_immediately=publish_immediately,
-                    platforms=platforms
+                    platforms=platforms,
+                    topic_index=next(run_counter)
                 )
+                self._flush_statistics()
             
-            schedule.every().day.at(time_str).do(daily_blog_job)
+            self._add_job(_ScheduledJob(daily_blog_job, "days", time_str=time_str))
             logger.info(f"Scheduled daily blog generation at {time_str}")
             return True
             
@@ -180,7 +358,9 @@ class BlogScheduler:
                     platforms=platforms
                 )
             
-            schedule.every().week.on(getattr(schedule.every(), day_of_week.lower())).do(weekly_series_job)
+            self._add_job(_ScheduledJob(
+                weekly_series_job, "weeks", time_str=settings.BLOG_GENERATION_TIME, day_of_week=day_of_week
+            ))
             logger.info(f"Scheduled weekly blog series for {day_of_week}")
             return True
             
@@ -209,7 +389,7 @@ class BlogScheduler:
                     max_articles=max_articles
                 )
             
-            schedule.every(frequency_hours).hours.do(curation_job)
+            self._add_job(_ScheduledJob(curation_job, "hours", interval=frequency_hours))
             logger.info(f"Scheduled content curation every {frequency_hours} hours")
             return True
             
@@ -220,7 +400,8 @@ class BlogScheduler:
     def _generate_and_publish_blog(self, topics: List[str], 
                                   max_words: int,
                                   publish_immediately: bool,
-                                  platforms: List[str] = None) -> Dict:
+                                  platforms: List[str] = None,
+                                  topic_index: Optional[int] = None) -> Dict:
         """
         Generate and optionally publish a blog post
         
@@ -229,13 +410,14 @@ class BlogScheduler:
             max_words: Maximum word count
             publish_immediately: Whether to publish immediately
             platforms: Platforms to publish to
+            topic_index: Run number for round-robin topic rotation; random if None
             
         Returns:
             Dictionary with generation and publishing results
         """
         try:
             # Select topic (rotate or random)
-            topic = self._select_topic(topics)
+            topic = self._select_topic(topics, topic_index)
             
             logger.info(f"Generating blog for topic: {topic}")
             
@@ -253,7 +435,7 @@ class BlogScheduler:
             # Update statistics
             self.stats['total_generated'] += 1
             self.stats['last_generation'] = datetime.now().isoformat()
-            self._save_statistics()
+            self._stats_dirty = True
             
             publish_result = {'success': False}
             
@@ -268,7 +450,7 @@ class BlogScheduler:
             else:
                 self.stats['failed_publications'] += 1
             
-            self._save_statistics()
+            self._stats_dirty = True
             
             return {
                 'generation_success': True,
@@ -279,7 +461,7 @@ class BlogScheduler:
         except Exception as e:
             logger.error(f"Failed to generate and publish blog: {e}")
             self.stats['failed_generations'] += 1
-            self._save_statistics()
+            self._stats_dirty = True
             return {
                 'generation_success': False,
                 'error': str(e)
@@ -304,26 +486,49 @@ class BlogScheduler:
         try:
             logger.info(f"Generating blog series: {main_topic} ({num_posts} posts)")
             
-            # Generate series
-            blog_series = self.blog_generator.generate_blog_series(
-                main_topic=main_topic,
-                num_posts=num_posts
-            )
+            # Large series go through the Batch API when a threshold is configured;
+            # the scheduler thread can wait for it, unlike a request handler
+            threshold = settings.BLOG_BATCH_WORD_THRESHOLD
+            if threshold and num_posts * int(settings.BLOG_MAX_LENGTH * 0.8) >= threshold:
+                blog_series = self.blog_generator.generate_blog_series_batch(
+                    main_topic=main_topic,
+                    num_posts=num_posts
+                )
+            else:
+                blog_series = self.blog_generator.generate_blog_series(
+                    main_topic=main_topic,
+                    num_posts=num_posts
+                )
             
             results = []
             published_count = 0
             
+            # Save the whole series in one round trip; posts that failed to save
+            # are reported and skipped below
+            try:
+                save_errors = self._save_blogs_to_database(blog_series)
+            except Exception as e:
+                save_errors = dict.fromkeys(range(len(blog_series)), str(e))
+            
+            # Publishing is network-bound, so saved posts are published concurrently
+            publish_results = {}
+            if publish_immediately:
+                publish_results = self._publish_blogs_concurrently(
+                    {index: blog_data for index, blog_data in enumerate(blog_series) if index not in save_errors},
+                    platforms
+                )
+            
             for i, blog_data in enumerate(blog_series, 1):
                 try:
-                    # Save to database
-                    self._save_blog_to_database(blog_data)
+                    if i - 1 in save_errors:
+                        raise Exception(f"Failed to save blog to database: {save_errors[i - 1]}")
                     
                     # Update statistics
                     self.stats['total_generated'] += 1
                     
                     # Publish if requested
                     if publish_immediately:
-                        publish_result = self._publish_blog(blog_data, platforms)
+                        publish_result = publish_results[i - 1]
                         
                         if publish_result['success']:
                             published_count += 1
@@ -338,10 +543,6 @@ class BlogScheduler:
                         'blog_data': blog_data
                     })
                     
-                    # Small delay between posts to avoid rate limiting
-                    if publish_immediately and i < len(blog_series):
-                        time.sleep(2)
-                    
                 except Exception as e:
                     logger.error(f"Failed to process post {i} in series: {e}")
                     results.append({
@@ -352,7 +553,8 @@ class BlogScheduler:
                     self.stats['failed_generations'] += 1
             
             self.stats['last_generation'] = datetime.now().isoformat()
-            self._save_statistics()
+            self._stats_dirty = True
+            self._flush_statistics()
             
             return {
                 'series_success': True,
@@ -421,68 +623,131 @@ class BlogScheduler:
                 'curation_success': False,
                 'error': str(e)
             }
+        finally:
+            self._flush_statistics()
     
-    def _select_topic(self, topics: List[str]) -> str:
-        """Select a topic from the list (implement rotation logic)"""
+    def _select_topic(self, topics: List[str], index: Optional[int] = None) -> str:
+        """Select a topic round-robin by run index, or at random without one"""
         if not topics:
             # Default topics if none provided
-            topics = ["artificial intelligence", "technology trends", "programming", "web development"]
+            topics = DEFAULT_TOPICS
         
-        # Simple round-robin selection
-        import random
-        return random.choice(topics)
+        if index is not None:
+            return topics[index % len(topics)]
+        return self._rng.choice(topics)
     
     def _extract_topics_from_sources(self, sources: List[str], max_articles: int) -> List[str]:
         """Extract trending topics from content sources"""
         # This would integrate with news APIs, RSS feeds, etc.
         # For now, return some example trending topics
-        
-        trending_topics = [
-            "AI in healthcare 2025",
-            "Sustainable technology solutions",
-            "Remote work technology",
-            "Cybersecurity trends",
-            "Cloud computing advances",
-            "Machine learning applications",
-            "Blockchain technology updates",
-            "Internet of Things innovations"
-        ]
-        
-        return trending_topics[:max_articles]
+        return list(TRENDING_TOPICS[:max_articles])
     
     def _save_blog_to_database(self, blog_data: Dict):
         """Save blog post to database"""
+        save_errors = self._save_blogs_to_database([blog_data])
+        if save_errors:
+            raise Exception(save_errors[0])
+    
+    def _save_blogs_to_database(self, blog_posts: List[Dict]) -> Dict[int, str]:
+        """
+        Save several blog posts with a single insert and commit
+        
+        Args:
+            blog_posts: Blog post dictionaries to save
+            
+        Returns:
+            Error message by index for posts that could not be saved; empty if all were saved
+        """
+        if not blog_posts:
+            return {}
+        
         try:
-            if settings.DATABASE_TYPE.lower() == "mongodb":
-                collection = get_collection("blog_posts")
-                blog_data['saved_at'] = datetime.now()
-                result = collection.insert_one(blog_data)
-                logger.debug(f"Saved blog to MongoDB with ID: {result.inserted_id}")
+            if self._is_mongo:
+                # Raised by unordered insert_many when only some documents fail
+                from pymongo.errors import BulkWriteError
                 
-            elif settings.DATABASE_TYPE.lower() == "mysql" and get_mysql_session and BlogPost:
-                # MySQL implementation
+                collection = self._posts_collection
+                saved_at = datetime.now()
+                for blog_data in blog_posts:
+                    blog_data['saved_at'] = saved_at
+                
+                # Unordered, so one rejected document does not stop the rest
+                try:
+                    result = collection.insert_many(blog_posts, ordered=False)
+                except BulkWriteError as e:
+                    save_errors = {
+                        error['index']: error.get('errmsg', 'write error')
+                        for error in e.details.get('writeErrors', [])
+                    }
+                    logger.error(f"Failed to save {len(save_errors)} of {len(blog_posts)} blogs to MongoDB")
+                    return save_errors
+                logger.debug(f"Saved {len(result.inserted_ids)} blogs to MongoDB")
+                
+            elif get_mysql_session and BlogPost:
+                # This thread's scoped session; connections come from the shared
+                # engine pool and the whole batch is one transaction
                 session = get_mysql_session()
                 
-                blog_post = BlogPost(
-                    title=blog_data['title'],
-                    content=blog_data['content'],
-                    topic=blog_data.get('topic', 'general'),
-                    status=blog_data.get('status', 'draft'),
-                    word_count=blog_data.get('word_count', 0),
-                    tags=json.dumps(blog_data.get('tags', [])),
-                    is_auto_generated=True,
-                    source_url=blog_data.get('source_url')
-                )
+                blog_post_rows = [
+                    BlogPost(
+                        title=blog_data['title'],
+                        content=blog_data['content'],
+                        topic=blog_data.get('topic', 'general'),
+                        status=blog_data.get('status', 'draft'),
+                        word_count=blog_data.get('word_count', 0),
+                        tags=blog_data.get('tags', []),
+                        is_auto_generated=True,
+                        source_url=blog_data.get('source_url')
+                    )
+                    for blog_data in blog_posts
+                ]
                 
-                session.add(blog_post)
-                session.commit()
-                logger.debug(f"Saved blog to MySQL with ID: {blog_post.id}")
+                try:
+                    session.bulk_save_objects(blog_post_rows)
+                    session.commit()
+                except Exception:
+                    # Leave this thread's session usable for the next save
+                    session.rollback()
+                    raise
+                logger.debug(f"Saved {len(blog_post_rows)} blogs to MySQL")
             else:
                 logger.warning(f"Unsupported database type or missing MySQL dependencies: {settings.DATABASE_TYPE}")
                 
         except Exception as e:
             logger.error(f"Failed to save blog to database: {e}")
             raise
+        
+        return {}
+    
+    def _publish_blogs_concurrently(self, blog_posts: Dict[int, Dict],
+                                    platforms: List[str] = None) -> Dict[int, Dict]:
+        """
+        Publish several blog posts from a thread pool, pacing request starts
+        
+        Args:
+            blog_posts: Blog post dictionaries keyed by their position in the series
+            platforms: Platforms to publish to
+            
+        Returns:
+            Publish result for each key of blog_posts
+        """
+        if not blog_posts:
+            return {}
+        
+        def publish(blog_data: Dict) -> Dict:
+            # Keeps platforms from rate limiting a burst of posts
+            self._publish_limiter.wait()
+            return self._publish_blog(blog_data, platforms)
+        
+        publish_results = {}
+        max_workers = max(1, min(settings.MAX_CONCURRENT_REQUESTS, len(blog_posts)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(publish, blog_data): index for index, blog_data in blog_posts.items()}
+            # _publish_blog reports failures in its result rather than raising
+            for future in as_completed(futures):
+                publish_results[futures[future]] = future.result()
+        
+        return publish_results
     
     def _publish_blog(self, blog_data: Dict, platforms: List[str] = None) -> Dict:
         """Publish blog to specified platforms"""
@@ -515,6 +780,45 @@ class BlogScheduler:
             logger.error(f"Failed to publish blog: {e}")
             return {'success': False, 'error': str(e)}
     
+    def _add_job(self, job: _ScheduledJob):
+        """Register a job, arming its timer right away if the scheduler is running"""
+        with self._jobs_lock:
+            self._jobs.append(job)
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._arm_job, job)
+    
+    def _arm_job(self, job: _ScheduledJob):
+        delay = max(0.0, (job.next_run - datetime.now()).total_seconds())
+        asyncio.get_running_loop().call_later(delay, self._fire_job, job)
+    
+    def _fire_job(self, job: _ScheduledJob):
+        if job not in self._jobs:
+            return
+        # A long timer can wake early if the wall clock was adjusted; wait out the rest
+        if job.next_run > datetime.now():
+            self._arm_job(job)
+            return
+        
+        job.advance()
+        self._arm_job(job)
+        
+        # Jobs run one at a time on the scheduler thread, as they always have
+        try:
+            job.job_func()
+        except Exception as e:
+            logger.error(f"Scheduled job {job.job_func} failed: {e}")
+    
+    def _flush_statistics_periodically(self):
+        self._flush_statistics()
+        asyncio.get_running_loop().call_later(STATS_FLUSH_INTERVAL, self._flush_statistics_periodically)
+    
+    def _run_loop(self, loop: asyncio.AbstractEventLoop):
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+    
     def start(self):
         """Start the scheduler"""
         if self.is_running:
@@ -523,12 +827,15 @@ class BlogScheduler:
         
         self.is_running = True
         
-        def scheduler_loop():
-            while self.is_running:
-                schedule.run_pending()
-                time.sleep(1)
+        loop = asyncio.new_event_loop()
+        with self._jobs_lock:
+            # The loop is not running yet, so plain call_soon is safe here
+            for job in self._jobs:
+                loop.call_soon(self._arm_job, job)
+            loop.call_later(STATS_FLUSH_INTERVAL, self._flush_statistics_periodically)
+            self._loop = loop
         
-        self.scheduler_thread = threading.Thread(target=scheduler_loop, daemon=True)
+        self.scheduler_thread = threading.Thread(target=self._run_loop, args=(loop,), daemon=True)
         self.scheduler_thread.start()
         
         logger.info("Blog scheduler started")
@@ -541,11 +848,18 @@ class BlogScheduler:
         
         self.is_running = False
         
+        with self._jobs_lock:
+            loop, self._loop = self._loop, None
+            # Clear all scheduled jobs
+            self._jobs.clear()
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+        
         if self.scheduler_thread:
             self.scheduler_thread.join(timeout=5)
         
-        # Clear all scheduled jobs
-        schedule.clear()
+        self._flush_statistics()
+        self._compact_statistics()
         
         logger.info("Blog scheduler stopped")
     
@@ -554,18 +868,18 @@ class BlogScheduler:
         return {
             **self.stats,
             'is_running': self.is_running,
-            'scheduled_jobs': len(schedule.jobs),
+            'scheduled_jobs': len(self._jobs),
             'publishers_configured': len(self.publisher_manager.publishers)
         }
     
     def get_scheduled_jobs(self) -> List[Dict]:
         """Get list of scheduled jobs"""
         jobs = []
-        for job in schedule.jobs:
+        for job in self._jobs:
             jobs.append({
                 'next_run': job.next_run,
                 'job_func': str(job.job_func),
-                'interval': getattr(job, 'interval_unit', 'day')
+                'interval': job.unit
             })
         return jobs
     
@@ -583,13 +897,13 @@ class BlogScheduler:
             time_str = schedule_config.get('time', '09:00')
             
             if schedule_type == 'daily':
-                schedule.every().day.at(time_str).do(job_func)
+                self._add_job(_ScheduledJob(job_func, "days", time_str=time_str))
             elif schedule_type == 'weekly':
                 day = schedule_config.get('day', 'monday')
-                schedule.every().week.on(getattr(schedule.every(), day.lower())).do(job_func)
+                self._add_job(_ScheduledJob(job_func, "weeks", time_str=time_str, day_of_week=day))
             elif schedule_type == 'hours':
                 interval = schedule_config.get('interval', 1)
-                schedule.every(interval).hours.do(job_func)
+                self._add_job(_ScheduledJob(job_func, "hours", interval=interval))
             
             logger.info(f"Added custom job: {schedule_type} at {time_str}")
             
@@ -599,12 +913,15 @@ class BlogScheduler:
     
     def manual_blog_generation(self, topic: str, **kwargs) -> Dict:
         """Manually trigger blog generation"""
-        return self._generate_and_publish_blog(
-            topics=[topic],
-            max_words=kwargs.get('max_words', 800),
-            publish_immediately=kwargs.get('publish_immediately', False),
-            platforms=kwargs.get('platforms')
-        )
+        try:
+            return self._generate_and_publish_blog(
+                topics=[topic],
+                max_words=kwargs.get('max_words', 800),
+                publish_immediately=kwargs.get('publish_immediately', False),
+                platforms=kwargs.get('platforms')
+            )
+        finally:
+            self._flush_statistics()
     
     def manual_blog_series(self, main_topic: str, num_posts: int = 5, **kwargs) -> Dict:
         """Manually trigger blog series generation"""
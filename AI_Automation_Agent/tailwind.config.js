@@ -0,0 +1,8 @@
+/** Tailwind build for the complete_blog_automation_app.py dashboard */
+module.exports = {
+  content: ['./complete_blog_automation_app.py'],
+  theme: {
+    extend: {},
+  },
+  plugins: [],
+}
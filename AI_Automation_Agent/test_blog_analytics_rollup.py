@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Blog Analytics Rollup Test
+Checks that the daily rollup behind the performance summary stays in step with
+blog_analytics when engagement metrics are passed as None
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+def test_none_metrics_in_rollup():
+    """A metric passed as None adds nothing to the rollup instead of nulling it"""
+    from modules.blog_automation.blog_analytics import BlogAnalytics
+    
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        # BlogAnalytics keeps its database in the working directory
+        os.chdir(tmp)
+        try:
+            analytics = BlogAnalytics()
+            analytics.track_blog_post('post-1', 'First post', 'wordpress', 'https://example.com/1', {})
+            analytics.track_blog_post('post-2', 'Second post', 'wordpress', 'https://example.com/2', {})
+            analytics.update_engagement_metrics('post-1', 'wordpress', {'views': 100, 'engagement_rate': 2.0})
+            analytics.update_engagement_metrics('post-2', 'wordpress', {'views': 50, 'engagement_rate': 4.0})
+            
+            overall = analytics.get_blog_performance_summary()['overall_performance']
+            assert overall['total_views'] == 150
+            assert overall['average_engagement_rate'] == 3.0
+            
+            # Stored as NULL, so it drops out of the sums and averages like SUM() and AVG() would
+            analytics.update_engagement_metrics('post-1', 'wordpress', {'views': None, 'engagement_rate': None})
+            overall = analytics.get_blog_performance_summary()['overall_performance']
+            assert overall['total_views'] == 50
+            assert overall['average_engagement_rate'] == 4.0
+            
+            # The rollup cell must stay usable for later updates
+            analytics.update_engagement_metrics('post-1', 'wordpress', {'views': 30, 'engagement_rate': 1.0})
+            overall = analytics.get_blog_performance_summary()['overall_performance']
+            assert overall['total_views'] == 80
+            assert overall['average_engagement_rate'] == 2.5
+            
+            analytics.close()
+        finally:
+            os.chdir(cwd)
+
+def main():
+    print("=" * 60)
+    print("BLOG ANALYTICS ROLLUP TEST")
+    print("=" * 60)
+    
+    try:
+        test_none_metrics_in_rollup()
+        print("✅ ROLLUP TEST: PASSED")
+        return 0
+    except AssertionError as e:
+        print(f"❌ ROLLUP TEST: FAILED {e}")
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -65,6 +65,14 @@ class WebInterface:
             allow_headers=["*"],
         )
         
+        # Release the thread-local MySQL session once each request finishes
+        @self.app.middleware("http")
+        async def release_db_session(request: Request, call_next):
+            try:
+                return await call_next(request)
+            finally:
+                db_manager.remove_mysql_session()
+        
         # Setup static files and templates
         self._setup_static_files()
         
@@ -423,7 +431,7 @@ class WebInterface:
                 settings_data = {
                     "blog_automation": {
                         "frequency": settings.BLOG_FREQUENCY,
-                        "topics": settings.BLOG_TOPICS,
+                        "topics": sorted(settings.BLOG_TOPICS),
                         "max_length": settings.BLOG_MAX_LENGTH,
                         "publish_immediately": True
                     },